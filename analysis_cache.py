@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+from board import BOARD_SIZE, Board
+from monte_carlo import simulate_battles
+from solver import DEFAULT_MAX_STATES, solve_battle
+
+DEFAULT_CACHE_DIR = 'analysis_cache'
+
+# Part of every key - bump it when the game rules change so old results are never served
+CACHE_VERSION = 1
+
+
+def character_fingerprint(character):
+    """
+    Get everything about a character that changes the result of an analysis
+
+    Returns:
+        List of the name (which decides lap and yellow tile damage), dice, dice damage, max HP and yellow effect
+    """
+    return [character.name, [list(values) for values in character.dice_sets], list(character.dice_damage),
+            character.max_hp, character.yellow_tile_effect()]
+
+
+class AnalysisCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        """
+        On-disk cache of analysis results keyed by board fingerprints
+
+        Every result is a small JSON file named by the hash of its key, so
+        the cache survives between runs. It serves exact repeats: the same
+        board (see Board.fingerprint) analysed again with the same character
+        and settings, e.g. re-running a benchmark or the placement optimizer.
+
+        Args:
+            directory: Folder the result files are kept in (created on the first store)
+        """
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def _get_key(self, kind, fingerprint, params):
+        """Get the key text and the file it is stored in"""
+        key = json.dumps([CACHE_VERSION, kind, fingerprint, params], sort_keys=True, separators=(',', ':'))
+        name = hashlib.sha1(key.encode()).hexdigest()
+        return key, os.path.join(self.directory, f"{name}.json")
+
+    def get(self, kind, fingerprint, params):
+        """
+        Look up a result
+
+        Args:
+            kind: Analysis name (e.g., 'solve')
+            fingerprint: Board fingerprint
+            params: JSON-serializable analysis parameters (character, battles, seed, ...)
+
+        Returns:
+            Stored result, or None if there isn't one
+        """
+        key, path = self._get_key(kind, fingerprint, params)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+        # The key is stored too, so a hash collision is a miss rather than a wrong result
+        if entry is None or entry.get('key') != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry['result']
+
+    def store(self, kind, fingerprint, params, result):
+        """
+        Save a result
+
+        Args:
+            kind: Analysis name (e.g., 'solve')
+            fingerprint: Board fingerprint
+            params: JSON-serializable analysis parameters
+            result: JSON-serializable result
+        """
+        key, path = self._get_key(kind, fingerprint, params)
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first so a reader never sees half a result
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'key': key, 'result': result}, f)
+        os.replace(temp_path, path)
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups served from the cache (0 before the first lookup)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def solve_board(character, green_tiles, red_tiles, yellow_tiles, cache=None, max_states=DEFAULT_MAX_STATES,
+                board_size=BOARD_SIZE):
+    """
+    Exact win probability of a board under the optimal dice choice, from the cache when possible
+
+    Args:
+        character: Character instance with dice_sets, dice_damage and yellow effect set
+        green_tiles: List of green tile numbers
+        red_tiles: List of red tile numbers
+        yellow_tiles: List of yellow tile numbers
+        cache: AnalysisCache to read and fill (always solves if None)
+        max_states: Give up once more states than this are reachable
+        board_size: Number of tiles on the board
+
+    Returns:
+        Dictionary with win_probability, expected_turns and num_states, or None if the
+        battle has more than max_states states (not cached, so a larger max_states can retry)
+    """
+    board = Board(board_size, green_tiles, red_tiles, yellow_tiles, character.yellow_tile_effect())
+    fingerprint = board.fingerprint(character.dice_sets)
+    params = {'character': character_fingerprint(character)}
+    if cache is not None:
+        result = cache.get('solve', fingerprint, params)
+        if result is not None:
+            return result
+
+    try:
+        solved = solve_battle(character, green_tiles, red_tiles, yellow_tiles, max_states, board_size)
+    except RuntimeError:
+        return None
+    result = {
+        'win_probability': solved.win_probability,
+        'expected_turns': solved.expected_turns,
+        'num_states': solved.num_states
+    }
+    if cache is not None:
+        cache.store('solve', fingerprint, params, result)
+    return result
+
+
+def simulate_board(character, green_tiles, red_tiles, yellow_tiles, num_battles, seed, dice_weights=None,
+                   cache=None, board_size=BOARD_SIZE):
+    """
+    Simulate battles on a fixed board, from the cache when possible
+
+    Equivalent boards give identical results for the same seed (the dice
+    rolls don't depend on the board), so they share a cache entry. Runs
+    without a seed are random and never cached.
+
+    Args:
+        character: Character instance with dice_sets, dice_damage and yellow effect set
+        green_tiles: List of green tile numbers
+        red_tiles: List of red tile numbers
+        yellow_tiles: List of yellow tile numbers
+        num_battles: Number of battles to simulate
+        seed: Seed for the NumPy random generator (None disables the cache)
+        dice_weights: Probability of choosing each dice every turn (uniform if None)
+        cache: AnalysisCache to read and fill (always simulates if None)
+        board_size: Number of tiles on the board
+
+    Returns:
+        Dictionary with battles, wins, losses, win_rate and mean_turns
+    """
+    use_cache = cache is not None and seed is not None
+    if use_cache:
+        board = Board(board_size, green_tiles, red_tiles, yellow_tiles, character.yellow_tile_effect())
+        fingerprint = board.fingerprint(character.dice_sets)
+        params = {
+            'character': character_fingerprint(character),
+            'battles': num_battles,
+            'seed': seed,
+            'dice_weights': None if dice_weights is None else list(dice_weights)
+        }
+        result = cache.get('simulate', fingerprint, params)
+        if result is not None:
+            return result
+
+    results = simulate_battles(character, num_battles, dice_weights, green_tiles, red_tiles, yellow_tiles, seed=seed,
+                               board_size=board_size)
+    result = {
+        'battles': len(results),
+        'wins': int(results.wins.sum()),
+        'losses': int(results.losses.sum()),
+        'win_rate': results.win_rate(),
+        'mean_turns': results.mean_turns()
+    }
+    if use_cache:
+        cache.store('simulate', fingerprint, params, result)
+    return result
@@ -0,0 +1,112 @@
+import os
+import threading
+import pygame
+
+# Images live next to the code
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Tile and yellow tile option icons
+ICON_SIZE = (60, 60)
+ICON_FILES = ['fire.png', 'heal.png', 'lightning.png', 'poison.png', 'burn.png', 'lifesteal.png', 'chainlightning.png']
+
+
+class AssetManager:
+    def __init__(self, asset_dir=ASSET_DIR):
+        """
+        Load every image once and share it between screens
+
+        Scaled copies are cached per size and converted to the display's pixel
+        format, so blitting them needs no conversion. A missing file is
+        reported once and then remembered as missing.
+
+        Args:
+            asset_dir: Directory to load images from
+        """
+        self.asset_dir = asset_dir
+        self._originals = {}  # File name -> surface as loaded
+        self._images = {}  # (file name, size) -> scaled, display-format surface
+        self.missing = set()
+        self._lock = threading.Lock()
+
+    def get_image(self, name, size=None):
+        """
+        Get an image, loading and scaling it the first time it is needed
+
+        Args:
+            name: File name in the asset directory (e.g., 'poison.png')
+            size: (width, height) to scale to (original size if None)
+
+        Returns:
+            Surface, or None if the file is missing
+        """
+        key = (name, size)
+        image = self._images.get(key)
+        if image is not None:
+            return image
+
+        image = self._load(name)
+        if image is None:
+            return None
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+
+        # Display format surfaces can only be made once the window exists; until then don't cache
+        if pygame.display.get_surface() is None:
+            return image
+        image = image.convert_alpha()
+        self._images[key] = image
+        return image
+
+    def _load(self, name):
+        """Load an image file once (None if it is missing)"""
+        with self._lock:
+            if name in self._originals:
+                return self._originals[name]
+            if name in self.missing:
+                return None
+            try:
+                image = pygame.image.load(os.path.join(self.asset_dir, name))
+            except Exception as e:
+                print(f"Warning: {name} not found - {e}")
+                self.missing.add(name)
+                return None
+            self._originals[name] = image
+            return image
+
+    def preload(self, names=ICON_FILES, background=True):
+        """
+        Load image files ahead of time so screens don't wait on disk
+
+        Args:
+            names: File names to load
+            background: Load on a daemon thread instead of blocking
+
+        Returns:
+            The loading thread, or None if loaded in the foreground
+        """
+        def load_all():
+            for name in names:
+                self._load(name)
+
+        if not background:
+            load_all()
+            return None
+        thread = threading.Thread(target=load_all, name="asset-preload", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self):
+        """Drop every cached image (missing files are tried again)"""
+        with self._lock:
+            self._originals.clear()
+            self._images.clear()
+            self.missing.clear()
+
+
+# Shared by the battle renderer and the selection screens
+assets = AssetManager()
+
+
+def get_image(name, size=None):
+    """Get an image from the shared asset manager"""
+    return assets.get_image(name, size)
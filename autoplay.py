@@ -0,0 +1,223 @@
+import argparse
+import os
+import time
+
+# The bot runs headless - pick SDL's dummy drivers before pygame is initialized
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from battle_engine import DEBUFF_DAMAGE, GREEN_TILE_HEAL, MAX_BATTLE_TURNS, POISON_STACKS_APPLIED
+from board import TILE_GREEN, TILE_RED, TILE_YELLOW
+from game_random import GameRandom
+from main import Game, board_positions, dice_rects, positive_float, SQUARE_SIZE
+
+
+# ===== POLICIES =====
+# A policy takes the battle engine and the bot's random stream and returns the index of the dice to click
+def random_policy(engine, rng):
+    """Click any dice"""
+    return rng.randrange(len(engine.dice_options))
+
+
+def highest_damage_policy(engine, rng):
+    """Click the dice that deals the most damage on a normal tile"""
+    dice_damage = engine.character.dice_damage
+    return max(range(len(dice_damage)), key=lambda i: dice_damage[i])
+
+
+def greedy_policy(engine, rng):
+    """Click the dice with the best expected result for this turn only"""
+    character = engine.character
+    table = engine.landing_table
+    tile_types = engine.board.tile_types
+    player = engine.player
+    missing_hp = player.max_hp - player.current_hp
+
+    def score(dice_index, tile, laps):
+        # Boss damage dealt minus player HP lost, counting one turn of debuff ticks
+        value = character.get_lap_damage(player.laps_completed + 1) * laps
+        tile_type = tile_types[tile]
+        if tile_type == TILE_GREEN:
+            value += min(GREEN_TILE_HEAL, missing_hp) + player.debuff_stacks * DEBUFF_DAMAGE
+        elif tile_type == TILE_RED:
+            value -= DEBUFF_DAMAGE
+        elif tile_type == TILE_YELLOW:
+            value += character.get_yellow_tile_damage()
+            if engine.board.yellow_effect(tile) == "poison_5":
+                value += engine.boss.poison_stacks + POISON_STACKS_APPLIED
+        else:
+            value += character.dice_damage[dice_index] - engine.boss.current_damage
+        return value
+
+    def expected_score(dice_index):
+        outcomes = table.outcomes(dice_index, player.position, player.yellow_buff_active)
+        return sum(probability * score(dice_index, tile, laps) for tile, laps, probability in outcomes)
+
+    return max(range(len(engine.dice_options)), key=expected_score)
+
+
+POLICIES = {
+    'random': random_policy,
+    'greedy': greedy_policy,
+    'highest-damage': highest_damage_policy
+}
+
+
+def click(pos):
+    """Create a left mouse click event at a screen position"""
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+class AutoplayBot:
+    def __init__(self, policy, rng, character_name=None, max_turns=MAX_BATTLE_TURNS):
+        """
+        Play single-player games through the real screens by clicking like a player
+
+        Each frame the bot looks at the game's current screen and returns the
+        click a player would make there: start, a character, three dice and
+        confirm, a yellow tile option, empty tiles to place yellow tiles, then
+        the dice picked by the policy whenever a roll is allowed.
+
+        Args:
+            policy: Function taking (engine, rng) and returning a dice index
+            rng: GameRandom stream for the bot's own choices (character, dice, yellow tiles)
+            character_name: Character to pick every game (random each game if None)
+            max_turns: Roll random dice after this many turns - a fixed policy can circle
+                       between green tiles forever, and the real game has no turn limit
+        """
+        self.policy = policy
+        self.rng = rng
+        self.character_name = character_name
+        self.max_turns = max_turns
+        self.chosen_dice = None  # Dice keys picked for the current game
+        self.clicks = 0
+        self.stalled_games = 0  # Games that reached max_turns
+
+    def get_events(self, game):
+        """
+        Get the synthetic events for this frame
+
+        Args:
+            game: main.Game instance being played
+
+        Returns:
+            List of pygame events (empty while a token is moving)
+        """
+        pos = self.choose_click(game)
+        if pos is None:
+            return []
+        self.clicks += 1
+        return [click(pos)]
+
+    def choose_click(self, game):
+        """Get the screen position to click on the current screen, or None to wait"""
+        rng = self.rng
+        if game.game_state == "start":
+            self.chosen_dice = None
+            return game.start_menu.start_button.center
+
+        if game.game_state == "character_select":
+            buttons = game.character_select.character_buttons
+            if self.character_name is None:
+                return rng.choice(buttons)[0].center
+            for button_rect, character in buttons:
+                if character.name == self.character_name:
+                    return button_rect.center
+            return None
+
+        if game.game_state == "dice_select":
+            dice_select = game.dice_select
+            if self.chosen_dice is None:
+                self.chosen_dice = rng.sample(dice_select.dice_buttons, 3)
+            for button_rect, dice_key, _ in self.chosen_dice:
+                if dice_key not in dice_select.selected_dice:
+                    return button_rect.center
+            return dice_select.confirm_button.center
+
+        if game.game_state == "yellow_tile_select":
+            return rng.choice(game.yellow_tile_select.option_buttons)[0].center
+
+        if game.game_state == "battle" and not game.campaign_mode:
+            engine = game.battle_engine
+            if engine.turn.battle_phase == "place_yellow":
+                x, y = board_positions[rng.choice(engine.board.empty_tiles()) - 1]
+                return (x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2)
+            if engine.can_roll() and engine.winner is None:
+                if engine.turn.turns_taken == self.max_turns:
+                    self.stalled_games += 1
+                policy = self.policy if engine.turn.turns_taken < self.max_turns else random_policy
+                return dice_rects[policy(engine, rng)].center
+
+        return None
+
+
+def run_autoplay(num_games, policy='greedy', character_name=None, seed=None, turbo=True, steps_per_second=6,
+                 max_frames=None):
+    """
+    Play full single-player games through main.Game with an unlocked frame rate
+
+    Args:
+        num_games: Number of games to finish
+        policy: Name of a policy in POLICIES
+        character_name: Character to play (random each game if None)
+        seed: Seed for the game and the bot (random if None)
+        turbo: Resolve rolls instantly instead of animating them
+        steps_per_second: Animation speed when not in turbo mode
+        max_frames: Give up after this many frames (no limit if None)
+
+    Returns:
+        Dictionary with games, wins, average turns, frames, clicks, stalled games, seconds and games per minute
+    """
+    game_random = GameRandom(seed)
+    game = Game(game_random.spawn().seed_value, turbo, steps_per_second, max_fps=0, verbose=False, idle_wait=False)
+    bot = AutoplayBot(POLICIES[policy], game_random.spawn(), character_name)
+
+    start = time.perf_counter()
+    game.run(bot, max_frames, max_battles=num_games)
+    seconds = time.perf_counter() - start
+
+    results = game.battle_results
+    games = len(results)
+    return {
+        'seed': game_random.seed_value,
+        'games': games,
+        'wins': sum(1 for winner, _ in results if winner == "player"),
+        'average_turns': sum(turns for _, turns in results) / games if games else 0.0,
+        'frames': game.frames,
+        'clicks': bot.clicks,
+        'stalled_games': bot.stalled_games,
+        'seconds': seconds,
+        'games_per_minute': games * 60 / seconds if seconds > 0 else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play full games headless through the real game loop")
+    parser.add_argument('--games', type=int, default=100, help="games to finish")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='greedy')
+    parser.add_argument('--character', choices=['Lapper', 'Huntsman'], default=None,
+                        help="character to play (random each game if omitted)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--animate', action='store_true',
+                        help="move tokens tile by tile like the real game instead of turbo mode (much slower)")
+    parser.add_argument('--steps-per-second', type=positive_float, default=6,
+                        help="animation speed with --animate (default: 6)")
+    parser.add_argument('--max-frames', type=int, default=None, help="give up after this many frames")
+    args = parser.parse_args()
+
+    stats = run_autoplay(args.games, args.policy, args.character, args.seed, not args.animate, args.steps_per_second,
+                         args.max_frames)
+    pygame.quit()
+
+    games = stats['games']
+    print(f"Seed: {stats['seed']}")
+    print(f"Games: {games}/{args.games} ({args.policy} policy)")
+    if games:
+        print(f"Wins: {stats['wins']} ({stats['wins'] / games:.1%}), average {stats['average_turns']:.1f} turns")
+    print(f"Frames: {stats['frames']}, clicks: {stats['clicks']}, stalled games: {stats['stalled_games']}")
+    print(f"Time: {stats['seconds']:.1f}s ({stats['games_per_minute']:.0f} games/min)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+from battle_state import BossState, PlayerState, TurnState
+from game_random import GameRandom
+from board import BOARD_SIZE, TILE_GREEN, TILE_RED, TILE_YELLOW, generate_board
+from landing_table import get_landing_table, landing_tile, laps_crossed
+
+# ===== GAME SETTINGS =====
+LAP_BONUS_DAMAGE = 10
+NUM_GREEN_TILES = 5
+NUM_RED_TILES = 8
+DEBUFF_DAMAGE = 5
+GREEN_TILE_HEAL = 20
+BOSS_MAX_HP = 350
+BOSS_INITIAL_DAMAGE = 10
+BOSS_DAMAGE_INCREMENT = 1
+POISON_STACKS_APPLIED = 5
+BURN_STACKS_APPLIED = 3
+BURN_DAMAGE_PER_STACK = 3
+CHAIN_LIGHTNING_INITIAL_DAMAGE = 20
+CHAIN_LIGHTNING_DOT_DAMAGE = 10
+CHAIN_LIGHTNING_TURNS = 2
+MAX_BATTLE_TURNS = 1000
+
+
+class BattleEngine:
+    def __init__(self, character, green_tiles=None, red_tiles=None, yellow_tiles=None, board_size=BOARD_SIZE,
+                 rng=None):
+        """
+        Initialize a single-player battle against the boss
+
+        The engine owns all battle state and applies every rule of the game
+        without touching pygame, so it can be driven by the main loop one tile
+        at a time or resolved instantly for simulations.
+
+        Args:
+            character: Character instance with dice_sets, dice_damage and yellow effect set
+            green_tiles: List of green tile numbers (random if None)
+            red_tiles: List of red tile numbers (random if None)
+            yellow_tiles: List of yellow tile numbers already placed (placement phase if None)
+            board_size: Number of tiles on the board
+            rng: GameRandom stream for the board and dice rolls (new random seed if None)
+        """
+        self.character = character
+        self.board_size = board_size
+        self.rng = rng if rng is not None else GameRandom()
+        self.reset(green_tiles, red_tiles, yellow_tiles)
+
+    def reset(self, green_tiles=None, red_tiles=None, yellow_tiles=None):
+        """Reset battle state for a new battle"""
+        character = self.character
+
+        self.player = PlayerState(character)
+        self.boss = BossState(BOSS_MAX_HP, BOSS_INITIAL_DAMAGE)
+        # Yellow tiles are placed by the player before rolling starts
+        self.turn = TurnState(character.num_yellow_tiles)
+
+        # Dice come from the character (possibly replaced by DiceSelect)
+        self.dice_labels = character.dice_labels
+        self.dice_options = character.dice_sets
+        self.landing_table = get_landing_table(self.dice_options, self.board_size, self.dice_labels)
+
+        # Generate random green tiles first, then red tiles (2 per side, excluding green)
+        self.board = generate_board(NUM_GREEN_TILES, NUM_RED_TILES, self.board_size, green_tiles, red_tiles,
+                                    self.rng)
+        for tile in yellow_tiles or []:
+            self.place_yellow_tile(tile)
+
+    @property
+    def green_tiles(self):
+        """List of green tile numbers"""
+        return self.board.green_tiles
+
+    @property
+    def red_tiles(self):
+        """List of red tile numbers"""
+        return self.board.red_tiles
+
+    @property
+    def yellow_tiles(self):
+        """List of yellow tile numbers in placement order"""
+        return self.board.yellow_tiles
+
+    # ===== YELLOW TILE PLACEMENT =====
+    def is_empty_tile(self, tile_number):
+        """Check if a tile is not green, red or already yellow"""
+        return self.board.is_empty(tile_number)
+
+    def place_yellow_tile(self, tile_number):
+        """
+        Place one of the player's yellow tiles
+
+        Args:
+            tile_number: Tile number (1-24) to place the yellow tile on
+
+        Returns:
+            True if the tile was placed, False if the tile is not empty or placement is over
+        """
+        if self.turn.battle_phase != "place_yellow":
+            return False
+        if not self.board.place_yellow(tile_number, self.character.yellow_tile_effect()):
+            return False
+
+        self.turn.yellow_tiles_placed += 1
+
+        # Move to rolling phase once all yellow tiles are placed
+        if self.turn.yellow_tiles_placed >= self.turn.yellow_tiles_to_place:
+            self.turn.battle_phase = "rolling"
+        return True
+
+    def place_random_yellow_tiles(self):
+        """Place all remaining yellow tiles on random empty tiles"""
+        empty_tiles = self.board.empty_tiles()
+        remaining = self.turn.yellow_tiles_to_place - self.turn.yellow_tiles_placed
+        for tile in self.rng.sample(empty_tiles, min(remaining, len(empty_tiles))):
+            self.place_yellow_tile(tile)
+        # Not enough empty tiles left - start rolling with what was placed
+        self.turn.battle_phase = "rolling"
+
+    # ===== ROLLING AND MOVEMENT =====
+    def can_roll(self):
+        """Check if the player may click a dice right now"""
+        return self.turn.battle_phase == "rolling" and not self.player.is_moving
+
+    def get_possible_landing_tiles(self, dice_index):
+        """Get the tile numbers player can land on for a given dice"""
+        if dice_index is None:
+            return []
+        return self.landing_table.tiles(dice_index, self.player.position, self.player.yellow_buff_active)
+
+    def get_landing_probabilities(self, dice_index):
+        """Get a dictionary of landing tile -> probability for a given dice"""
+        if dice_index is None:
+            return {}
+        return self.landing_table.tile_probabilities(dice_index, self.player.position, self.player.yellow_buff_active)
+
+    def describe_landing(self, dice_index):
+        """Describe where a dice can land, e.g. "Risk: 50% tile 23, 50% tile 9" """
+        if dice_index is None:
+            return ""
+        return self.landing_table.describe(dice_index, self.player.position, self.player.yellow_buff_active)
+
+    def roll(self, dice_index, value=None):
+        """
+        Roll a dice and start moving, applying start-of-turn effects
+
+        Args:
+            dice_index: Index (0-2) of the dice that was clicked
+            value: Face to use instead of rolling (for trying each outcome in a lookahead)
+
+        Returns:
+            The rolled dice value
+        """
+        player = self.player
+        if value is None:
+            value = self.rng.choice(self.dice_options[dice_index])
+        player.dice_values[dice_index] = value
+        player.moves_remaining = value * 2 if player.yellow_buff_active else value
+        player.is_moving = True
+        player.landed_on_green = False
+        player.current_dice_damage = self.character.dice_damage[dice_index]
+        player.yellow_buff_active = False
+        self.turn.turns_taken += 1
+
+        self._apply_turn_start_effects()
+        return value
+
+    def _apply_turn_start_effects(self):
+        """Apply debuff damage to the player and damage-over-time effects to the boss"""
+        player = self.player
+        boss = self.boss
+        if player.debuff_stacks > 0:
+            player.current_hp -= DEBUFF_DAMAGE * player.debuff_stacks
+
+        # Poison ticks down by one stack per turn
+        if boss.poison_stacks > 0:
+            boss.current_hp -= boss.poison_stacks
+            boss.poison_stacks -= 1
+
+        # Burn doesn't decay
+        if boss.burn_stacks > 0:
+            boss.current_hp -= boss.burn_stacks * BURN_DAMAGE_PER_STACK
+
+        if boss.chain_lightning_stacks > 0:
+            boss.current_hp -= CHAIN_LIGHTNING_DOT_DAMAGE
+            boss.chain_lightning_stacks -= 1
+
+    def step(self):
+        """
+        Move the player a single tile in the direction of the roll
+
+        Resolves the landing tile once movement is complete.
+
+        Returns:
+            True if the player is still moving, False otherwise
+        """
+        player = self.player
+        if not player.is_moving:
+            return False
+
+        old_position = player.position
+        board_size = self.board.size
+
+        # Determine direction of movement
+        if player.moves_remaining > 0:
+            player.position += 1
+            player.moves_remaining -= 1
+        elif player.moves_remaining < 0:
+            player.position -= 1
+            player.moves_remaining += 1
+
+        # Check if completed a lap (going forward past the last tile)
+        if old_position == board_size and player.position > board_size:
+            self._complete_lap()
+
+        # Handle wrapping around the board
+        if player.position > board_size:
+            player.position = 1
+        elif player.position < 1:
+            player.position = board_size
+
+        if player.moves_remaining == 0:
+            player.is_moving = False
+            self._resolve_landing()
+        return player.is_moving
+
+    def resolve_turn(self):
+        """Finish the current movement instantly and resolve the landing tile"""
+        player = self.player
+        if not player.is_moving:
+            return
+
+        moves = player.moves_remaining
+        for _ in range(laps_crossed(player.position, moves, self.board.size)):
+            self._complete_lap()
+        player.position = landing_tile(player.position, moves, self.board.size)
+        player.moves_remaining = 0
+        player.is_moving = False
+        self._resolve_landing()
+
+    def play_turn(self, dice_index, value=None):
+        """
+        Roll a dice and resolve the whole turn instantly
+
+        Args:
+            dice_index: Index (0-2) of the dice to roll
+            value: Face to use instead of rolling
+
+        Returns:
+            The rolled dice value
+        """
+        value = self.roll(dice_index, value)
+        self.resolve_turn()
+        return value
+
+    def _complete_lap(self):
+        """Count a lap and deal the character's lap damage"""
+        self.player.laps_completed += 1
+        self.boss.current_hp -= self.character.get_lap_damage(self.player.laps_completed)
+
+    def _resolve_landing(self):
+        """Apply the effect of the tile the player landed on"""
+        player = self.player
+        boss = self.boss
+        position = player.position
+        tile_type = self.board.tile_types[position]
+
+        if tile_type == TILE_GREEN:
+            # Heal player for fixed amount and remove all debuff stacks
+            player.current_hp = min(player.max_hp, player.current_hp + GREEN_TILE_HEAL)
+            player.landed_on_green = True
+            player.debuff_stacks = 0
+        elif tile_type == TILE_RED:
+            # Add a debuff stack - NO damage to or from boss
+            player.debuff_stacks += 1
+        elif tile_type == TILE_YELLOW:
+            # Huntsman's yellow tile damage first, then the tile's effect
+            boss.current_hp -= self.character.get_yellow_tile_damage()
+
+            effect = self.board.yellow_effect(position)
+            if effect == "double_movement":
+                player.yellow_buff_active = True
+            elif effect == "poison_5":
+                # Add poison stacks and deal immediate poison damage
+                boss.poison_stacks += POISON_STACKS_APPLIED
+                boss.current_hp -= boss.poison_stacks
+            elif effect == "burning_strike":
+                boss.burn_stacks += BURN_STACKS_APPLIED
+            elif effect == "lifesteal":
+                player.lifesteal_active = True
+            elif effect == "chain_lightning":
+                # Deal immediate damage and set up DoT
+                boss.current_hp -= CHAIN_LIGHTNING_INITIAL_DAMAGE
+                boss.chain_lightning_stacks = CHAIN_LIGHTNING_TURNS
+        else:
+            # Normal tile - damage boss using dice damage and take boss damage
+            damage_dealt = player.current_dice_damage
+            boss.current_hp -= damage_dealt
+
+            # Lifesteal effect - heal for damage dealt
+            if player.lifesteal_active:
+                player.current_hp = min(player.max_hp, player.current_hp + damage_dealt)
+                player.lifesteal_active = False
+
+            player.current_hp -= boss.current_damage
+            boss.attack_count += 1
+            boss.current_damage = BOSS_INITIAL_DAMAGE + (boss.attack_count * BOSS_DAMAGE_INCREMENT)
+
+    # ===== SNAPSHOTS =====
+    def snapshot(self):
+        """
+        Save the battle state so moves can be tried and rolled back
+
+        Only the values that change during a battle are copied into flat
+        tuples - the character, its dice lists and the landing table are
+        shared, and the rng is not saved.
+
+        Returns:
+            Snapshot to pass to restore()
+        """
+        return self.player.pack(), self.boss.pack(), self.turn.pack(), self.board.pack()
+
+    def restore(self, snapshot):
+        """
+        Put the battle back into the state of a snapshot()
+
+        Args:
+            snapshot: Snapshot taken from this engine
+        """
+        player, boss, turn, board = snapshot
+        self.player.unpack(player)
+        self.boss.unpack(boss)
+        self.turn.unpack(turn)
+        self.board.unpack(board)
+
+    # ===== BATTLE RESULT =====
+    @property
+    def winner(self):
+        """'player' if the boss is defeated, 'boss' if the player died, None while the battle goes on"""
+        if self.player.is_moving:
+            return None
+        if self.boss.current_hp <= 0:
+            return "player"
+        if self.player.current_hp <= 0:
+            return "boss"
+        return None
+
+    def is_over(self):
+        """Check if the battle has been decided"""
+        return self.winner is not None
+
+    def play_battle(self, policy=None, max_turns=MAX_BATTLE_TURNS):
+        """
+        Play the rest of the battle instantly
+
+        Args:
+            policy: Function taking the engine and returning a dice index (random dice if None)
+            max_turns: Give up after this many turns
+
+        Returns:
+            'player', 'boss', or None if max_turns was reached
+        """
+        if self.turn.battle_phase == "place_yellow":
+            self.place_random_yellow_tiles()
+        num_dice = len(self.dice_options)
+
+        while self.winner is None and self.turn.turns_taken < max_turns:
+            dice_index = policy(self) if policy else self.rng.randrange(num_dice)
+            self.play_turn(dice_index)
+        return self.winner
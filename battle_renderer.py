@@ -1,9 +1,11 @@
 import pygame
-import os
+from assets import ICON_SIZE, get_image
+from board import TILE_EMPTY, TILE_GREEN, TILE_RED, TILE_YELLOW
+from text_cache import render_text
 
 
 class BattleRenderer:
-    def __init__(self, screen_width, screen_height, colors, fonts, constants):
+    def __init__(self, screen_width, screen_height, colors, fonts, constants, dirty_rects=False):
         """
         Initialize the battle renderer
 
@@ -13,6 +15,7 @@ class BattleRenderer:
             colors: Dictionary of color constants
             fonts: Dictionary of font objects
             constants: Dictionary of game constants (SQUARE_SIZE, BOARD_MARGIN, etc.)
+            dirty_rects: Only redraw and report the regions that changed since the last frame
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -20,108 +23,123 @@ class BattleRenderer:
         self.fonts = fonts
         self.constants = constants
 
-        # Get the directory where this script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # Load and scale tile icons
-        icon_size = (60, 60)  # Adjust size as needed
-
-        # Load yellow tile icons (character-specific)
-        try:
-            poison_path = os.path.join(script_dir, 'poison.png')
-            self.poison_icon = pygame.image.load(poison_path)
-            self.poison_icon = pygame.transform.scale(self.poison_icon, icon_size)
-        except Exception as e:
-            print(f"Warning: poison.png not found - {e}")
-            self.poison_icon = None
-
-        try:
-            lightning_path = os.path.join(script_dir, 'lightning.png')
-            self.lightning_icon = pygame.image.load(lightning_path)
-            self.lightning_icon = pygame.transform.scale(self.lightning_icon, icon_size)
-        except Exception as e:
-            print(f"Warning: lightning.png not found - {e}")
-            self.lightning_icon = None
-
-        # Load red tile icon
-        try:
-            fire_path = os.path.join(script_dir, 'fire.png')
-            self.fire_icon = pygame.image.load(fire_path)
-            self.fire_icon = pygame.transform.scale(self.fire_icon, icon_size)
-        except Exception as e:
-            print(f"Warning: fire.png not found - {e}")
-            self.fire_icon = None
-
-        # Load green tile icon
-        try:
-            heal_path = os.path.join(script_dir, 'heal.png')
-            self.heal_icon = pygame.image.load(heal_path)
-            self.heal_icon = pygame.transform.scale(self.heal_icon, icon_size)
-        except Exception as e:
-            print(f"Warning: heal.png not found - {e}")
-            self.heal_icon = None
-
-    def draw_board(self, screen, board_positions, green_tiles, red_tiles, yellow_tiles, highlighted_tiles, character,
-                   yellow_tile_effects=None):
-        """Draw the game board with tiles"""
-        for i, (x, y) in enumerate(board_positions):
-            tile_number = i + 1  # Tiles numbered 1-24
+        # Dirty-rect mode state (element keys and rects of the last frame drawn)
+        self.dirty_rects = dirty_rects
+        self.last_element_keys = None
+        self.last_areas = {}
 
-            # Determine tile color (priority: red > green > yellow > white)
-            if tile_number in red_tiles:
-                tile_color = self.colors['DARK_RED']
-            elif tile_number in green_tiles:
-                tile_color = self.colors['GREEN']
-            elif tile_number in yellow_tiles:
-                tile_color = self.colors['YELLOW']
-            else:
-                tile_color = self.colors['WHITE']
+        # Pre-rendered board, rebuilt when the board layout changes
+        self.board_layer = None
+        self.board_layer_key = None
 
-            # Draw square
-            pygame.draw.rect(screen, tile_color, (x, y, self.constants['SQUARE_SIZE'],
-                                                  self.constants['SQUARE_SIZE']))
+    def draw_board(self, screen, board_positions, board, highlighted_tiles, landing_probabilities=None,
+                   hint_tiles=()):
+        """Draw the game board with landing chances on highlighted tiles and hinted tiles, returning the board rect"""
+        square_size = self.constants['SQUARE_SIZE']
+
+        # Tiles, numbers and icons come from the cached layer, only highlights are drawn every frame
+        layer, layer_pos = self.get_board_layer(screen, board_positions, board)
+        area = screen.blit(layer, layer_pos)
+
+        # Suggested yellow tile placement
+        for tile_number in hint_tiles:
+            x, y = board_positions[tile_number - 1]
+            pygame.draw.rect(screen, self.colors['DARK_YELLOW'], (x, y, square_size, square_size), 5)
+
+        for tile_number in highlighted_tiles:
+            x, y = board_positions[tile_number - 1]
 
             # Draw red outline if this tile is a possible landing spot
-            if tile_number in highlighted_tiles:
-                pygame.draw.rect(screen, self.colors['RED'],
-                                 (x, y, self.constants['SQUARE_SIZE'], self.constants['SQUARE_SIZE']), 5)
-            else:
-                pygame.draw.rect(screen, self.colors['BLACK'],
-                                 (x, y, self.constants['SQUARE_SIZE'], self.constants['SQUARE_SIZE']), 2)
+            pygame.draw.rect(screen, self.colors['RED'], (x, y, square_size, square_size), 5)
+
+            # Draw landing chance in the bottom corner of highlighted tiles
+            if landing_probabilities and tile_number in landing_probabilities:
+                chance_text = render_text(self.fonts['small'], f"{landing_probabilities[tile_number]:.0%}", True,
+                                          self.colors['RED'])
+                chance_rect = chance_text.get_rect(bottomright=(x + square_size - 6, y + square_size - 4))
+                screen.blit(chance_text, chance_rect)
+
+        return area
+
+    def get_board_layer(self, screen, board_positions, board):
+        """
+        Get the pre-rendered board (tiles, borders, numbers and icons)
+
+        The layer is keyed by the board layout, so it is only redrawn when a
+        yellow tile is placed or a new battle starts with a different board.
+
+        Args:
+            screen: Pygame screen surface the layer will be blitted to
+            board_positions: List of (x, y) tile positions
+            board: Board instance
+
+        Returns:
+            Tuple of (surface, (x, y) position to blit it at)
+        """
+        key = (bytes(board.tile_types), bytes(board.yellow_effects), id(board_positions))
+        if self.board_layer is None or self.board_layer_key != key:
+            self.board_layer = self._render_board_layer(screen, board_positions, board)
+            self.board_layer_key = key
+        return self.board_layer
+
+    def invalidate_board_layer(self):
+        """Force the board layer to be redrawn next frame (e.g., after changing icons or colors)"""
+        self.board_layer = None
+        self.board_layer_key = None
+
+    def _render_board_layer(self, screen, board_positions, board):
+        """Draw every tile into an off-screen surface covering just the board"""
+        square_size = self.constants['SQUARE_SIZE']
+        tile_colors = {
+            TILE_EMPTY: self.colors['WHITE'],
+            TILE_GREEN: self.colors['GREEN'],
+            TILE_RED: self.colors['DARK_RED'],
+            TILE_YELLOW: self.colors['YELLOW']
+        }
+        tile_icons = {TILE_GREEN: get_image('heal.png', ICON_SIZE), TILE_RED: get_image('fire.png', ICON_SIZE)}
+        yellow_icons = {'poison_5': get_image('poison.png', ICON_SIZE),
+                        'double_movement': get_image('lightning.png', ICON_SIZE)}
+
+        left = min(x for x, _ in board_positions)
+        top = min(y for _, y in board_positions)
+        width = max(x for x, _ in board_positions) + square_size - left
+        height = max(y for _, y in board_positions) + square_size - top
+
+        # Same pixel format as the screen so the blit doesn't need converting
+        layer = pygame.Surface((width, height), 0, screen)
+        layer.fill(self.colors['WHITE'])
+
+        tile_types = board.tile_types
+        for i, (x, y) in enumerate(board_positions):
+            tile_number = i + 1  # Tiles numbered 1-24
+            tile_type = tile_types[tile_number]
+            x -= left
+            y -= top
+
+            # Draw square
+            pygame.draw.rect(layer, tile_colors[tile_type], (x, y, square_size, square_size))
+            pygame.draw.rect(layer, self.colors['BLACK'], (x, y, square_size, square_size), 2)
 
             # Draw square number
-            text = self.fonts['small'].render(str(tile_number), True, self.colors['BLACK'])
-            screen.blit(text, (x + 5, y + 5))
-
-            # Draw icons for special tiles
-            icon = None
-            if tile_number in yellow_tiles:
-                # Check yellow_tile_effects to determine which icon
-                if yellow_tile_effects and tile_number in yellow_tile_effects:
-                    effect = yellow_tile_effects[tile_number]
-                    if effect == "poison_5" and self.poison_icon:
-                        icon = self.poison_icon
-                    elif effect == "double_movement" and self.lightning_icon:
-                        icon = self.lightning_icon
-                else:
-                    # Fallback to character's default icon
-                    if character and character.yellow_icon == "poison.png" and self.poison_icon:
-                        icon = self.poison_icon
-                    elif character and character.yellow_icon == "lightning.png" and self.lightning_icon:
-                        icon = self.lightning_icon
-            elif tile_number in red_tiles and self.fire_icon:
-                icon = self.fire_icon
-            elif tile_number in green_tiles and self.heal_icon:
-                icon = self.heal_icon
+            text = render_text(self.fonts['small'], str(tile_number), True, self.colors['BLACK'])
+            layer.blit(text, (x + 5, y + 5))
+
+            # Draw icons for special tiles (yellow tiles show their own effect)
+            if tile_type == TILE_YELLOW:
+                icon = yellow_icons.get(board.yellow_effect(tile_number))
+            else:
+                icon = tile_icons.get(tile_type)
 
             # Center the icon in the tile
             if icon:
-                icon_rect = icon.get_rect(center=(x + self.constants['SQUARE_SIZE'] // 2,
-                                                  y + self.constants['SQUARE_SIZE'] // 2))
-                screen.blit(icon, icon_rect)
+                icon_rect = icon.get_rect(center=(x + square_size // 2, y + square_size // 2))
+                layer.blit(icon, icon_rect)
+
+        return layer, (left, top)
 
     def draw_player(self, screen, position, board_positions, current_hp, max_hp, player_color=None):
         """Draw player token with HP bar"""
+        area = []  # Rects of everything drawn
         x, y = board_positions[position - 1]  # Adjust for 1-indexed
         center_x = x + self.constants['SQUARE_SIZE'] // 2
         center_y = y + self.constants['SQUARE_SIZE'] // 2
@@ -131,8 +149,8 @@ class BattleRenderer:
             player_color = self.colors['RED']
 
         # Draw player circle
-        pygame.draw.circle(screen, player_color, (center_x, center_y), 20)
-        pygame.draw.circle(screen, self.colors['BLACK'], (center_x, center_y), 20, 3)
+        area.append(pygame.draw.circle(screen, player_color, (center_x, center_y), 20))
+        area.append(pygame.draw.circle(screen, self.colors['BLACK'], (center_x, center_y), 20, 3))
 
         # Draw player HP bar above player
         bar_width = 50
@@ -141,18 +159,21 @@ class BattleRenderer:
         bar_y = center_y - 35
 
         # Background
-        pygame.draw.rect(screen, self.colors['LIGHT_GRAY'], (bar_x, bar_y, bar_width, bar_height))
+        area.append(pygame.draw.rect(screen, self.colors['LIGHT_GRAY'], (bar_x, bar_y, bar_width, bar_height)))
 
         # Current HP
         hp_percentage = max(0, current_hp / max_hp)
         current_bar_width = int(bar_width * hp_percentage)
-        pygame.draw.rect(screen, self.colors['DARK_GREEN'], (bar_x, bar_y, current_bar_width, bar_height))
+        area.append(pygame.draw.rect(screen, self.colors['DARK_GREEN'], (bar_x, bar_y, current_bar_width, bar_height)))
 
         # Border
-        pygame.draw.rect(screen, self.colors['BLACK'], (bar_x, bar_y, bar_width, bar_height), 1)
+        area.append(pygame.draw.rect(screen, self.colors['BLACK'], (bar_x, bar_y, bar_width, bar_height), 1))
+
+        return area[0].unionall(area[1:])
 
     def draw_boss(self, screen, current_hp, max_hp):
         """Draw boss with HP bar in center of board"""
+        area = []  # Rects of everything drawn
         # Position boss in center of the board
         board_center_x = 200 + 50 + (7 * 100) // 2  # offset_x + margin + (board_width / 2)
         board_center_y = 50 + 50 + (7 * 100) // 2  # offset_y + margin + (board_height / 2)
@@ -161,8 +182,8 @@ class BattleRenderer:
         boss_y = board_center_y - 100  # 100px above center
 
         # Draw boss (larger circle)
-        pygame.draw.circle(screen, self.colors['DARK_RED'], (boss_x, boss_y), 40)
-        pygame.draw.circle(screen, self.colors['BLACK'], (boss_x, boss_y), 40, 4)
+        area.append(pygame.draw.circle(screen, self.colors['DARK_RED'], (boss_x, boss_y), 40))
+        area.append(pygame.draw.circle(screen, self.colors['BLACK'], (boss_x, boss_y), 40, 4))
 
         # Draw boss HP bar
         bar_width = 200
@@ -171,28 +192,31 @@ class BattleRenderer:
         bar_y = boss_y + 60
 
         # Background
-        pygame.draw.rect(screen, self.colors['LIGHT_GRAY'], (bar_x, bar_y, bar_width, bar_height))
+        area.append(pygame.draw.rect(screen, self.colors['LIGHT_GRAY'], (bar_x, bar_y, bar_width, bar_height)))
 
         # Current HP
         hp_percentage = max(0, current_hp / max_hp)
         current_bar_width = int(bar_width * hp_percentage)
-        pygame.draw.rect(screen, self.colors['DARK_RED'], (bar_x, bar_y, current_bar_width, bar_height))
+        area.append(pygame.draw.rect(screen, self.colors['DARK_RED'], (bar_x, bar_y, current_bar_width, bar_height)))
 
         # Border
-        pygame.draw.rect(screen, self.colors['BLACK'], (bar_x, bar_y, bar_width, bar_height), 3)
+        area.append(pygame.draw.rect(screen, self.colors['BLACK'], (bar_x, bar_y, bar_width, bar_height), 3))
 
         # HP text
-        hp_text = self.fonts['small'].render(f"{max(0, current_hp)}/{max_hp}", True, self.colors['BLACK'])
+        hp_text = render_text(self.fonts['small'], f"{max(0, current_hp)}/{max_hp}", True, self.colors['BLACK'])
         text_rect = hp_text.get_rect(center=(boss_x, bar_y + bar_height // 2))
-        screen.blit(hp_text, text_rect)
+        area.append(screen.blit(hp_text, text_rect))
 
         # Boss label
-        boss_label = self.fonts['medium'].render("BOSS", True, self.colors['BLACK'])
+        boss_label = render_text(self.fonts['medium'], "BOSS", True, self.colors['BLACK'])
         label_rect = boss_label.get_rect(center=(boss_x, boss_y - 60))
-        screen.blit(boss_label, label_rect)
+        area.append(screen.blit(boss_label, label_rect))
+
+        return area[0].unionall(area[1:])
 
     def draw_dice(self, screen, dice_rects, dice_colors, dice_values, dice_labels):
         """Draw all three dice with labels - positioned in center of board"""
+        area = []  # Rects of everything drawn
         # Position dice in center of the board
         board_center_x = 200 + 50 + (7 * 100) // 2  # offset_x + margin + (board_width / 2)
         board_center_y = 50 + 50 + (7 * 100) // 2  # offset_y + margin + (board_height / 2)
@@ -206,21 +230,24 @@ class BattleRenderer:
             rect = pygame.Rect(x, dice_y, 100, 100)
 
             # Draw label above dice
-            label_text = self.fonts['small'].render(label, True, self.colors['BLACK'])
+            label_text = render_text(self.fonts['small'], label, True, self.colors['BLACK'])
             label_rect = label_text.get_rect(center=(rect.centerx, rect.top - 15))
-            screen.blit(label_text, label_rect)
+            area.append(screen.blit(label_text, label_rect))
 
             # Draw dice
-            pygame.draw.rect(screen, colors[0], rect, border_radius=15)
-            pygame.draw.rect(screen, colors[1], rect, width=4, border_radius=15)
+            area.append(pygame.draw.rect(screen, colors[0], rect, border_radius=15))
+            area.append(pygame.draw.rect(screen, colors[1], rect, width=4, border_radius=15))
 
             # Draw dice value
-            text = self.fonts['large'].render(str(value), True, self.colors['WHITE'])
+            text = render_text(self.fonts['large'], str(value), True, self.colors['WHITE'])
             text_rect = text.get_rect(center=rect.center)
-            screen.blit(text, text_rect)
+            area.append(screen.blit(text, text_rect))
+
+        return area[0].unionall(area[1:])
 
     def draw_campaign_dice(self, screen, character_1_state, character_2_state, turn_phase):
         """Draw dice for both characters in campaign mode"""
+        area = []  # Rects of everything drawn
         # Position calculations
         board_center_x = 200 + 50 + (7 * 100) // 2
         board_center_y = 50 + 50 + (7 * 100) // 2
@@ -231,22 +258,24 @@ class BattleRenderer:
         char_1_label_y = dice_y - 50
 
         # Draw character 1 label
-        char_1_label = self.fonts['medium'].render(
-            character_1_state['character_obj'].name,
+        char_1_label = render_text(
+            self.fonts['medium'],
+            character_1_state.character.name,
             True,
             self.colors['BLACK']
         )
         label_rect = char_1_label.get_rect(center=(char_1_start_x + 180, char_1_label_y))
-        screen.blit(char_1_label, label_rect)
+        area.append(screen.blit(char_1_label, label_rect))
 
         # Draw character 1 HP
-        hp_text = self.fonts['small'].render(
-            f"HP: {character_1_state['current_hp']}/{character_1_state['max_hp']}",
+        hp_text = render_text(
+            self.fonts['small'],
+            f"HP: {character_1_state.current_hp}/{character_1_state.max_hp}",
             True,
             self.colors['BLACK']
         )
         hp_rect = hp_text.get_rect(center=(char_1_start_x + 180, char_1_label_y + 25))
-        screen.blit(hp_text, hp_rect)
+        area.append(screen.blit(hp_text, hp_rect))
 
         # Determine if character 1 dice should be highlighted
         char_1_active = (turn_phase == "choose_first" or turn_phase == "character_1_second")
@@ -259,50 +288,52 @@ class BattleRenderer:
             # Highlight if active
             if char_1_active:
                 # Draw glow effect
-                pygame.draw.rect(screen, self.colors['YELLOW'],
-                                 (x - 5, dice_y - 5, 110, 110),
-                                 border_radius=15)
+                area.append(pygame.draw.rect(screen, self.colors['YELLOW'],
+                                             (x - 5, dice_y - 5, 110, 110),
+                                             border_radius=15))
 
             # Draw dice label
-            label = character_1_state['dice_labels'][i]
-            label_text = self.fonts['small'].render(label, True, self.colors['BLACK'])
+            label = character_1_state.character.dice_labels[i]
+            label_text = render_text(self.fonts['small'], label, True, self.colors['BLACK'])
             label_rect = label_text.get_rect(center=(rect.centerx, rect.top - 15))
-            screen.blit(label_text, label_rect)
+            area.append(screen.blit(label_text, label_rect))
 
             # Draw dice
             dice_color = self.colors['BLUE'] if i == 0 else (self.colors['PURPLE'] if i == 1 else self.colors['ORANGE'])
             dice_border = self.colors['DARK_BLUE'] if i == 0 else (
                 self.colors['DARK_PURPLE'] if i == 1 else self.colors['DARK_ORANGE'])
-            pygame.draw.rect(screen, dice_color, rect, border_radius=15)
-            pygame.draw.rect(screen, dice_border, rect, width=4, border_radius=15)
+            area.append(pygame.draw.rect(screen, dice_color, rect, border_radius=15))
+            area.append(pygame.draw.rect(screen, dice_border, rect, width=4, border_radius=15))
 
             # Draw dice value
-            value = character_1_state['dice_values'][i]
-            value_text = self.fonts['large'].render(str(value), True, self.colors['WHITE'])
+            value = character_1_state.dice_values[i]
+            value_text = render_text(self.fonts['large'], str(value), True, self.colors['WHITE'])
             value_rect = value_text.get_rect(center=rect.center)
-            screen.blit(value_text, value_rect)
+            area.append(screen.blit(value_text, value_rect))
 
         # Character 2 dice (right side)
         char_2_start_x = board_center_x + 40
         char_2_label_y = dice_y - 50
 
         # Draw character 2 label
-        char_2_label = self.fonts['medium'].render(
-            character_2_state['character_obj'].name,
+        char_2_label = render_text(
+            self.fonts['medium'],
+            character_2_state.character.name,
             True,
             self.colors['BLACK']
         )
         label_rect = char_2_label.get_rect(center=(char_2_start_x + 180, char_2_label_y))
-        screen.blit(char_2_label, label_rect)
+        area.append(screen.blit(char_2_label, label_rect))
 
         # Draw character 2 HP
-        hp_text = self.fonts['small'].render(
-            f"HP: {character_2_state['current_hp']}/{character_2_state['max_hp']}",
+        hp_text = render_text(
+            self.fonts['small'],
+            f"HP: {character_2_state.current_hp}/{character_2_state.max_hp}",
             True,
             self.colors['BLACK']
         )
         hp_rect = hp_text.get_rect(center=(char_2_start_x + 180, char_2_label_y + 25))
-        screen.blit(hp_text, hp_rect)
+        area.append(screen.blit(hp_text, hp_rect))
 
         # Determine if character 2 dice should be highlighted
         char_2_active = (turn_phase == "choose_first" or turn_phase == "character_2_second")
@@ -315,59 +346,69 @@ class BattleRenderer:
             # Highlight if active
             if char_2_active:
                 # Draw glow effect
-                pygame.draw.rect(screen, self.colors['YELLOW'],
-                                 (x - 5, dice_y - 5, 110, 110),
-                                 border_radius=15)
+                area.append(pygame.draw.rect(screen, self.colors['YELLOW'],
+                                             (x - 5, dice_y - 5, 110, 110),
+                                             border_radius=15))
 
             # Draw dice label
-            label = character_2_state['dice_labels'][i]
-            label_text = self.fonts['small'].render(label, True, self.colors['BLACK'])
+            label = character_2_state.character.dice_labels[i]
+            label_text = render_text(self.fonts['small'], label, True, self.colors['BLACK'])
             label_rect = label_text.get_rect(center=(rect.centerx, rect.top - 15))
-            screen.blit(label_text, label_rect)
+            area.append(screen.blit(label_text, label_rect))
 
             # Draw dice
             dice_color = self.colors['BLUE'] if i == 0 else (self.colors['PURPLE'] if i == 1 else self.colors['ORANGE'])
             dice_border = self.colors['DARK_BLUE'] if i == 0 else (
                 self.colors['DARK_PURPLE'] if i == 1 else self.colors['DARK_ORANGE'])
-            pygame.draw.rect(screen, dice_color, rect, border_radius=15)
-            pygame.draw.rect(screen, dice_border, rect, width=4, border_radius=15)
+            area.append(pygame.draw.rect(screen, dice_color, rect, border_radius=15))
+            area.append(pygame.draw.rect(screen, dice_border, rect, width=4, border_radius=15))
 
             # Draw dice value
-            value = character_2_state['dice_values'][i]
-            value_text = self.fonts['large'].render(str(value), True, self.colors['WHITE'])
+            value = character_2_state.dice_values[i]
+            value_text = render_text(self.fonts['large'], str(value), True, self.colors['WHITE'])
             value_rect = value_text.get_rect(center=rect.center)
-            screen.blit(value_text, value_rect)
+            area.append(screen.blit(value_text, value_rect))
+
+        return area[0].unionall(area[1:])
 
     def draw_character_info(self, screen, character):
         """Draw character name and passive side by side in top-left corner"""
+        area = []  # Rects of everything drawn
         # Character name
-        name_text = self.fonts['medium'].render(character.name, True, self.colors['BLACK'])
-        screen.blit(name_text, (10, 10))
+        name_text = render_text(self.fonts['medium'], character.name, True, self.colors['BLACK'])
+        area.append(screen.blit(name_text, (10, 10)))
 
         # Get width of name to position passive to the right
         name_width = name_text.get_width()
 
         # Passive description (to the right of name)
-        passive_text = self.fonts['small'].render(character.passive_description, True, self.colors['BLACK'])
-        screen.blit(passive_text, (20 + name_width, 18))
+        passive_text = render_text(self.fonts['small'], character.passive_description, True, self.colors['BLACK'])
+        area.append(screen.blit(passive_text, (20 + name_width, 18)))
+
+        return area[0].unionall(area[1:])
 
     def draw_boss_damage_info(self, screen, boss_current_damage, boss_poison_stacks):
         """Draw boss damage info in top-right corner"""
-        damage_text = self.fonts['medium'].render(f"Boss Damage: {boss_current_damage}", True, self.colors['DARK_RED'])
+        area = []  # Rects of everything drawn
+        damage_text = render_text(self.fonts['medium'], f"Boss Damage: {boss_current_damage}", True,
+                                  self.colors['DARK_RED'])
         text_rect = damage_text.get_rect(topright=(self.screen_width - 10, 10))
-        screen.blit(damage_text, text_rect)
+        area.append(screen.blit(damage_text, text_rect))
 
         # Draw poison stacks if active
         if boss_poison_stacks > 0:
-            poison_text = self.fonts['small'].render(f"Poisoned: {boss_poison_stacks} stacks", True,
-                                                     self.colors['GREEN'])
+            poison_text = render_text(self.fonts['small'], f"Poisoned: {boss_poison_stacks} stacks", True,
+                                      self.colors['GREEN'])
             poison_rect = poison_text.get_rect(topright=(self.screen_width - 10, 45))
-            screen.blit(poison_text, poison_rect)
+            area.append(screen.blit(poison_text, poison_rect))
+
+        return area[0].unionall(area[1:])
 
     def draw_game_info(self, screen, player_position, laps_completed, is_moving, debuff_stacks, battle_phase,
                        yellow_buff_active, yellow_tiles_to_place, yellow_tiles_placed, boss_burn_stacks,
                        lifesteal_active, chain_lightning_stacks):
         """Draw position, laps, debuff status, and instructions on the LEFT side"""
+        area = []  # Rects of everything drawn
         info_x = 30  # Left side of screen
         info_y = 150
         line_height = 30
@@ -376,154 +417,238 @@ class BattleRenderer:
         if battle_phase == "place_yellow":
             tiles_remaining = yellow_tiles_to_place - yellow_tiles_placed
             instruction_text = f"Place {tiles_remaining} special tile(s)"
-            instruction = self.fonts['medium'].render(instruction_text, True, self.colors['DARK_YELLOW'])
-            screen.blit(instruction, (info_x, info_y))
+            instruction = render_text(self.fonts['medium'], instruction_text, True, self.colors['DARK_YELLOW'])
+            area.append(screen.blit(instruction, (info_x, info_y)))
             info_y += line_height + 10
         else:
             instruction_text = "Moving..." if is_moving else "Click a dice to roll!"
-            instruction = self.fonts['medium'].render(instruction_text, True, self.colors['BLACK'])
-            screen.blit(instruction, (info_x, info_y))
+            instruction = render_text(self.fonts['medium'], instruction_text, True, self.colors['BLACK'])
+            area.append(screen.blit(instruction, (info_x, info_y)))
             info_y += line_height + 10
 
             # Draw current position info
-            pos_text = self.fonts['small'].render(f"Position: {player_position}", True, self.colors['BLACK'])
-            screen.blit(pos_text, (info_x, info_y))
+            pos_text = render_text(self.fonts['small'], f"Position: {player_position}", True, self.colors['BLACK'])
+            area.append(screen.blit(pos_text, (info_x, info_y)))
             info_y += line_height
 
             # Draw laps completed
-            laps_text = self.fonts['small'].render(f"Laps: {laps_completed}", True, self.colors['BLACK'])
-            screen.blit(laps_text, (info_x, info_y))
+            laps_text = render_text(self.fonts['small'], f"Laps: {laps_completed}", True, self.colors['BLACK'])
+            area.append(screen.blit(laps_text, (info_x, info_y)))
             info_y += line_height + 20
 
             # Active Effects Section
-            effects_header = self.fonts['medium'].render("Active Effects:", True, self.colors['BLACK'])
-            screen.blit(effects_header, (info_x, info_y))
+            effects_header = render_text(self.fonts['medium'], "Active Effects:", True, self.colors['BLACK'])
+            area.append(screen.blit(effects_header, (info_x, info_y)))
             info_y += line_height + 5
 
             # Draw yellow buff status if active
             if yellow_buff_active:
-                buff_text = self.fonts['small'].render("• Double Movement", True, self.colors['DARK_YELLOW'])
-                screen.blit(buff_text, (info_x + 10, info_y))
+                buff_text = render_text(self.fonts['small'], "• Double Movement", True, self.colors['DARK_YELLOW'])
+                area.append(screen.blit(buff_text, (info_x + 10, info_y)))
                 info_y += line_height
 
             # Draw debuff status if active
             if debuff_stacks > 0:
                 damage_per_turn = debuff_stacks * 5
-                debuff_text = self.fonts['small'].render(f"• Debuffed x{debuff_stacks} (-{damage_per_turn} HP)", True,
-                                                         self.colors['DARK_RED'])
-                screen.blit(debuff_text, (info_x + 10, info_y))
+                debuff_text = render_text(self.fonts['small'], f"• Debuffed x{debuff_stacks} (-{damage_per_turn} HP)",
+                                          True, self.colors['DARK_RED'])
+                area.append(screen.blit(debuff_text, (info_x + 10, info_y)))
                 info_y += line_height
 
             # Draw burn stacks if active
             if boss_burn_stacks > 0:
                 damage_per_turn = boss_burn_stacks * 3
-                burn_text = self.fonts['small'].render(f"• Boss Burning x{boss_burn_stacks} ({damage_per_turn} dmg)",
-                                                       True, self.colors['DARK_ORANGE'])
-                screen.blit(burn_text, (info_x + 10, info_y))
+                burn_text = render_text(self.fonts['small'],
+                                        f"• Boss Burning x{boss_burn_stacks} ({damage_per_turn} dmg)",
+                                        True, self.colors['DARK_ORANGE'])
+                area.append(screen.blit(burn_text, (info_x + 10, info_y)))
                 info_y += line_height
 
             # Draw lifesteal status if active
             if lifesteal_active:
-                lifesteal_text = self.fonts['small'].render("• Lifesteal Ready", True, self.colors['DARK_RED'])
-                screen.blit(lifesteal_text, (info_x + 10, info_y))
+                lifesteal_text = render_text(self.fonts['small'], "• Lifesteal Ready", True, self.colors['DARK_RED'])
+                area.append(screen.blit(lifesteal_text, (info_x + 10, info_y)))
                 info_y += line_height
 
             # Draw chain lightning stacks if active
             if chain_lightning_stacks > 0:
-                chain_text = self.fonts['small'].render(f"• Chain Lightning ({chain_lightning_stacks} turns)", True,
-                                                        self.colors['PURPLE'])
-                screen.blit(chain_text, (info_x + 10, info_y))
+                chain_text = render_text(self.fonts['small'], f"• Chain Lightning ({chain_lightning_stacks} turns)",
+                                         True, self.colors['PURPLE'])
+                area.append(screen.blit(chain_text, (info_x + 10, info_y)))
                 info_y += line_height
 
             # If no effects active
             if not any([yellow_buff_active, debuff_stacks > 0, boss_burn_stacks > 0, lifesteal_active,
                         chain_lightning_stacks > 0]):
-                none_text = self.fonts['small'].render("• None", True, self.colors['LIGHT_GRAY'])
-                screen.blit(none_text, (info_x + 10, info_y))
+                none_text = render_text(self.fonts['small'], "• None", True, self.colors['LIGHT_GRAY'])
+                area.append(screen.blit(none_text, (info_x + 10, info_y)))
 
-    def draw_battle_screen(self, screen, game_state):
+        return area[0].unionall(area[1:])
+
+    def draw_battle_screen(self, screen, view):
         """
         Main draw method - draws the entire battle screen
 
+        In dirty-rect mode nothing is drawn when no element changed since the
+        last frame, otherwise the whole screen surface is redrawn (so overlaps
+        stay correct) and only the regions of the changed elements are returned.
+
         Args:
             screen: Pygame screen surface
-            game_state: Dictionary containing all game state variables
+            view: BattleView of the battle being drawn
+
+        Returns:
+            List of changed rects to pass to pygame.display.update() in dirty-rect mode, None otherwise
         """
+        if self.dirty_rects:
+            element_keys = self.get_element_keys(view)
+            if element_keys == self.last_element_keys:
+                return []
+
         screen.fill(self.colors['WHITE'])
+        areas = {}  # Element name -> rect it covers
+        boss = view.boss
+        turn = view.turn
 
         # Check if campaign mode or single player mode
-        if game_state.get('campaign_mode', False):
+        if view.campaign_mode:
             # Campaign mode - draw 2 characters
-            self.draw_board(screen, game_state['board_positions'],
-                            game_state['green_tiles'], game_state['red_tiles'],
-                            game_state['yellow_tiles'],
-                            game_state.get('highlighted_tiles', []),
-                            game_state['character_1_state']['character_obj'],
-                            game_state.get('yellow_tile_effects', {}))
+            areas['board'] = self.draw_board(screen, view.board_positions, view.board, view.highlighted_tiles)
 
-            self.draw_boss(screen, game_state['boss_current_hp'], game_state['boss_max_hp'])
+            areas['boss'] = self.draw_boss(screen, boss.current_hp, boss.max_hp)
 
             # Draw both players
-            char_1 = game_state['character_1_state']
-            char_2 = game_state['character_2_state']
+            char_1, char_2 = view.players
 
-            self.draw_player(screen, char_1['position'], game_state['board_positions'],
-                             char_1['current_hp'], char_1['max_hp'], self.colors['RED'])
-            self.draw_player(screen, char_2['position'], game_state['board_positions'],
-                             char_2['current_hp'], char_2['max_hp'], self.colors['BLUE'])
+            areas['player_1'] = self.draw_player(screen, char_1.position, view.board_positions,
+                                                 char_1.current_hp, char_1.max_hp, self.colors['RED'])
+            areas['player_2'] = self.draw_player(screen, char_2.position, view.board_positions,
+                                                 char_2.current_hp, char_2.max_hp, self.colors['BLUE'])
 
             # Draw dice for both characters
-            if game_state['battle_phase'] == "rolling":
-                self.draw_campaign_dice(screen, char_1, char_2, game_state['turn_phase'])
+            if turn.battle_phase == "rolling":
+                areas['dice'] = self.draw_campaign_dice(screen, char_1, char_2, turn.turn_phase)
 
             # TODO: Draw character info for both
 
-            self.draw_boss_damage_info(screen, game_state['boss_current_damage'],
-                                       game_state['boss_poison_stacks'])
+            areas['boss_damage_info'] = self.draw_boss_damage_info(screen, boss.current_damage, boss.poison_stacks)
 
             # Campaign-specific UI
-            if game_state['battle_phase'] == "place_yellow":
+            if turn.battle_phase == "place_yellow":
                 # Yellow tile placement UI
-                tiles_remaining = game_state['yellow_tiles_to_place'] - game_state['yellow_tiles_placed']
+                tiles_remaining = turn.yellow_tiles_to_place - turn.yellow_tiles_placed
                 instruction_text = f"Place {tiles_remaining} special tile(s)"
-                instruction = self.fonts['medium'].render(instruction_text, True, self.colors['DARK_YELLOW'])
-                screen.blit(instruction, (30, 150))
+                instruction = render_text(self.fonts['medium'], instruction_text, True, self.colors['DARK_YELLOW'])
+                areas['instruction'] = screen.blit(instruction, (30, 150))
             else:
                 # Show turn phase
                 turn_text = ""
-                if game_state['turn_phase'] == "choose_first":
+                if turn.turn_phase == "choose_first":
                     turn_text = "Choose first character to move"
-                elif game_state['turn_phase'] == "character_1_second":
-                    turn_text = f"Choose {char_1['character_obj'].name}'s dice"
-                elif game_state['turn_phase'] == "character_2_second":
-                    turn_text = f"Choose {char_2['character_obj'].name}'s dice"
-                elif game_state['turn_phase'] == "boss_attack":
+                elif turn.turn_phase == "character_1_second":
+                    turn_text = f"Choose {char_1.character.name}'s dice"
+                elif turn.turn_phase == "character_2_second":
+                    turn_text = f"Choose {char_2.character.name}'s dice"
+                elif turn.turn_phase == "boss_attack":
                     turn_text = "Boss attacks!"
 
-                instruction = self.fonts['medium'].render(turn_text, True, self.colors['BLACK'])
-                screen.blit(instruction, (30, 150))
+                instruction = render_text(self.fonts['medium'], turn_text, True, self.colors['BLACK'])
+                areas['instruction'] = screen.blit(instruction, (30, 150))
 
         else:
             # Single player mode - use old rendering
-            self.draw_board(screen, game_state['board_positions'],
-                            game_state['green_tiles'], game_state['red_tiles'],
-                            game_state['yellow_tiles'],
-                            game_state['highlighted_tiles'],
-                            game_state['character'],
-                            None)
-            self.draw_boss(screen, game_state['boss_current_hp'], game_state['boss_max_hp'])
-            self.draw_player(screen, game_state['player_position'],
-                             game_state['board_positions'],
-                             game_state['player_current_hp'], game_state['player_max_hp'])
-            self.draw_dice(screen, game_state['dice_rects'], game_state['dice_colors'],
-                           game_state['dice_values'], game_state['dice_labels'])
-            self.draw_character_info(screen, game_state['character'])
-            self.draw_boss_damage_info(screen, game_state['boss_current_damage'],
-                                       game_state['boss_poison_stacks'])
-            self.draw_game_info(screen, game_state['player_position'],
-                                game_state['laps_completed'], game_state['is_moving'],
-                                game_state['debuff_stacks'], game_state['battle_phase'],
-                                game_state['yellow_buff_active'],
-                                game_state['yellow_tiles_to_place'], game_state['yellow_tiles_placed'],
-                                game_state['boss_burn_stacks'], game_state['lifesteal_active'],
-                                game_state['chain_lightning_stacks'])
\ No newline at end of file
+            player = view.players[0]
+            areas['board'] = self.draw_board(screen, view.board_positions, view.board, view.highlighted_tiles,
+                                             view.landing_probabilities, view.hint_tiles)
+            areas['boss'] = self.draw_boss(screen, boss.current_hp, boss.max_hp)
+            areas['player'] = self.draw_player(screen, player.position, view.board_positions, player.current_hp,
+                                               player.max_hp)
+            areas['dice'] = self.draw_dice(screen, view.dice_rects, view.dice_colors, player.dice_values,
+                                           view.character.dice_labels)
+
+            # Describe where the hovered dice can land
+            if view.landing_description:
+                dice_rects = view.dice_rects
+                description = render_text(self.fonts['small'], view.landing_description, True, self.colors['BLACK'])
+                areas['description'] = screen.blit(description,
+                                                   description.get_rect(midtop=(dice_rects[1].centerx,
+                                                                                dice_rects[1].bottom + 15)))
+            areas['character_info'] = self.draw_character_info(screen, view.character)
+            areas['boss_damage_info'] = self.draw_boss_damage_info(screen, boss.current_damage, boss.poison_stacks)
+            areas['game_info'] = self.draw_game_info(screen, player.position, player.laps_completed,
+                                                     player.is_moving, player.debuff_stacks, turn.battle_phase,
+                                                     player.yellow_buff_active, turn.yellow_tiles_to_place,
+                                                     turn.yellow_tiles_placed, boss.burn_stacks,
+                                                     player.lifesteal_active, boss.chain_lightning_stacks)
+
+        # Turbo mode indicator
+        if view.turbo_mode:
+            turbo_text = render_text(self.fonts['small'], "TURBO (press T to animate)", True,
+                                     self.colors['DARK_ORANGE'])
+            areas['turbo'] = screen.blit(turbo_text, (30, self.screen_height - 40))
+
+        if not self.dirty_rects:
+            return None
+        return self._get_changed_areas(screen, element_keys, areas)
+
+    # ===== DIRTY RECTS =====
+    def get_element_keys(self, view):
+        """
+        Get a comparable snapshot of the state each battle screen element is drawn from
+
+        Returns:
+            Dictionary of element name -> tuple of the values it shows
+        """
+        board = view.board
+        boss = view.boss
+        turn = view.turn
+        keys = {
+            'board': (board.pack(), tuple(view.highlighted_tiles), tuple(view.landing_probabilities.items()),
+                      tuple(view.hint_tiles)),
+            'boss': (boss.current_hp, boss.max_hp),
+            'boss_damage_info': (boss.current_damage, boss.poison_stacks),
+            'turbo': view.turbo_mode
+        }
+
+        if view.campaign_mode:
+            for i, state in enumerate(view.players):
+                keys[f'player_{i + 1}'] = (state.position, state.current_hp, state.max_hp)
+            if turn.battle_phase == "rolling":
+                keys['dice'] = (turn.turn_phase,) + tuple(
+                    (state.character.name, state.current_hp, state.max_hp, tuple(state.dice_values),
+                     tuple(state.character.dice_labels)) for state in view.players)
+            keys['instruction'] = (turn.battle_phase, turn.yellow_tiles_to_place, turn.yellow_tiles_placed,
+                                   turn.turn_phase)
+        else:
+            player = view.players[0]
+            keys['player'] = (player.position, player.current_hp, player.max_hp)
+            keys['dice'] = (tuple(player.dice_values), tuple(view.character.dice_labels))
+            keys['description'] = view.landing_description
+            keys['character_info'] = view.character.name
+            keys['game_info'] = (player.position, player.laps_completed, player.is_moving, player.debuff_stacks,
+                                 turn.battle_phase, player.yellow_buff_active, turn.yellow_tiles_to_place,
+                                 turn.yellow_tiles_placed, boss.burn_stacks, player.lifesteal_active,
+                                 boss.chain_lightning_stacks)
+        return keys
+
+    def _get_changed_areas(self, screen, element_keys, areas):
+        """Compare this frame's elements with the last one and return the old and new rects of the changed ones"""
+        if self.last_element_keys is None:
+            changed = [screen.get_rect()]  # First frame on this screen
+        else:
+            changed = []
+            for name in element_keys.keys() | self.last_element_keys.keys():
+                if element_keys.get(name) != self.last_element_keys.get(name):
+                    # Old rect clears what the element covered before, new rect shows it now
+                    for area in (self.last_areas.get(name), areas.get(name)):
+                        if area is not None:
+                            changed.append(area)
+
+        self.last_element_keys = element_keys
+        self.last_areas = areas
+        return changed
+
+    def reset_dirty_rects(self):
+        """Forget the last frame so the next battle frame updates the whole screen"""
+        self.last_element_keys = None
+        self.last_areas = {}
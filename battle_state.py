@@ -0,0 +1,162 @@
+# Slotted battle state updated in place by the engines, so the renderer can keep references across frames.
+# pack() / unpack() convert a state to and from a fixed-size tuple for copying, hashing or storing.
+
+
+class PlayerState:
+    __slots__ = ('character', 'position', 'current_hp', 'max_hp', 'is_moving', 'moves_remaining',
+                 'laps_completed', 'dice_values', 'debuff_stacks', 'yellow_buff_active', 'lifesteal_active',
+                 'landed_on_green', 'current_dice_damage')
+
+    def __init__(self, character):
+        """
+        A character's position, health and movement on the board
+
+        Args:
+            character: Character instance (its dice and max HP are used)
+        """
+        self.character = character
+        self.position = 1
+        self.current_hp = character.max_hp
+        self.max_hp = character.max_hp
+        self.is_moving = False
+        self.moves_remaining = 0
+        self.laps_completed = 0
+        self.dice_values = [3, 5, 3]  # Face shown on each dice
+        self.debuff_stacks = 0
+        self.yellow_buff_active = False  # Double movement on next roll
+        self.lifesteal_active = False  # Next hit on the boss heals (single-player, campaign uses TurnState)
+        self.landed_on_green = False
+        self.current_dice_damage = character.base_damage  # Damage from current dice roll
+
+    def pack(self):
+        """
+        Get the changing fields as a tuple (the character isn't included)
+
+        Returns:
+            (position, current_hp, max_hp, is_moving, moves_remaining, laps_completed, dice_values,
+            debuff_stacks, yellow_buff_active, lifesteal_active, landed_on_green, current_dice_damage)
+        """
+        return (self.position, self.current_hp, self.max_hp, self.is_moving, self.moves_remaining,
+                self.laps_completed, tuple(self.dice_values), self.debuff_stacks, self.yellow_buff_active,
+                self.lifesteal_active, self.landed_on_green, self.current_dice_damage)
+
+    def unpack(self, packed):
+        """Restore the fields from a pack() tuple in place"""
+        (self.position, self.current_hp, self.max_hp, self.is_moving, self.moves_remaining, self.laps_completed,
+         dice_values, self.debuff_stacks, self.yellow_buff_active, self.lifesteal_active, self.landed_on_green,
+         self.current_dice_damage) = packed
+        self.dice_values[:] = dice_values
+
+
+class BossState:
+    __slots__ = ('current_hp', 'max_hp', 'current_damage', 'attack_count', 'poison_stacks', 'burn_stacks',
+                 'chain_lightning_stacks')
+
+    def __init__(self, max_hp, initial_damage):
+        """
+        The boss's health, attack damage and the effects applied to it
+
+        Args:
+            max_hp: Starting and maximum HP
+            initial_damage: Damage of the boss's first attack
+        """
+        self.current_hp = max_hp
+        self.max_hp = max_hp
+        self.current_damage = initial_damage
+        self.attack_count = 0
+        self.poison_stacks = 0
+        self.burn_stacks = 0  # Burn stacks on boss (doesn't decay)
+        self.chain_lightning_stacks = 0  # Chain lightning turns remaining
+
+    def pack(self):
+        """
+        Get every field as a tuple
+
+        Returns:
+            (current_hp, max_hp, current_damage, attack_count, poison_stacks, burn_stacks, chain_lightning_stacks)
+        """
+        return (self.current_hp, self.max_hp, self.current_damage, self.attack_count, self.poison_stacks,
+                self.burn_stacks, self.chain_lightning_stacks)
+
+    def unpack(self, packed):
+        """Restore the fields from a pack() tuple in place"""
+        (self.current_hp, self.max_hp, self.current_damage, self.attack_count, self.poison_stacks,
+         self.burn_stacks, self.chain_lightning_stacks) = packed
+
+
+class TurnState:
+    __slots__ = ('battle_phase', 'turn_phase', 'turns_taken', 'yellow_tiles_to_place', 'yellow_tiles_placed',
+                 'lifesteal_active')
+
+    def __init__(self, yellow_tiles_to_place, turn_phase=None):
+        """
+        Where the battle is: yellow tile placement or rolling, and how many turns have passed
+
+        Args:
+            yellow_tiles_to_place: Yellow tiles placed before rolling starts
+            turn_phase: Campaign turn phase (None in single-player battles)
+        """
+        self.battle_phase = "place_yellow"  # "place_yellow" or "rolling"
+        self.turn_phase = turn_phase
+        self.turns_taken = 0
+        self.yellow_tiles_to_place = yellow_tiles_to_place
+        self.yellow_tiles_placed = 0
+        self.lifesteal_active = False  # Campaign: the next character to hit the boss heals (shared by both)
+
+    def pack(self):
+        """
+        Get every field as a tuple
+
+        Returns:
+            (battle_phase, turn_phase, turns_taken, yellow_tiles_to_place, yellow_tiles_placed, lifesteal_active)
+        """
+        return (self.battle_phase, self.turn_phase, self.turns_taken, self.yellow_tiles_to_place,
+                self.yellow_tiles_placed, self.lifesteal_active)
+
+    def unpack(self, packed):
+        """Restore the fields from a pack() tuple in place"""
+        (self.battle_phase, self.turn_phase, self.turns_taken, self.yellow_tiles_to_place,
+         self.yellow_tiles_placed, self.lifesteal_active) = packed
+
+
+class BattleView:
+    __slots__ = ('campaign_mode', 'board_positions', 'board', 'players', 'boss', 'turn', 'character', 'dice_rects',
+                 'dice_colors', 'highlighted_tiles', 'landing_probabilities', 'landing_description', 'hover_key',
+                 'hint_tiles', 'hint_key', 'turbo_mode')
+
+    def __init__(self, engine, board_positions, dice_rects=None, dice_colors=None, campaign_mode=False):
+        """
+        Everything the battle screen is drawn from, built once per battle
+
+        The player, boss, turn and board are the engine's own objects, so the
+        view stays current as the engine updates them. Only the hover and
+        hint fields and turbo_mode are set by the game between frames.
+
+        Args:
+            engine: BattleEngine, or CampaignEngine if campaign_mode
+            board_positions: List of (x, y) tile positions
+            dice_rects: pygame Rects of the three dice (single-player only)
+            dice_colors: Colors of the three dice (single-player only)
+            campaign_mode: Draw both campaign characters
+        """
+        self.campaign_mode = campaign_mode
+        self.board_positions = board_positions
+        self.board = engine.board
+        self.players = engine.character_states if campaign_mode else [engine.player]
+        self.boss = engine.boss
+        self.turn = engine.turn
+        self.character = None if campaign_mode else engine.character
+        self.dice_rects = dice_rects
+        self.dice_colors = dice_colors
+
+        # Landing tiles of the hovered dice, recomputed when hover_key changes
+        self.highlighted_tiles = []
+        self.landing_probabilities = {}
+        self.landing_description = ""
+        self.hover_key = None
+
+        # Suggested yellow tile placement (single-player only), recomputed when hint_key changes
+        self.hint_tiles = []
+        self.hint_key = None
+
+        self.turbo_mode = False
@@ -1,5 +1,199 @@
+import math
 import random
 
+# Number of tiles on the standard 7x7 board
+BOARD_SIZE = 24
+
+# Tile types stored in Board.tile_types
+TILE_EMPTY = 0
+TILE_GREEN = 1
+TILE_RED = 2
+TILE_YELLOW = 3
+
+# Yellow tile effects stored in Board.yellow_effects by index (0 means no effect)
+YELLOW_EFFECTS = [None, 'double_movement', 'poison_5', 'burning_strike', 'lifesteal', 'chain_lightning']
+YELLOW_EFFECT_IDS = {effect: effect_id for effect_id, effect in enumerate(YELLOW_EFFECTS)}
+
+# Board.fingerprint symbol of each non-yellow tile type
+_TILE_SYMBOLS = {TILE_EMPTY: '.', TILE_GREEN: 'G', TILE_RED: 'R'}
+
+
+class Board:
+    __slots__ = ('size', 'tile_types', 'yellow_effects', 'yellow_tiles')
+
+    def __init__(self, size=BOARD_SIZE, green_tiles=(), red_tiles=(), yellow_tiles=(), yellow_effect=None):
+        """
+        Compact board with one tile type and one yellow effect id per tile
+
+        Both arrays are indexed by tile number (entry 0 is unused), so landing
+        and drawing decisions are a single lookup instead of list searches.
+
+        Args:
+            size: Number of tiles on the board
+            green_tiles: List of green tile numbers
+            red_tiles: List of red tile numbers (tiles that are already green are skipped)
+            yellow_tiles: List of yellow tile numbers (tiles that aren't empty are skipped)
+            yellow_effect: Effect name given to the yellow_tiles
+        """
+        self.size = size
+        self.tile_types = bytearray(size + 1)
+        self.yellow_effects = bytearray(size + 1)
+        self.yellow_tiles = []  # In placement order
+
+        for tile in green_tiles:
+            self.tile_types[tile] = TILE_GREEN
+        for tile in red_tiles:
+            if self.tile_types[tile] == TILE_EMPTY:
+                self.tile_types[tile] = TILE_RED
+        for tile in yellow_tiles:
+            self.place_yellow(tile, yellow_effect)
+
+    @property
+    def green_tiles(self):
+        """List of green tile numbers"""
+        return self.tiles_of_type(TILE_GREEN)
+
+    @property
+    def red_tiles(self):
+        """List of red tile numbers"""
+        return self.tiles_of_type(TILE_RED)
+
+    def tiles_of_type(self, tile_type):
+        """List the tile numbers of one tile type"""
+        return [tile for tile in range(1, self.size + 1) if self.tile_types[tile] == tile_type]
+
+    def is_empty(self, tile_number):
+        """Check if a tile is not green, red or yellow"""
+        return self.tile_types[tile_number] == TILE_EMPTY
+
+    def empty_tiles(self):
+        """List the tile numbers that are not green, red or yellow"""
+        return self.tiles_of_type(TILE_EMPTY)
+
+    def place_yellow(self, tile_number, effect=None):
+        """
+        Turn an empty tile into a yellow tile
+
+        Args:
+            tile_number: Tile number to place the yellow tile on
+            effect: Effect name from YELLOW_EFFECTS triggered by this tile
+
+        Returns:
+            True if the tile was placed, False if the tile is not empty
+        """
+        if not 1 <= tile_number <= self.size or self.tile_types[tile_number] != TILE_EMPTY:
+            return False
+        self.tile_types[tile_number] = TILE_YELLOW
+        self.yellow_effects[tile_number] = YELLOW_EFFECT_IDS[effect]
+        self.yellow_tiles.append(tile_number)
+        return True
+
+    def yellow_effect(self, tile_number):
+        """Get the effect name of a yellow tile (None if it has none)"""
+        return YELLOW_EFFECTS[self.yellow_effects[tile_number]]
+
+    def fingerprint(self, dice_sets=None):
+        """
+        Get the board as text, for keying caches of repeated analysis
+
+        One character per tile: '.' empty, 'G' green, 'R' red and the yellow
+        effect id (0-5) for yellow tiles, so the order yellow tiles were placed
+        in doesn't matter. With dice_sets, tiles a token starting on tile 1 can
+        never land on are '-', which only merges boards when the dice skip
+        tiles (e.g. all even faces). Otherwise only identical boards match:
+        rotations and mirror images play differently, since the start tile and
+        the lap boundary are fixed.
+
+        Args:
+            dice_sets: Dice the board is played with, each a list of face values (all tiles kept if None)
+
+        Returns:
+            String of length size, e.g. "..R.G2-..."
+        """
+        reachable = get_reachable_tiles(dice_sets, self.size) if dice_sets else None
+        symbols = []
+        for tile in range(1, self.size + 1):
+            tile_type = self.tile_types[tile]
+            if reachable is not None and tile not in reachable:
+                symbols.append('-')
+            elif tile_type == TILE_YELLOW:
+                symbols.append(str(self.yellow_effects[tile]))
+            else:
+                symbols.append(_TILE_SYMBOLS[tile_type])
+        return ''.join(symbols)
+
+    def pack(self):
+        """
+        Get the board as a tuple
+
+        Returns:
+            (tile_types bytes, yellow_effects bytes, yellow tiles in placement order)
+        """
+        return (bytes(self.tile_types), bytes(self.yellow_effects), tuple(self.yellow_tiles))
+
+    def unpack(self, packed):
+        """Restore the board from a pack() tuple in place (same size only)"""
+        tile_types, yellow_effects, yellow_tiles = packed
+        self.tile_types[:] = tile_types
+        self.yellow_effects[:] = yellow_effects
+        self.yellow_tiles[:] = yellow_tiles
+
+
+def get_reachable_tiles(dice_sets, board_size=BOARD_SIZE, start=1):
+    """
+    Get every tile a token can land on, sooner or later, with a set of dice
+
+    Moves wrap around the board, so the token only ever lands on tiles a
+    multiple of gcd(board_size, every face) away from where it started.
+    Doubled moves (yellow buff) keep that gcd.
+
+    Args:
+        dice_sets: List of dice, each a list of face values
+        board_size: Number of tiles on the board
+        start: Tile the token starts on
+
+    Returns:
+        Set of tile numbers
+    """
+    step = board_size
+    for values in dice_sets:
+        for value in values:
+            step = math.gcd(step, value)
+    return {tile for tile in range(1, board_size + 1) if (tile - start) % step == 0}
+
+
+def get_board_sides(board_size=BOARD_SIZE):
+    """
+    Split a board into its four sides, matching generate_board_positions for 24 tiles
+
+    Returns:
+        List of four (first_tile, last_tile + 1) ranges
+    """
+    bounds = [1, board_size // 4 + 2, board_size // 2 + 2, 3 * board_size // 4 + 2, board_size + 1]
+    return [(min(bounds[i], board_size + 1), min(bounds[i + 1], board_size + 1)) for i in range(4)]
+
+
+def generate_board(num_green_tiles, num_red_tiles, board_size=BOARD_SIZE, green_tiles=None, red_tiles=None, rng=random):
+    """
+    Build a board with random green tiles, then random red tiles on the remaining ones
+
+    Args:
+        num_green_tiles: Number of green tiles to place
+        num_red_tiles: Total number of red tiles, spread evenly over the four sides
+        board_size: Number of tiles on the board
+        green_tiles: Fixed green tile numbers (random if None)
+        red_tiles: Fixed red tile numbers (random if None)
+        rng: Random number stream (e.g., GameRandom) to draw the tiles from
+
+    Returns:
+        Board instance without yellow tiles
+    """
+    if green_tiles is None:
+        green_tiles = generate_green_tiles(num_green_tiles, [], board_size, rng)
+    if red_tiles is None:
+        red_tiles = generate_red_tiles(num_red_tiles, green_tiles, board_size, rng)
+    return Board(board_size, green_tiles, red_tiles)
+
 
 def generate_board_positions(square_size, margin, window_height, offset_x=0, offset_y=0):
     """
@@ -53,46 +247,47 @@ def generate_board_positions(square_size, margin, window_height, offset_x=0, off
     return board_positions
 
 
-def generate_green_tiles(num_tiles, excluded_tiles):
+def generate_green_tiles(num_tiles, excluded_tiles, board_size=BOARD_SIZE, rng=random):
     """
     Generate random green tile positions
 
     Args:
         num_tiles: Number of green tiles to place
         excluded_tiles: List of tile numbers to exclude
+        board_size: Number of tiles on the board
+        rng: Random number stream (e.g., GameRandom) to draw the tiles from
 
     Returns:
         List of tile numbers for green tiles
     """
-    available_tiles = [i for i in range(1, 25) if i not in excluded_tiles]
-    return random.sample(available_tiles, min(num_tiles, len(available_tiles)))
+    available_tiles = [i for i in range(1, board_size + 1) if i not in excluded_tiles]
+    return rng.sample(available_tiles, min(num_tiles, len(available_tiles)))
 
 
-def generate_red_tiles(num_tiles, excluded_tiles):
+def generate_red_tiles(num_tiles, excluded_tiles, board_size=BOARD_SIZE, rng=random):
     """
     Generate random red tile positions (2 per side, avoiding excluded tiles)
 
     Args:
         num_tiles: Total number of red tiles (should be 8 for 2 per side)
         excluded_tiles: List of tile numbers to exclude (green tiles)
+        board_size: Number of tiles on the board
+        rng: Random number stream (e.g., GameRandom) to draw the tiles from
 
     Returns:
         List of tile numbers for red tiles
     """
-    # Define the four sides
-    bottom_side = list(range(1, 8))  # Tiles 1-7
-    right_side = list(range(8, 14))  # Tiles 8-13
-    top_side = list(range(14, 20))  # Tiles 14-19
-    left_side = list(range(20, 25))  # Tiles 20-24
-
-    sides = [bottom_side, right_side, top_side, left_side]
+    # Define the four sides (tiles 1-7, 8-13, 14-19 and 20-24 on the standard board)
+    sides = [range(start, end) for start, end in get_board_sides(board_size)]
+    per_side = num_tiles // len(sides)
+    excluded_tiles = set(excluded_tiles)
     red_tiles = []
 
-    # Pick exactly 2 from each side
+    # Pick the same number from each side
     for side in sides:
-        available = [t for t in side if t not in excluded_tiles and t not in red_tiles]
-        if len(available) >= 2:
-            tiles = random.sample(available, 2)
+        available = [t for t in side if t not in excluded_tiles]
+        if len(available) >= per_side:
+            tiles = rng.sample(available, per_side)
             red_tiles.extend(tiles)
         elif len(available) > 0:
             red_tiles.extend(available)
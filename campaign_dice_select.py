@@ -1,5 +1,7 @@
 import pygame
 from characters import DICE_LIBRARY
+from hit_test import SpatialHash
+from text_cache import render_text
 
 
 class CampaignDiceSelect:
@@ -51,6 +53,14 @@ class CampaignDiceSelect:
         confirm_y = screen_height - 100
         self.confirm_button = pygame.Rect(confirm_x, confirm_y, confirm_width, confirm_height)
 
+        # Hit test values: ('dice_1', dice_key), ('dice_2', dice_key) or ('confirm', None)
+        self.hit_test = SpatialHash()
+        for button_rect, dice_key in self.char_1_buttons:
+            self.hit_test.add(button_rect, ('dice_1', dice_key))
+        for button_rect, dice_key in self.char_2_buttons:
+            self.hit_test.add(button_rect, ('dice_2', dice_key))
+        self.hit_test.add(self.confirm_button, ('confirm', None))
+
     def _create_dice_buttons(self, available_dice, start_x, start_y):
         """Create button rectangles for dice options"""
         buttons = []
@@ -81,30 +91,20 @@ class CampaignDiceSelect:
             Tuple of (char_1_dice_keys, char_2_dice_keys) if confirm clicked
             None otherwise
         """
-        # Check character 1 dice buttons
-        for button_rect, dice_key in self.char_1_buttons:
-            if button_rect.collidepoint(mouse_pos):
-                if dice_key in self.char_1_selected:
-                    # Deselect
-                    self.char_1_selected.remove(dice_key)
-                elif len(self.char_1_selected) < 3:
-                    # Select (max 3)
-                    self.char_1_selected.append(dice_key)
-                return None
-
-        # Check character 2 dice buttons
-        for button_rect, dice_key in self.char_2_buttons:
-            if button_rect.collidepoint(mouse_pos):
-                if dice_key in self.char_2_selected:
-                    # Deselect
-                    self.char_2_selected.remove(dice_key)
-                elif len(self.char_2_selected) < 3:
-                    # Select (max 3)
-                    self.char_2_selected.append(dice_key)
-                return None
+        kind, dice_key = self.hit_test.hit(mouse_pos, (None, None))
+
+        # Character 1 or character 2 dice buttons
+        if kind in ('dice_1', 'dice_2'):
+            selected = self.char_1_selected if kind == 'dice_1' else self.char_2_selected
+            if dice_key in selected:
+                # Deselect
+                selected.remove(dice_key)
+            elif len(selected) < 3:
+                # Select (max 3)
+                selected.append(dice_key)
 
         # Check confirm button
-        if self.confirm_button.collidepoint(mouse_pos):
+        elif kind == 'confirm':
             if len(self.char_1_selected) == 3 and len(self.char_2_selected) == 3:
                 return (self.char_1_selected, self.char_2_selected)
 
@@ -120,12 +120,13 @@ class CampaignDiceSelect:
         screen.fill(self.colors['WHITE'])
 
         # Draw title
-        title = self.fonts['large'].render("Select Dice for Each Character", True, self.colors['BLACK'])
+        title = render_text(self.fonts['large'], "Select Dice for Each Character", True, self.colors['BLACK'])
         title_rect = title.get_rect(center=(self.screen_width // 2, 50))
         screen.blit(title, title_rect)
 
         # Draw character 1 label
-        char_1_label = self.fonts['medium'].render(f"{self.character_1.name} (Select 3)", True, self.colors['BLACK'])
+        char_1_label = render_text(self.fonts['medium'], f"{self.character_1.name} (Select 3)", True,
+                                   self.colors['BLACK'])
         screen.blit(char_1_label, (50, 100))
 
         # Draw character 1 dice buttons
@@ -139,22 +140,23 @@ class CampaignDiceSelect:
             pygame.draw.rect(screen, self.colors['BLACK'], button_rect, 3, border_radius=10)
 
             # Dice label
-            label_text = self.fonts['small'].render(dice_data['label'], True, self.colors['BLACK'])
+            label_text = render_text(self.fonts['small'], dice_data['label'], True, self.colors['BLACK'])
             label_rect = label_text.get_rect(center=(button_rect.centerx, button_rect.centery - 20))
             screen.blit(label_text, label_rect)
 
             # Dice values
-            values_text = self.fonts['small'].render(str(dice_data['values']), True, self.colors['BLACK'])
+            values_text = render_text(self.fonts['small'], str(dice_data['values']), True, self.colors['BLACK'])
             values_rect = values_text.get_rect(center=(button_rect.centerx, button_rect.centery + 10))
             screen.blit(values_text, values_rect)
 
             # Damage
-            damage_text = self.fonts['small'].render(f"Dmg: {dice_data['damage']}", True, self.colors['BLACK'])
+            damage_text = render_text(self.fonts['small'], f"Dmg: {dice_data['damage']}", True, self.colors['BLACK'])
             damage_rect = damage_text.get_rect(center=(button_rect.centerx, button_rect.centery + 30))
             screen.blit(damage_text, damage_rect)
 
         # Draw character 2 label
-        char_2_label = self.fonts['medium'].render(f"{self.character_2.name} (Select 3)", True, self.colors['BLACK'])
+        char_2_label = render_text(self.fonts['medium'], f"{self.character_2.name} (Select 3)", True,
+                                   self.colors['BLACK'])
         screen.blit(char_2_label, (self.screen_width // 2 + 50, 100))
 
         # Draw character 2 dice buttons
@@ -168,29 +170,31 @@ class CampaignDiceSelect:
             pygame.draw.rect(screen, self.colors['BLACK'], button_rect, 3, border_radius=10)
 
             # Dice label
-            label_text = self.fonts['small'].render(dice_data['label'], True, self.colors['BLACK'])
+            label_text = render_text(self.fonts['small'], dice_data['label'], True, self.colors['BLACK'])
             label_rect = label_text.get_rect(center=(button_rect.centerx, button_rect.centery - 20))
             screen.blit(label_text, label_rect)
 
             # Dice values
-            values_text = self.fonts['small'].render(str(dice_data['values']), True, self.colors['BLACK'])
+            values_text = render_text(self.fonts['small'], str(dice_data['values']), True, self.colors['BLACK'])
             values_rect = values_text.get_rect(center=(button_rect.centerx, button_rect.centery + 10))
             screen.blit(values_text, values_rect)
 
             # Damage
-            damage_text = self.fonts['small'].render(f"Dmg: {dice_data['damage']}", True, self.colors['BLACK'])
+            damage_text = render_text(self.fonts['small'], f"Dmg: {dice_data['damage']}", True, self.colors['BLACK'])
             damage_rect = damage_text.get_rect(center=(button_rect.centerx, button_rect.centery + 30))
             screen.blit(damage_text, damage_rect)
 
         # Draw selection count
-        char_1_count = self.fonts['small'].render(
+        char_1_count = render_text(
+            self.fonts['small'],
             f"Selected: {len(self.char_1_selected)}/3",
             True,
             self.colors['BLACK']
         )
         screen.blit(char_1_count, (50, self.screen_height - 150))
 
-        char_2_count = self.fonts['small'].render(
+        char_2_count = render_text(
+            self.fonts['small'],
             f"Selected: {len(self.char_2_selected)}/3",
             True,
             self.colors['BLACK']
@@ -202,11 +206,11 @@ class CampaignDiceSelect:
         if both_ready:
             pygame.draw.rect(screen, self.colors['BLUE'], self.confirm_button, border_radius=10)
             pygame.draw.rect(screen, self.colors['BLACK'], self.confirm_button, 3, border_radius=10)
-            confirm_text = self.fonts['medium'].render("Confirm Dice", True, self.colors['WHITE'])
+            confirm_text = render_text(self.fonts['medium'], "Confirm Dice", True, self.colors['WHITE'])
         else:
             pygame.draw.rect(screen, self.colors['LIGHT_GRAY'], self.confirm_button, border_radius=10)
             pygame.draw.rect(screen, self.colors['BLACK'], self.confirm_button, 3, border_radius=10)
-            confirm_text = self.fonts['medium'].render("Select 3 Dice Each", True, self.colors['BLACK'])
+            confirm_text = render_text(self.fonts['medium'], "Select 3 Dice Each", True, self.colors['BLACK'])
 
         confirm_text_rect = confirm_text.get_rect(center=self.confirm_button.center)
         screen.blit(confirm_text, confirm_text_rect)
\ No newline at end of file
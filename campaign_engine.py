@@ -0,0 +1,431 @@
+from battle_state import BossState, PlayerState, TurnState
+from game_random import GameRandom
+from board import TILE_GREEN, TILE_RED, TILE_YELLOW, generate_board
+from battle_engine import (BOARD_SIZE, NUM_GREEN_TILES, NUM_RED_TILES, DEBUFF_DAMAGE, GREEN_TILE_HEAL, BOSS_MAX_HP,
+                           BOSS_INITIAL_DAMAGE, BOSS_DAMAGE_INCREMENT, POISON_STACKS_APPLIED, BURN_STACKS_APPLIED,
+                           BURN_DAMAGE_PER_STACK, CHAIN_LIGHTNING_INITIAL_DAMAGE, CHAIN_LIGHTNING_DOT_DAMAGE,
+                           CHAIN_LIGHTNING_TURNS, MAX_BATTLE_TURNS)
+from characters import create_character
+from landing_table import landing_tile, laps_crossed
+
+# Yellow tile effect and tile count each character brings to a campaign
+CAMPAIGN_YELLOW_EFFECTS = {
+    'Lapper': ('double_movement', 'lightning.png', 1),
+    'Huntsman': ('poison_5', 'poison.png', 4)
+}
+
+
+def create_campaign_character(character_name, dice_keys):
+    """
+    Create a character set up for the campaign
+
+    Args:
+        character_name: Name of the character (e.g., 'Lapper')
+        dice_keys: Three DICE_LIBRARY keys chosen in CampaignDiceSelect
+
+    Returns:
+        Character instance with its dice and campaign yellow tile effect set
+    """
+    character = create_character(character_name)
+    character.set_dice(dice_keys)
+    if character_name in CAMPAIGN_YELLOW_EFFECTS:
+        effect, icon, num_tiles = CAMPAIGN_YELLOW_EFFECTS[character_name]
+        character.set_yellow_effect(effect, icon)
+        character.num_yellow_tiles = num_tiles
+    return character
+
+
+class CampaignEngine:
+    def __init__(self, character_1, character_2, green_tiles=None, red_tiles=None, yellow_tiles=None,
+                 board_size=BOARD_SIZE, rng=None):
+        """
+        Initialize a two-character campaign battle against the boss
+
+        Each turn one character moves first, the other moves second, and once
+        both have landed the boss attacks the character who moved second.
+
+        Args:
+            character_1: First character (dice and yellow effect already set)
+            character_2: Second character (dice and yellow effect already set)
+            green_tiles: List of green tile numbers (random if None)
+            red_tiles: List of red tile numbers (random if None)
+            yellow_tiles: List of yellow tile numbers in placement order (placement phase if None)
+            board_size: Number of tiles on the board
+            rng: GameRandom stream for the board and dice rolls (new random seed if None)
+        """
+        self.character_1 = character_1
+        self.character_2 = character_2
+        self.board_size = board_size
+        self.rng = rng if rng is not None else GameRandom()
+        self.reset(green_tiles, red_tiles, yellow_tiles)
+
+    def reset(self, green_tiles=None, red_tiles=None, yellow_tiles=None):
+        """Reset battle state for a new campaign battle"""
+        self.character_1_state = PlayerState(self.character_1)
+        self.character_2_state = PlayerState(self.character_2)
+        self.character_states = [self.character_1_state, self.character_2_state]
+        self.boss = BossState(BOSS_MAX_HP, BOSS_INITIAL_DAMAGE)
+
+        # Turn phases: "choose_first", "character_1_second", "character_2_second", "boss_attack"
+        # Yellow tiles are placed first (character 1's tiles, then character 2's)
+        self.turn = TurnState(self.character_1.num_yellow_tiles + self.character_2.num_yellow_tiles,
+                              turn_phase="choose_first")
+        self.last_character_to_move = None  # Character who moved second gets attacked by the boss
+        self.winner = None
+
+        # Generate board tiles
+        self.board = generate_board(NUM_GREEN_TILES, NUM_RED_TILES, self.board_size, green_tiles, red_tiles,
+                                    self.rng)
+        for tile in yellow_tiles or []:
+            self.place_yellow_tile(tile)
+
+    @property
+    def green_tiles(self):
+        """List of green tile numbers"""
+        return self.board.green_tiles
+
+    @property
+    def red_tiles(self):
+        """List of red tile numbers"""
+        return self.board.red_tiles
+
+    @property
+    def yellow_tiles(self):
+        """List of yellow tile numbers in placement order"""
+        return self.board.yellow_tiles
+
+    # ===== YELLOW TILE PLACEMENT =====
+    def is_empty_tile(self, tile_number):
+        """Check if a tile is not green, red or already yellow"""
+        return self.board.is_empty(tile_number)
+
+    def place_yellow_tile(self, tile_number):
+        """
+        Place the next yellow tile
+
+        Args:
+            tile_number: Tile number (1-24) to place the yellow tile on
+
+        Returns:
+            True if the tile was placed, False if the tile is not empty or placement is over
+        """
+        if self.turn.battle_phase != "place_yellow":
+            return False
+
+        # Determine which character's tile this is based on placement order
+        if self.turn.yellow_tiles_placed < self.character_1.num_yellow_tiles:
+            effect = self.character_1.yellow_tile_effect()
+        else:
+            effect = self.character_2.yellow_tile_effect()
+
+        if not self.board.place_yellow(tile_number, effect):
+            return False
+        self.turn.yellow_tiles_placed += 1
+
+        if self.turn.yellow_tiles_placed >= self.turn.yellow_tiles_to_place:
+            self.turn.battle_phase = "rolling"
+        return True
+
+    def place_random_yellow_tiles(self):
+        """Place all remaining yellow tiles on random empty tiles"""
+        empty_tiles = self.board.empty_tiles()
+        remaining = self.turn.yellow_tiles_to_place - self.turn.yellow_tiles_placed
+        for tile in self.rng.sample(empty_tiles, min(remaining, len(empty_tiles))):
+            self.place_yellow_tile(tile)
+        self.turn.battle_phase = "rolling"
+
+    # ===== ROLLING AND MOVEMENT =====
+    def is_alive(self, char_index):
+        """Check if a character still has HP"""
+        return self.character_states[char_index].current_hp > 0
+
+    def can_roll(self, char_index):
+        """Check if a character's dice can be clicked in the current turn phase"""
+        if self.turn.battle_phase != "rolling" or self.winner is not None or not self.is_alive(char_index):
+            return False
+        if self.character_states[char_index].is_moving:
+            return False
+        if self.turn.turn_phase == "choose_first":
+            return True
+        return self.turn.turn_phase == f"character_{char_index + 1}_second"
+
+    def roll(self, char_index, dice_index, value=None):
+        """
+        Roll one of a character's dice and start moving
+
+        Args:
+            char_index: 0 for character 1, 1 for character 2
+            dice_index: Index (0-2) of the dice that was clicked
+            value: Face to use instead of rolling (for trying each outcome in a lookahead)
+
+        Returns:
+            The rolled dice value, or None if that character can't roll now
+        """
+        if not self.can_roll(char_index):
+            return None
+
+        state = self.character_states[char_index]
+        other_index = 1 - char_index
+        if self.turn.turn_phase == "choose_first" and self.is_alive(other_index):
+            # The other character must go second
+            self.turn.turn_phase = f"character_{other_index + 1}_second"
+        else:
+            # Moving second (or alone, when the other character is dead) - the boss attacks this character
+            self.last_character_to_move = state
+            self.turn.turn_phase = "boss_attack"
+
+        if value is None:
+            value = self.rng.choice(state.character.dice_sets[dice_index])
+        state.dice_values[dice_index] = value
+        state.moves_remaining = value
+        state.is_moving = True
+        return value
+
+    def step(self, char_index):
+        """
+        Move a character a single tile in the direction of its roll
+
+        Resolves the landing tile once movement is complete, and the boss
+        attack once both characters have landed.
+
+        Returns:
+            True if the character is still moving, False otherwise
+        """
+        state = self.character_states[char_index]
+        if not state.is_moving:
+            return False
+
+        old_position = state.position
+        board_size = self.board.size
+        if state.moves_remaining > 0:
+            state.position += 1
+            state.moves_remaining -= 1
+        elif state.moves_remaining < 0:
+            state.position -= 1
+            state.moves_remaining += 1
+
+        # Check for lap completion
+        if old_position == board_size and state.position > board_size:
+            self._complete_lap(state)
+
+        # Wrap around board
+        if state.position > board_size:
+            state.position = 1
+        elif state.position < 1:
+            state.position = board_size
+
+        if state.moves_remaining == 0:
+            state.is_moving = False
+            self._resolve_landing(state)
+            self._resolve_boss_attack()
+        return state.is_moving
+
+    def resolve_turn(self):
+        """Finish every movement instantly and resolve landings and the boss attack"""
+        # The character who moved first lands first, as boss damage goes up with every landing
+        second = self.last_character_to_move if self.turn.turn_phase == "boss_attack" else None
+        for state in sorted(self.character_states, key=lambda state: state is second):
+            if not state.is_moving:
+                continue
+            moves = state.moves_remaining
+            for _ in range(laps_crossed(state.position, moves, self.board.size)):
+                self._complete_lap(state)
+            state.position = landing_tile(state.position, moves, self.board.size)
+            state.moves_remaining = 0
+            state.is_moving = False
+            self._resolve_landing(state)
+        self._resolve_boss_attack()
+
+    def _complete_lap(self, state):
+        """Count a lap and deal the character's lap damage"""
+        state.laps_completed += 1
+        self.boss.current_hp -= state.character.get_lap_damage(state.laps_completed)
+
+    def _resolve_landing(self, state):
+        """Apply the effect of the tile a character landed on"""
+        position = state.position
+        character = state.character
+        tile_type = self.board.tile_types[position]
+        boss = self.boss
+
+        if tile_type == TILE_GREEN:
+            # Heal and clear debuffs
+            state.current_hp = min(state.max_hp, state.current_hp + GREEN_TILE_HEAL)
+            state.debuff_stacks = 0
+
+        elif tile_type == TILE_RED:
+            state.debuff_stacks += 1
+
+        elif tile_type == TILE_YELLOW:
+            # Huntsman's yellow tile bonus damage, then this specific tile's effect
+            boss.current_hp -= character.get_yellow_tile_damage()
+
+            effect = self.board.yellow_effect(position)
+            if effect == "double_movement":
+                state.yellow_buff_active = True
+            elif effect == "poison_5":
+                boss.poison_stacks += POISON_STACKS_APPLIED
+                boss.current_hp -= boss.poison_stacks
+            elif effect == "burning_strike":
+                boss.burn_stacks += BURN_STACKS_APPLIED
+            elif effect == "lifesteal":
+                self.turn.lifesteal_active = True
+            elif effect == "chain_lightning":
+                boss.current_hp -= CHAIN_LIGHTNING_INITIAL_DAMAGE
+                boss.chain_lightning_stacks = CHAIN_LIGHTNING_TURNS
+
+        else:
+            # Normal tile - deal damage to boss, take boss damage
+            damage_dealt = character.base_damage
+            boss.current_hp -= damage_dealt
+
+            if self.turn.lifesteal_active:
+                state.current_hp = min(state.max_hp, state.current_hp + damage_dealt)
+                self.turn.lifesteal_active = False
+
+            state.current_hp -= boss.current_damage
+            boss.attack_count += 1
+            boss.current_damage = BOSS_INITIAL_DAMAGE + (boss.attack_count * BOSS_DAMAGE_INCREMENT)
+
+    def _resolve_boss_attack(self):
+        """End the turn once both characters have landed after the second one rolled"""
+        if self.turn.turn_phase != "boss_attack":
+            return
+        if self.character_1_state.is_moving or self.character_2_state.is_moving:
+            return
+
+        boss = self.boss
+
+        # Debuff damage to both characters
+        for state in self.character_states:
+            if state.debuff_stacks > 0:
+                state.current_hp -= DEBUFF_DAMAGE * state.debuff_stacks
+
+        # Poison ticks down, burn doesn't decay, chain lightning ticks down
+        if boss.poison_stacks > 0:
+            boss.current_hp -= boss.poison_stacks
+            boss.poison_stacks -= 1
+        if boss.burn_stacks > 0:
+            boss.current_hp -= boss.burn_stacks * BURN_DAMAGE_PER_STACK
+        if boss.chain_lightning_stacks > 0:
+            boss.current_hp -= CHAIN_LIGHTNING_DOT_DAMAGE
+            boss.chain_lightning_stacks -= 1
+
+        # Boss attacks the character who moved second
+        if self.last_character_to_move:
+            self.last_character_to_move.current_hp -= boss.current_damage
+
+        self.turn.turns_taken += 1
+        if boss.current_hp <= 0:
+            self.winner = "player"
+        elif not self.is_alive(0) and not self.is_alive(1):
+            self.winner = "boss"
+
+        self.turn.turn_phase = "choose_first"
+
+    # ===== SNAPSHOTS =====
+    def snapshot(self):
+        """
+        Save the battle state so moves can be tried and rolled back
+
+        Like BattleEngine.snapshot(), only changing values are copied and the
+        characters, dice lists and rng are left out.
+
+        Returns:
+            Snapshot to pass to restore()
+        """
+        last_index = None
+        if self.last_character_to_move is not None:
+            last_index = self.character_states.index(self.last_character_to_move)
+        return (self.character_1_state.pack(), self.character_2_state.pack(), self.boss.pack(), self.turn.pack(),
+                self.board.pack(), self.winner, last_index)
+
+    def restore(self, snapshot):
+        """
+        Put the battle back into the state of a snapshot()
+
+        Args:
+            snapshot: Snapshot taken from this engine
+        """
+        character_1, character_2, boss, turn, board, self.winner, last_index = snapshot
+        self.character_1_state.unpack(character_1)
+        self.character_2_state.unpack(character_2)
+        self.boss.unpack(boss)
+        self.turn.unpack(turn)
+        self.board.unpack(board)
+        self.last_character_to_move = None if last_index is None else self.character_states[last_index]
+
+    # ===== BATTLE RESULT =====
+    def is_over(self):
+        """Check if the battle has been decided"""
+        return self.winner is not None
+
+    def play_turn(self, first_index, first_dice, second_dice):
+        """
+        Play a whole turn instantly
+
+        Args:
+            first_index: Index of the character moving first
+            first_dice: Dice index rolled by the first character
+            second_dice: Dice index rolled by the second character (ignored if it is dead)
+        """
+        self.roll(first_index, first_dice)
+        self.roll(1 - first_index, second_dice)
+        self.resolve_turn()
+
+    def play_battle(self, policy=None, max_turns=MAX_BATTLE_TURNS):
+        """
+        Play the rest of the battle instantly
+
+        Args:
+            policy: Function taking the engine and returning (first_index, first_dice, second_dice)
+                    (random order and dice if None)
+            max_turns: Give up after this many turns
+
+        Returns:
+            'player', 'boss', or None if max_turns was reached
+        """
+        if self.turn.battle_phase == "place_yellow":
+            self.place_random_yellow_tiles()
+
+        while self.winner is None and self.turn.turns_taken < max_turns:
+            if policy:
+                first_index, first_dice, second_dice = policy(self)
+            else:
+                alive = [i for i in (0, 1) if self.is_alive(i)]
+                first_index = self.rng.choice(alive)
+                first_dice = self.rng.randrange(len(self.character_states[first_index].character.dice_sets))
+                second_dice = self.rng.randrange(len(self.character_states[1 - first_index].character.dice_sets))
+            self.play_turn(first_index, first_dice, second_dice)
+        return self.winner
+
+
+def simulate_campaign_battles(team, num_battles, policy=None, max_turns=MAX_BATTLE_TURNS, seed=None):
+    """
+    Simulate many campaign battles for a team
+
+    Args:
+        team: Two (character_name, dice_keys) tuples
+        num_battles: Number of battles to simulate
+        policy: Turn policy passed to CampaignEngine.play_battle (random if None)
+        max_turns: Battles still running after this many turns count as neither win nor loss
+        seed: Seed for the battles, each of which gets its own stream (random if None)
+
+    Returns:
+        Dictionary with 'wins', 'losses' and 'turns' (list of turns taken by each battle)
+    """
+    rng = GameRandom(seed)
+    (name_1, dice_1), (name_2, dice_2) = team
+    character_1 = create_campaign_character(name_1, dice_1)
+    character_2 = create_campaign_character(name_2, dice_2)
+
+    wins = 0
+    losses = 0
+    turns = []
+    for _ in range(num_battles):
+        engine = CampaignEngine(character_1, character_2, rng=rng.spawn())
+        winner = engine.play_battle(policy, max_turns)
+        wins += winner == "player"
+        losses += winner == "boss"
+        turns.append(engine.turn.turns_taken)
+    return {'wins': wins, 'losses': losses, 'turns': turns}
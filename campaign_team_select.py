@@ -1,4 +1,6 @@
 import pygame
+from hit_test import SpatialHash
+from text_cache import render_text
 
 
 class CampaignTeamSelect:
@@ -53,6 +55,14 @@ class CampaignTeamSelect:
         confirm_y = 720
         self.confirm_button = pygame.Rect(confirm_x, confirm_y, confirm_width, confirm_height)
 
+        # Hit test values: ('character', character), ('slot', slot number) or ('confirm', None)
+        self.hit_test = SpatialHash()
+        for button_rect, character in self.character_buttons:
+            self.hit_test.add(button_rect, ('character', character))
+        self.hit_test.add(self.slot_1_rect, ('slot', 1))
+        self.hit_test.add(self.slot_2_rect, ('slot', 2))
+        self.hit_test.add(self.confirm_button, ('confirm', None))
+
     def handle_click(self, mouse_pos):
         """
         Check if a character or confirm button was clicked
@@ -64,29 +74,27 @@ class CampaignTeamSelect:
             Tuple of (character_1, character_2) if confirm clicked and both slots filled
             None otherwise
         """
-        # Check character buttons
-        for button_rect, character in self.character_buttons:
-            if button_rect.collidepoint(mouse_pos):
-                # Assign to first empty slot
-                if self.selected_slot_1 is None:
-                    self.selected_slot_1 = character
-                elif self.selected_slot_2 is None:
-                    # Don't allow same character twice
-                    if character.name != self.selected_slot_1.name:
-                        self.selected_slot_2 = character
-                return None
-
-        # Check slot clicks (to deselect)
-        if self.slot_1_rect.collidepoint(mouse_pos):
-            self.selected_slot_1 = None
-            return None
-
-        if self.slot_2_rect.collidepoint(mouse_pos):
-            self.selected_slot_2 = None
-            return None
-
-        # Check confirm button
-        if self.confirm_button.collidepoint(mouse_pos):
+        kind, value = self.hit_test.hit(mouse_pos, (None, None))
+
+        # Character buttons
+        if kind == 'character':
+            # Assign to first empty slot
+            if self.selected_slot_1 is None:
+                self.selected_slot_1 = value
+            elif self.selected_slot_2 is None:
+                # Don't allow same character twice
+                if value.name != self.selected_slot_1.name:
+                    self.selected_slot_2 = value
+
+        # Slot clicks (to deselect)
+        elif kind == 'slot':
+            if value == 1:
+                self.selected_slot_1 = None
+            else:
+                self.selected_slot_2 = None
+
+        # Confirm button
+        elif kind == 'confirm':
             if self.selected_slot_1 is not None and self.selected_slot_2 is not None:
                 return (self.selected_slot_1, self.selected_slot_2)
 
@@ -102,7 +110,7 @@ class CampaignTeamSelect:
         screen.fill(self.colors['WHITE'])
 
         # Draw title
-        title = self.fonts['large'].render("Select Your Team", True, self.colors['BLACK'])
+        title = render_text(self.fonts['large'], "Select Your Team", True, self.colors['BLACK'])
         title_rect = title.get_rect(center=(self.screen_width // 2, 80))
         screen.blit(title, title_rect)
 
@@ -113,7 +121,7 @@ class CampaignTeamSelect:
             pygame.draw.rect(screen, self.colors['BLACK'], button_rect, 3, border_radius=10)
 
             # Draw character name
-            name_text = self.fonts['medium'].render(character.name, True, self.colors['BLACK'])
+            name_text = render_text(self.fonts['medium'], character.name, True, self.colors['BLACK'])
             name_rect = name_text.get_rect(center=(button_rect.centerx, button_rect.centery))
             screen.blit(name_text, name_rect)
 
@@ -121,7 +129,7 @@ class CampaignTeamSelect:
             passive_lines = self._wrap_text(character.passive_description, self.fonts['small'], button_rect.width - 20)
             y_offset = button_rect.centery + 40
             for line in passive_lines:
-                passive_text = self.fonts['small'].render(line, True, self.colors['BLACK'])
+                passive_text = render_text(self.fonts['small'], line, True, self.colors['BLACK'])
                 passive_rect = passive_text.get_rect(center=(button_rect.centerx, y_offset))
                 screen.blit(passive_text, passive_rect)
                 y_offset += 25
@@ -130,7 +138,8 @@ class CampaignTeamSelect:
         slot_color = self.colors['GREEN'] if self.selected_slot_1 else self.colors['LIGHT_GRAY']
         pygame.draw.rect(screen, slot_color, self.slot_1_rect, border_radius=10)
         pygame.draw.rect(screen, self.colors['BLACK'], self.slot_1_rect, 3, border_radius=10)
-        slot_1_text = self.fonts['medium'].render(
+        slot_1_text = render_text(
+            self.fonts['medium'],
             f"Slot 1: {self.selected_slot_1.name if self.selected_slot_1 else 'Empty'}",
             True,
             self.colors['BLACK']
@@ -142,7 +151,8 @@ class CampaignTeamSelect:
         slot_color = self.colors['GREEN'] if self.selected_slot_2 else self.colors['LIGHT_GRAY']
         pygame.draw.rect(screen, slot_color, self.slot_2_rect, border_radius=10)
         pygame.draw.rect(screen, self.colors['BLACK'], self.slot_2_rect, 3, border_radius=10)
-        slot_2_text = self.fonts['medium'].render(
+        slot_2_text = render_text(
+            self.fonts['medium'],
             f"Slot 2: {self.selected_slot_2.name if self.selected_slot_2 else 'Empty'}",
             True,
             self.colors['BLACK']
@@ -154,14 +164,14 @@ class CampaignTeamSelect:
         if self.selected_slot_1 and self.selected_slot_2:
             pygame.draw.rect(screen, self.colors['BLUE'], self.confirm_button, border_radius=10)
             pygame.draw.rect(screen, self.colors['BLACK'], self.confirm_button, 3, border_radius=10)
-            confirm_text = self.fonts['medium'].render("Confirm Team", True, self.colors['WHITE'])
+            confirm_text = render_text(self.fonts['medium'], "Confirm Team", True, self.colors['WHITE'])
             confirm_text_rect = confirm_text.get_rect(center=self.confirm_button.center)
             screen.blit(confirm_text, confirm_text_rect)
         else:
             # Draw grayed out button
             pygame.draw.rect(screen, self.colors['LIGHT_GRAY'], self.confirm_button, border_radius=10)
             pygame.draw.rect(screen, self.colors['BLACK'], self.confirm_button, 3, border_radius=10)
-            confirm_text = self.fonts['medium'].render("Select 2 Characters", True, self.colors['BLACK'])
+            confirm_text = render_text(self.fonts['medium'], "Select 2 Characters", True, self.colors['BLACK'])
             confirm_text_rect = confirm_text.get_rect(center=self.confirm_button.center)
             screen.blit(confirm_text, confirm_text_rect)
 
@@ -1,4 +1,6 @@
 import pygame
+from hit_test import SpatialHash
+from text_cache import render_text
 
 class CharacterSelect:
     def __init__(self, screen_width, screen_height, colors, fonts, characters):
@@ -20,6 +22,7 @@ class CharacterSelect:
 
         # Create character selection buttons
         self.character_buttons = []
+        self.hit_test = SpatialHash()
         button_width = 250
         button_height = 150
         spacing = 50
@@ -31,6 +34,7 @@ class CharacterSelect:
             button_x = start_x + (i * (button_width + spacing))
             button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
             self.character_buttons.append((button_rect, character))
+            self.hit_test.add(button_rect, character)
 
     def handle_click(self, mouse_pos):
         """
@@ -42,10 +46,7 @@ class CharacterSelect:
         Returns:
             Selected character instance if clicked, None otherwise
         """
-        for button_rect, character in self.character_buttons:
-            if button_rect.collidepoint(mouse_pos):
-                return character
-        return None
+        return self.hit_test.hit(mouse_pos)
 
     def draw(self, screen):
         """
@@ -57,7 +58,7 @@ class CharacterSelect:
         screen.fill(self.colors['WHITE'])
 
         # Draw title
-        title = self.fonts['large'].render("Choose Your Character", True, self.colors['BLACK'])
+        title = render_text(self.fonts['large'], "Choose Your Character", True, self.colors['BLACK'])
         title_rect = title.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 200))
         screen.blit(title, title_rect)
 
@@ -68,22 +69,23 @@ class CharacterSelect:
             pygame.draw.rect(screen, self.colors['BLACK'], button_rect, 3, border_radius=10)
 
             # Draw character name
-            name_text = self.fonts['medium'].render(character.name, True, self.colors['BLACK'])
+            name_text = render_text(self.fonts['medium'], character.name, True, self.colors['BLACK'])
             name_rect = name_text.get_rect(center=(button_rect.centerx, button_rect.centery - 40))
             screen.blit(name_text, name_rect)
 
             # Draw character stats (HP)
-            hp_text = self.fonts['small'].render(f"HP: {character.max_hp}", True, self.colors['BLACK'])
+            hp_text = render_text(self.fonts['small'], f"HP: {character.max_hp}", True, self.colors['BLACK'])
             hp_rect = hp_text.get_rect(center=(button_rect.centerx, button_rect.centery))
             screen.blit(hp_text, hp_rect)
 
             # Draw character damage
-            damage_text = self.fonts['small'].render(f"Damage: {character.base_damage}", True, self.colors['BLACK'])
+            damage_text = render_text(self.fonts['small'], f"Damage: {character.base_damage}", True,
+                                      self.colors['BLACK'])
             damage_rect = damage_text.get_rect(center=(button_rect.centerx, button_rect.centery + 25))
             screen.blit(damage_text, damage_rect)
 
             # Draw dice info
             dice_info = " | ".join(character.dice_labels)
-            dice_text = self.fonts['small'].render(dice_info, True, self.colors['DARK_BLUE'])
+            dice_text = render_text(self.fonts['small'], dice_info, True, self.colors['DARK_BLUE'])
             dice_rect = dice_text.get_rect(center=(button_rect.centerx, button_rect.centery + 50))
             screen.blit(dice_text, dice_rect)
\ No newline at end of file
@@ -29,6 +29,17 @@ class Character:
         """Get bonus damage when landing on yellow tiles - can be overridden by subclasses"""
         return 0
 
+    def set_dice(self, dice_keys):
+        """Replace the character's dice with dice from DICE_LIBRARY"""
+        self.dice_sets = []
+        self.dice_labels = []
+        self.dice_damage = []
+        for dice_key in dice_keys:
+            dice_data = DICE_LIBRARY[dice_key]
+            self.dice_sets.append(dice_data['values'])
+            self.dice_labels.append(dice_data['label'])
+            self.dice_damage.append(dice_data['damage'])
+
 
 class Lapper(Character):
     def __init__(self):
@@ -201,4 +212,58 @@ def get_available_dice(character_name):
         allowed = dice_data.get('allowed_for', [])
         if 'all' in allowed or character_name in allowed:
             available[dice_key] = dice_data
-    return available
\ No newline at end of file
+    return available
+
+
+# ===== YELLOW TILE OPTIONS =====
+# Effects offered by the yellow tile select screen
+
+YELLOW_TILE_OPTIONS = [
+    {
+        'name': 'Double Movement',
+        'description': 'Next roll moves 2x distance',
+        'icon': 'lightning.png',
+        'effect': 'double_movement',
+        'num_tiles': 1
+    },
+    {
+        'name': 'Poison Strike',
+        'description': 'Apply 5 poison stacks',
+        'icon': 'poison.png',
+        'effect': 'poison_5',
+        'num_tiles': 4
+    },
+    {
+        'name': 'Burning Strike',
+        'description': '3 burn stacks (3 dmg/turn)',
+        'icon': 'burn.png',
+        'effect': 'burning_strike',
+        'num_tiles': 2
+    },
+    {
+        'name': 'Lifesteal',
+        'description': 'Damage + heal for same amount',
+        'icon': 'lifesteal.png',
+        'effect': 'lifesteal',
+        'num_tiles': 3
+    },
+    {
+        'name': 'Chain Lightning',
+        'description': '20 dmg now, 10 dmg next 2 turns',
+        'icon': 'chainlightning.png',
+        'effect': 'chain_lightning',
+        'num_tiles': 3
+    }
+]
+
+
+# ===== CHARACTER CLASSES =====
+CHARACTER_CLASSES = {
+    'Lapper': Lapper,
+    'Huntsman': Huntsman
+}
+
+
+def create_character(character_name):
+    """Create a fresh instance of a character by name"""
+    return CHARACTER_CLASSES[character_name]()
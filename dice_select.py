@@ -1,6 +1,8 @@
 import pygame
 import os
 from characters import get_available_dice
+from hit_test import SpatialHash
+from text_cache import render_text
 
 
 class DiceSelect:
@@ -38,6 +40,12 @@ class DiceSelect:
         confirm_y = screen_height - 100
         self.confirm_button = pygame.Rect(confirm_x, confirm_y, confirm_width, confirm_height)
 
+        # Hit test values: ('confirm', None) or ('dice', dice_key)
+        self.hit_test = SpatialHash()
+        self.hit_test.add(self.confirm_button, ('confirm', None))
+        for button_rect, dice_key, _ in self.dice_buttons:
+            self.hit_test.add(button_rect, ('dice', dice_key))
+
     def _create_dice_buttons(self):
         """Create button rectangles for each available dice"""
         button_width = 180
@@ -73,20 +81,20 @@ class DiceSelect:
         Returns:
             List of selected dice if confirmed, None otherwise
         """
+        kind, dice_key = self.hit_test.hit(mouse_pos, (None, None))
+
         # Check if confirm button clicked
-        if self.confirm_button.collidepoint(mouse_pos) and len(self.selected_dice) == 3:
+        if kind == 'confirm' and len(self.selected_dice) == 3:
             return self.selected_dice
 
         # Check if a dice button was clicked
-        for button_rect, dice_key, dice_data in self.dice_buttons:
-            if button_rect.collidepoint(mouse_pos):
-                if dice_key in self.selected_dice:
-                    # Deselect if already selected
-                    self.selected_dice.remove(dice_key)
-                elif len(self.selected_dice) < 3:
-                    # Select if not at limit
-                    self.selected_dice.append(dice_key)
-                break
+        if kind == 'dice':
+            if dice_key in self.selected_dice:
+                # Deselect if already selected
+                self.selected_dice.remove(dice_key)
+            elif len(self.selected_dice) < 3:
+                # Select if not at limit
+                self.selected_dice.append(dice_key)
 
         return None
 
@@ -100,13 +108,13 @@ class DiceSelect:
         screen.fill(self.colors['WHITE'])
 
         # Draw title
-        title = self.fonts['large'].render(f"{self.character.name}: Select 3 Dice", True, self.colors['BLACK'])
+        title = render_text(self.fonts['large'], f"{self.character.name}: Select 3 Dice", True, self.colors['BLACK'])
         title_rect = title.get_rect(center=(self.screen_width // 2, 50))
         screen.blit(title, title_rect)
 
         # Draw subtitle
         subtitle_text = f"Selected: {len(self.selected_dice)}/3"
-        subtitle = self.fonts['medium'].render(subtitle_text, True, self.colors['BLACK'])
+        subtitle = render_text(self.fonts['medium'], subtitle_text, True, self.colors['BLACK'])
         subtitle_rect = subtitle.get_rect(center=(self.screen_width // 2, 100))
         screen.blit(subtitle, subtitle_rect)
 
@@ -130,26 +138,26 @@ class DiceSelect:
             pygame.draw.rect(screen, border_color, button_rect, border_width, border_radius=10)
 
             # Draw dice label
-            label_text = self.fonts['medium'].render(dice_data['label'], True, self.colors['BLACK'])
+            label_text = render_text(self.fonts['medium'], dice_data['label'], True, self.colors['BLACK'])
             label_rect = label_text.get_rect(center=(button_rect.centerx, button_rect.centery - 30))
             screen.blit(label_text, label_rect)
 
             # Draw dice values preview (show unique values)
             unique_values = sorted(set(dice_data['values']))
             values_str = ', '.join(map(str, unique_values))
-            values_text = self.fonts['small'].render(values_str, True, self.colors['BLACK'])
+            values_text = render_text(self.fonts['small'], values_str, True, self.colors['BLACK'])
             values_rect = values_text.get_rect(center=(button_rect.centerx, button_rect.centery))
             screen.blit(values_text, values_rect)
 
             # Draw damage
-            damage_text = self.fonts['small'].render(f"Dmg: {dice_data['damage']}", True, self.colors['BLACK'])
+            damage_text = render_text(self.fonts['small'], f"Dmg: {dice_data['damage']}", True, self.colors['BLACK'])
             damage_rect = damage_text.get_rect(center=(button_rect.centerx, button_rect.centery + 25))
             screen.blit(damage_text, damage_rect)
 
             # Draw selection number if selected
             if is_selected:
                 selection_num = self.selected_dice.index(dice_key) + 1
-                num_text = self.fonts['large'].render(str(selection_num), True, self.colors['WHITE'])
+                num_text = render_text(self.fonts['large'], str(selection_num), True, self.colors['WHITE'])
                 num_rect = num_text.get_rect(topright=(button_rect.right - 10, button_rect.top + 10))
                 screen.blit(num_text, num_rect)
 
@@ -164,6 +172,6 @@ class DiceSelect:
         pygame.draw.rect(screen, button_color, self.confirm_button, border_radius=10)
         pygame.draw.rect(screen, self.colors['BLACK'], self.confirm_button, 3, border_radius=10)
 
-        confirm_text = self.fonts['medium'].render("Confirm Selection", True, text_color)
+        confirm_text = render_text(self.fonts['medium'], "Confirm Selection", True, text_color)
         confirm_rect = confirm_text.get_rect(center=self.confirm_button.center)
         screen.blit(confirm_text, confirm_rect)
\ No newline at end of file
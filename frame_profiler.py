@@ -0,0 +1,180 @@
+import csv
+import time
+from collections import deque
+import pygame
+
+# Frame loop phases, then the BattleRenderer draw calls timed inside the draw phase
+LOOP_PHASES = ['events', 'logic', 'draw', 'display']
+RENDERER_PHASES = ['draw_board', 'draw_player', 'draw_boss', 'draw_dice', 'draw_campaign_dice', 'draw_game_info']
+
+DEFAULT_HISTORY = 3600  # Frames kept for CSV dumps (a minute at 60 fps)
+DEFAULT_WINDOW = 300  # Frames the overlay statistics and graph cover
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list (0.0 if empty)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    def __init__(self, history=DEFAULT_HISTORY, window=DEFAULT_WINDOW):
+        """
+        Per-frame timings of the main loop phases and the battle renderer's draw calls
+
+        Each frame is one sample of milliseconds per phase plus 'frame', the
+        total work time (sleeping in clock.tick or event.wait isn't counted).
+        Draw calls are timed by wrapping the renderer's methods while
+        instrumented, so the renderer itself has no profiling code.
+
+        Args:
+            history: Number of frames kept for dump_csv
+            window: Number of recent frames the overlay statistics and graph use
+        """
+        self.samples = deque(maxlen=history)
+        self.window = window
+        self.frames_recorded = 0
+        self._current = None
+        self._frame_start = 0.0
+        self._instrumented = []  # (object, method name) pairs wrapped by instrument()
+
+    # ===== RECORDING =====
+    def start_frame(self):
+        """Begin timing a new frame"""
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def add(self, phase, seconds):
+        """Add time to a phase of the current frame"""
+        if self._current is not None:
+            self._current[phase] = self._current.get(phase, 0.0) + seconds * 1000
+
+    def time_phase(self, phase, function, *args):
+        """Call a function and add its run time to a phase, returning its result"""
+        start = time.perf_counter()
+        result = function(*args)
+        self.add(phase, time.perf_counter() - start)
+        return result
+
+    def end_frame(self):
+        """Finish the current frame and store its sample"""
+        if self._current is None:
+            return
+        self._current['frame'] = (time.perf_counter() - self._frame_start) * 1000
+        self.samples.append(self._current)
+        self.frames_recorded += 1
+        self._current = None
+
+    def instrument(self, renderer, method_names=RENDERER_PHASES):
+        """Time calls to the renderer's draw methods as phases of their own name"""
+        for name in method_names:
+            if not hasattr(renderer, name) or (renderer, name) in self._instrumented:
+                continue
+            method = getattr(renderer, name)
+
+            def timed(*args, _method=method, _name=name, **kwargs):
+                start = time.perf_counter()
+                result = _method(*args, **kwargs)
+                self.add(_name, time.perf_counter() - start)
+                return result
+
+            setattr(renderer, name, timed)  # Instance attribute shadows the class method
+            self._instrumented.append((renderer, name))
+
+    def uninstrument(self):
+        """Remove every wrapper added by instrument()"""
+        for obj, name in self._instrumented:
+            delattr(obj, name)
+        self._instrumented = []
+
+    # ===== STATISTICS =====
+    def phases(self):
+        """List the phases seen so far, loop phases first"""
+        seen = set()
+        for sample in self.samples:
+            seen.update(sample)
+        ordered = ['frame'] + LOOP_PHASES + RENDERER_PHASES
+        return [phase for phase in ordered if phase in seen] + sorted(seen - set(ordered))
+
+    def stats(self, phase):
+        """
+        Get the statistics of one phase over the recent window
+
+        Returns:
+            Dictionary with average, p95 and p99 in milliseconds and the number of frames it ran in
+        """
+        recent = list(self.samples)[-self.window:]
+        values = sorted(sample[phase] for sample in recent if phase in sample)
+        return {
+            'average': sum(values) / len(values) if values else 0.0,
+            'p95': percentile(values, 0.95),
+            'p99': percentile(values, 0.99),
+            'count': len(values)
+        }
+
+    def dump_csv(self, path):
+        """
+        Write every kept sample to a CSV file, one row per frame
+
+        Returns:
+            Number of frames written
+        """
+        phases = self.phases()
+        first_frame = self.frames_recorded - len(self.samples)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame_index'] + [f"{phase}_ms" for phase in phases])
+            for index, sample in enumerate(self.samples):
+                writer.writerow([first_frame + index] + [f"{sample.get(phase, 0.0):.4f}" for phase in phases])
+        return len(self.samples)
+
+    # ===== OVERLAY =====
+    def draw_overlay(self, screen, font):
+        """
+        Draw the statistics table and a frame-time graph in the bottom-right corner
+
+        Text is rendered directly instead of through the text cache - the numbers
+        change every frame and would only evict the game's own strings.
+
+        Returns:
+            Rect covered by the overlay
+        """
+        line_height = font.get_linesize()
+        phases = self.phases()
+        width = 360
+        graph_height = 60
+        height = (len(phases) + 1) * line_height + graph_height + 20
+        panel = pygame.Rect(screen.get_width() - width - 10, screen.get_height() - height - 10, width, height)
+
+        background = pygame.Surface(panel.size, pygame.SRCALPHA)
+        background.fill((0, 0, 0, 190))
+        screen.blit(background, panel)
+
+        x = panel.x + 8
+        y = panel.y + 6
+        header = font.render("phase          avg      p95      p99 (ms)", True, (255, 255, 255))
+        screen.blit(header, (x, y))
+        y += line_height
+        for phase in phases:
+            stats = self.stats(phase)
+            color = (255, 120, 120) if phase == 'frame' and stats['p95'] > FRAME_BUDGET_MS else (200, 255, 200)
+            row = f"{phase:<14}{stats['average']:>6.2f}   {stats['p95']:>6.2f}   {stats['p99']:>6.2f}"
+            screen.blit(font.render(row, True, color), (x, y))
+            y += line_height
+
+        # Frame-time graph with the 60 fps budget as a line
+        graph = pygame.Rect(x, y + 6, width - 16, graph_height)
+        pygame.draw.rect(screen, (80, 80, 80), graph, 1)
+        recent = [sample['frame'] for sample in list(self.samples)[-graph.width:]]
+        scale = graph.height / max(FRAME_BUDGET_MS * 2, max(recent, default=0.0))
+        for i, frame_ms in enumerate(recent):
+            bar_height = max(1, int(frame_ms * scale))
+            color = (255, 90, 90) if frame_ms > FRAME_BUDGET_MS else (90, 200, 255)
+            bar_x = graph.right - len(recent) + i
+            pygame.draw.line(screen, color, (bar_x, graph.bottom - 1), (bar_x, graph.bottom - bar_height))
+        budget_y = graph.bottom - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(screen, (255, 255, 0), (graph.left, budget_y), (graph.right - 1, budget_y))
+        return panel
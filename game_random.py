@@ -0,0 +1,36 @@
+import random
+
+
+class GameRandom(random.Random):
+    def __init__(self, seed=None):
+        """
+        Seedable random number stream that can be split into independent streams
+
+        Boards, dice rolls and random policies all draw from one of these so a
+        battle can be replayed from its seed. Child streams are seeded from the
+        parent seed and their index, so they don't depend on how many numbers
+        the parent or the other children have drawn.
+
+        Args:
+            seed: Integer or string seed (a random seed is picked and kept if None)
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 63)
+        self.seed_value = seed
+        self.streams_spawned = 0
+        super().__init__(seed)
+
+    def spawn(self):
+        """
+        Create the next independent child stream (e.g., one per battle or per worker)
+
+        Returns:
+            GameRandom seeded from this stream's seed and the child's index
+        """
+        child = GameRandom(f"{self.seed_value}/{self.streams_spawned}")
+        self.streams_spawned += 1
+        return child
+
+    def spawn_many(self, count):
+        """Create a list of `count` independent child streams"""
+        return [self.spawn() for _ in range(count)]
@@ -0,0 +1,101 @@
+# Side of the square buckets SpatialHash sorts widgets into (most buttons span one to four)
+DEFAULT_CELL_SIZE = 128
+
+# Bucket keys are row * KEY_STRIDE + column, so lookups don't build tuples
+KEY_STRIDE = 1 << 16
+
+
+class GridHitTest:
+    def __init__(self, positions, square_size):
+        """
+        Find the tile under a point with arithmetic on the board grid
+
+        Every tile from generate_board_positions sits on a grid of
+        square_size cells, so the cell under a point is found by division and
+        looked up in a flat table instead of testing each tile's rect.
+
+        Args:
+            positions: List of (x, y) top-left corners, tile 1 first
+            square_size: Width and height of every tile
+        """
+        self.square_size = square_size
+        self.origin_x = min(x for x, _ in positions)
+        self.origin_y = min(y for _, y in positions)
+        self.columns = (max(x for x, _ in positions) - self.origin_x) // square_size + 1
+        self.rows = (max(y for _, y in positions) - self.origin_y) // square_size + 1
+
+        self.cells = [None] * (self.columns * self.rows)
+        for i, (x, y) in enumerate(positions):
+            column, column_offset = divmod(x - self.origin_x, square_size)
+            row, row_offset = divmod(y - self.origin_y, square_size)
+            if column_offset or row_offset:
+                raise ValueError(f"Tile {i + 1} at {(x, y)} is not on a {square_size} pixel grid")
+            self.cells[row * self.columns + column] = i + 1  # Tiles are 1-indexed
+
+    def hit(self, pos):
+        """
+        Get the tile number at a point
+
+        Args:
+            pos: Tuple of (x, y) position
+
+        Returns:
+            Tile number (1-based) if the point is on a tile, None otherwise
+        """
+        column = (pos[0] - self.origin_x) // self.square_size
+        row = (pos[1] - self.origin_y) // self.square_size
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return self.cells[row * self.columns + column]
+        return None
+
+
+class SpatialHash:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        """
+        Find the widget under a point by bucketing widget rects into grid cells
+
+        A lookup only tests the few rects in the bucket under the point, so it
+        costs the same for a menu with three buttons or three hundred. Where
+        rects overlap, the one added first wins, like scanning a list.
+
+        Args:
+            cell_size: Side of the square buckets in pixels
+        """
+        self.cell_size = cell_size
+        self.buckets = {}  # Bucket key -> list of (rect, value) in the order they were added
+
+    def add(self, rect, value):
+        """
+        Add a widget
+
+        Args:
+            rect: pygame Rect of the widget (not copied - don't move it afterwards)
+            value: Returned by hit() for points inside the rect
+        """
+        size = self.cell_size
+        for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for column in range(rect.left // size, (rect.right - 1) // size + 1):
+                self.buckets.setdefault(row * KEY_STRIDE + column, []).append((rect, value))
+
+    def hit(self, pos, default=None):
+        """
+        Get the value of the widget at a point
+
+        Args:
+            pos: Tuple of (x, y) position
+            default: Returned if no widget contains the point
+
+        Returns:
+            Value the widget was added with, or default
+        """
+        size = self.cell_size
+        bucket = self.buckets.get(pos[1] // size * KEY_STRIDE + pos[0] // size)
+        if bucket is not None:
+            for rect, value in bucket:
+                if rect.collidepoint(pos):
+                    return value
+        return default
+
+    def clear(self):
+        """Remove every widget"""
+        self.buckets.clear()
@@ -0,0 +1,123 @@
+def landing_tile(position, moves, board_size):
+    """
+    Get the tile a token ends on after moving
+
+    Args:
+        position: Starting tile number (1-board_size)
+        moves: Number of tiles to move (negative moves backwards)
+        board_size: Number of tiles on the board
+
+    Returns:
+        Landing tile number (1-board_size)
+    """
+    return (position - 1 + moves) % board_size + 1
+
+
+def laps_crossed(position, moves, board_size):
+    """Number of times a forward move passes from the last tile back to tile 1"""
+    if moves <= 0:
+        return 0
+    return (position - 1 + moves) // board_size
+
+
+class LandingTable:
+    def __init__(self, dice_sets, board_size, dice_labels=None):
+        """
+        Precomputed landing tiles for every dice from every start tile
+
+        Built once per loadout so hover highlights, engines and solvers can
+        look up where a roll can end in O(1) instead of wrapping positions.
+
+        Args:
+            dice_sets: List of dice, each a list of face values
+            board_size: Number of tiles on the board
+            dice_labels: Dice names used by describe() (e.g., ["Risk", "Low", "Heavy"])
+        """
+        self.board_size = board_size
+        self.dice_labels = list(dice_labels) if dice_labels else [f"Dice {i + 1}" for i in range(len(dice_sets))]
+
+        # Each dice as its distinct faces with their probabilities
+        self.faces = []
+        self.probabilities = []
+        for values in dice_sets:
+            faces = sorted(set(values))
+            self.faces.append(tuple(faces))
+            self.probabilities.append(tuple(values.count(face) / len(values) for face in faces))
+
+        # Indexed [dice_index][doubled][position]; position 0 is unused
+        self._outcomes = []
+        self._tile_probabilities = []
+        for faces, probabilities in zip(self.faces, self.probabilities):
+            dice_outcomes = []
+            dice_tile_probabilities = []
+            for multiplier in (1, 2):
+                outcomes_by_position = [()]
+                tile_probabilities_by_position = [{}]
+                for position in range(1, board_size + 1):
+                    outcomes = []
+                    tile_probabilities = {}
+                    for face, probability in zip(faces, probabilities):
+                        moves = face * multiplier
+                        tile = landing_tile(position, moves, board_size)
+                        outcomes.append((tile, laps_crossed(position, moves, board_size), probability))
+                        tile_probabilities[tile] = tile_probabilities.get(tile, 0.0) + probability
+                    outcomes_by_position.append(tuple(outcomes))
+                    # Most likely tiles first
+                    tile_probabilities_by_position.append(
+                        dict(sorted(tile_probabilities.items(), key=lambda item: -item[1])))
+                dice_outcomes.append(outcomes_by_position)
+                dice_tile_probabilities.append(tile_probabilities_by_position)
+            self._outcomes.append(dice_outcomes)
+            self._tile_probabilities.append(dice_tile_probabilities)
+
+    def outcomes(self, dice_index, position, doubled=False):
+        """
+        Get every outcome of rolling a dice
+
+        Args:
+            dice_index: Index of the dice
+            position: Starting tile number
+            doubled: True if double movement is active
+
+        Returns:
+            Tuple of (landing_tile, laps_crossed, probability), one per distinct face in self.faces order
+        """
+        return self._outcomes[dice_index][doubled][position]
+
+    def tile_probabilities(self, dice_index, position, doubled=False):
+        """Get a dictionary of landing tile -> probability, most likely tiles first"""
+        return self._tile_probabilities[dice_index][doubled][position]
+
+    def tiles(self, dice_index, position, doubled=False):
+        """Get the tiles a dice can land on"""
+        return self._tile_probabilities[dice_index][doubled][position].keys()
+
+    def describe(self, dice_index, position, doubled=False):
+        """Describe a dice's landing tiles, e.g. "Risk: 50% tile 23, 50% tile 9" """
+        chances = ", ".join(f"{probability:.0%} tile {tile}"
+                            for tile, probability in self.tile_probabilities(dice_index, position, doubled).items())
+        return f"{self.dice_labels[dice_index]}: {chances}"
+
+
+# Landing tables already built, keyed by loadout
+_landing_tables = {}
+
+
+def get_landing_table(dice_sets, board_size, dice_labels=None):
+    """
+    Get the landing table for a loadout, building it the first time it is needed
+
+    Args:
+        dice_sets: List of dice, each a list of face values
+        board_size: Number of tiles on the board
+        dice_labels: Dice names used by LandingTable.describe()
+
+    Returns:
+        LandingTable instance shared by every caller with the same loadout
+    """
+    key = (tuple(tuple(values) for values in dice_sets), tuple(dice_labels or ()), board_size)
+    table = _landing_tables.get(key)
+    if table is None:
+        table = LandingTable(dice_sets, board_size, dice_labels)
+        _landing_tables[key] = table
+    return table
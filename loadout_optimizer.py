@@ -0,0 +1,247 @@
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+import numpy as np
+from characters import YELLOW_TILE_OPTIONS, create_character, get_available_dice
+from monte_carlo import simulate_battles
+from campaign_engine import simulate_campaign_battles
+
+DEFAULT_NUM_BATTLES = 20_000
+DEFAULT_NUM_TEAM_BATTLES = 2_000  # Campaign battles run on the pure Python engine
+CONFIDENCE_Z = 1.96  # 95% confidence intervals
+
+
+def get_loadouts(character):
+    """
+    List every loadout a player can pick for a character
+
+    Returns:
+        List of (dice_keys, yellow_option) tuples, one per dice triple and yellow tile effect
+    """
+    dice_keys = list(get_available_dice(character.name))
+    return [(triple, option) for triple in combinations(dice_keys, 3) for option in YELLOW_TILE_OPTIONS]
+
+
+def get_team_loadouts(character_1, character_2):
+    """
+    List every pair of dice triples CampaignDiceSelect allows for a team
+
+    Returns:
+        List of (dice_keys_1, dice_keys_2) tuples
+    """
+    return [(triple_1, triple_2)
+            for triple_1 in combinations(character_1.available_dice, 3)
+            for triple_2 in combinations(character_2.available_dice, 3)]
+
+
+def summarize_results(wins, num_battles, turns):
+    """
+    Compute the win rate and mean turns with their 95% confidence intervals
+
+    Args:
+        wins: Number of battles won
+        num_battles: Number of battles simulated
+        turns: Array of turns taken by each battle
+
+    Returns:
+        Dictionary with win_rate, mean_turns and their low/high bounds
+    """
+    win_rate = wins / num_battles
+    mean_turns = float(turns.mean())
+    turns_margin = CONFIDENCE_Z * float(turns.std()) / math.sqrt(num_battles)
+
+    # Wilson score interval for the win rate
+    z2 = CONFIDENCE_Z * CONFIDENCE_Z
+    center = (win_rate + z2 / (2 * num_battles)) / (1 + z2 / num_battles)
+    margin = (CONFIDENCE_Z / (1 + z2 / num_battles) *
+              math.sqrt(win_rate * (1 - win_rate) / num_battles + z2 / (4 * num_battles * num_battles)))
+
+    return {
+        'win_rate': win_rate,
+        'win_rate_low': max(0.0, center - margin),
+        'win_rate_high': min(1.0, center + margin),
+        'mean_turns': mean_turns,
+        'mean_turns_low': mean_turns - turns_margin,
+        'mean_turns_high': mean_turns + turns_margin
+    }
+
+
+def evaluate_loadout(character_name, dice_keys, yellow_option, num_battles, seed=None):
+    """
+    Simulate battles with one loadout
+
+    Args:
+        character_name: Name of the character (e.g., 'Lapper')
+        dice_keys: Three DICE_LIBRARY keys
+        yellow_option: Entry of YELLOW_TILE_OPTIONS
+        num_battles: Number of battles to simulate
+        seed: Seed for the simulation (same seed for every loadout compares them on the same rolls)
+
+    Returns:
+        Dictionary with the loadout, win rate and mean turns with their confidence intervals
+    """
+    character = create_character(character_name)
+    character.set_dice(dice_keys)
+    character.set_yellow_effect(yellow_option['effect'], yellow_option['icon'])
+    character.num_yellow_tiles = yellow_option['num_tiles']
+
+    results = simulate_battles(character, num_battles, seed=seed)
+    row = {'dice': tuple(dice_keys), 'effect': yellow_option['effect']}
+    row.update(summarize_results(int(results.wins.sum()), num_battles, results.turns))
+    return row
+
+
+def evaluate_team(team, num_battles, seed=None):
+    """
+    Simulate campaign battles with one team loadout
+
+    Args:
+        team: Two (character_name, dice_keys) tuples
+        num_battles: Number of battles to simulate
+        seed: Seed for the simulation (random if None)
+
+    Returns:
+        Dictionary with the team, win rate and mean turns with their confidence intervals
+    """
+    results = simulate_campaign_battles(team, num_battles, seed=seed)
+    row = {'team': tuple((name, tuple(dice_keys)) for name, dice_keys in team)}
+    row.update(summarize_results(results['wins'], num_battles, np.array(results['turns'])))
+    return row
+
+
+def rank_results(results):
+    """Sort loadout results from best to worst (highest win rate, then fewest turns)"""
+    return sorted(results, key=lambda row: (-row['win_rate'], row['mean_turns']))
+
+
+def optimize_loadout(character, num_battles=DEFAULT_NUM_BATTLES, workers=None, seed=None, on_progress=None):
+    """
+    Rank every dice triple and yellow tile effect for a character
+
+    Every loadout is simulated in a worker process (one per core by default).
+
+    Args:
+        character: Character instance (only its name is used)
+        num_battles: Battles simulated per loadout
+        workers: Number of worker processes (os.cpu_count() if None)
+        seed: Seed shared by every loadout (random if None)
+        on_progress: Called as on_progress(rankings, done, total) each time a loadout finishes
+
+    Returns:
+        List of result dictionaries sorted from best to worst
+    """
+    loadouts = get_loadouts(character)
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(evaluate_loadout, character.name, dice_keys, option, num_battles, seed)
+                   for dice_keys, option in loadouts]
+        for future in as_completed(futures):
+            results.append(future.result())
+            if on_progress:
+                on_progress(rank_results(results), len(results), len(loadouts))
+
+    return rank_results(results)
+
+
+def optimize_team(character_1, character_2, num_battles=DEFAULT_NUM_TEAM_BATTLES, workers=None, seed=None,
+                  on_progress=None):
+    """
+    Rank every campaign dice loadout for a team of two characters
+
+    Args:
+        character_1: First character instance (its name and available dice are used)
+        character_2: Second character instance
+        num_battles: Campaign battles simulated per team loadout
+        workers: Number of worker processes (os.cpu_count() if None)
+        seed: Seed shared by every team loadout (random if None)
+        on_progress: Called as on_progress(rankings, done, total) each time a team loadout finishes
+
+    Returns:
+        List of result dictionaries sorted from best to worst
+    """
+    loadouts = get_team_loadouts(character_1, character_2)
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(evaluate_team, [(character_1.name, dice_1), (character_2.name, dice_2)],
+                                   num_battles, seed)
+                   for dice_1, dice_2 in loadouts]
+        for future in as_completed(futures):
+            results.append(future.result())
+            if on_progress:
+                on_progress(rank_results(results), len(results), len(loadouts))
+
+    return rank_results(results)
+
+
+def format_rankings(rankings, limit=None):
+    """
+    Format ranked loadouts as a text table
+
+    Args:
+        rankings: Result dictionaries from optimize_loadout or optimize_team
+        limit: Only show the best `limit` loadouts
+
+    Returns:
+        Table as a string
+    """
+    if rankings and 'team' in rankings[0]:
+        return format_team_rankings(rankings, limit)
+
+    lines = [f"{'#':>4}  {'Dice':<24}{'Yellow effect':<17}{'Win rate':>9}  {'95% CI':<15}{'Turns':>7}  95% CI"]
+    for rank, row in enumerate(rankings[:limit], start=1):
+        lines.append(
+            f"{rank:>4}  {', '.join(row['dice']):<24}{row['effect']:<17}{row['win_rate']:>8.1%}  "
+            f"{row['win_rate_low']:>5.1%}-{row['win_rate_high']:<8.1%}{row['mean_turns']:>7.2f}  "
+            f"{row['mean_turns_low']:.2f}-{row['mean_turns_high']:.2f}"
+        )
+    return "\n".join(lines)
+
+
+def format_team_rankings(rankings, limit=None):
+    """Format ranked team loadouts as a text table"""
+    (name_1, _), (name_2, _) = rankings[0]['team']
+    lines = [f"{'#':>4}  {name_1 + ' dice':<24}{name_2 + ' dice':<24}{'Win rate':>9}  {'95% CI':<15}{'Turns':>7}  95% CI"]
+    for rank, row in enumerate(rankings[:limit], start=1):
+        (_, dice_1), (_, dice_2) = row['team']
+        lines.append(
+            f"{rank:>4}  {', '.join(dice_1):<24}{', '.join(dice_2):<24}{row['win_rate']:>8.1%}  "
+            f"{row['win_rate_low']:>5.1%}-{row['win_rate_high']:<8.1%}{row['mean_turns']:>7.2f}  "
+            f"{row['mean_turns_low']:.2f}-{row['mean_turns_high']:.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank every dice and yellow tile loadout for a character or campaign team")
+    parser.add_argument('character', choices=['Lapper', 'Huntsman'])
+    parser.add_argument('--partner', choices=['Lapper', 'Huntsman'], default=None,
+                        help="rank campaign team loadouts with this second character instead")
+    parser.add_argument('--battles', type=int, default=None, help="battles per loadout")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--top', type=int, default=20, help="rows to show")
+    args = parser.parse_args()
+
+    def show_progress(rankings, done, total):
+        best = rankings[0]
+        if 'team' in best:
+            loadout = " / ".join(', '.join(dice_keys) for _, dice_keys in best['team'])
+        else:
+            loadout = f"{', '.join(best['dice'])} + {best['effect']}"
+        print(f"[{done}/{total}] best so far: {loadout} ({best['win_rate']:.1%})", flush=True)
+
+    if args.partner:
+        rankings = optimize_team(create_character(args.character), create_character(args.partner),
+                                 args.battles or DEFAULT_NUM_TEAM_BATTLES, args.workers, args.seed, show_progress)
+    else:
+        rankings = optimize_loadout(create_character(args.character), args.battles or DEFAULT_NUM_BATTLES,
+                                    args.workers, args.seed, show_progress)
+    print(format_rankings(rankings, args.top))
+
+
+if __name__ == "__main__":
+    main()
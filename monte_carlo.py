@@ -0,0 +1,281 @@
+import numpy as np
+from board import TILE_EMPTY, TILE_GREEN, TILE_RED, TILE_YELLOW, get_board_sides
+from battle_engine import (BOARD_SIZE, NUM_GREEN_TILES, NUM_RED_TILES, DEBUFF_DAMAGE, GREEN_TILE_HEAL, BOSS_MAX_HP,
+                           BOSS_INITIAL_DAMAGE, BOSS_DAMAGE_INCREMENT, POISON_STACKS_APPLIED, BURN_STACKS_APPLIED,
+                           BURN_DAMAGE_PER_STACK, CHAIN_LIGHTNING_INITIAL_DAMAGE, CHAIN_LIGHTNING_DOT_DAMAGE,
+                           CHAIN_LIGHTNING_TURNS, MAX_BATTLE_TURNS)
+
+DEFAULT_BATCH_SIZE = 1_000_000
+
+
+class BattleResults:
+    def __init__(self, wins, losses, turns):
+        """
+        Outcome of a batch of simulated battles
+
+        Args:
+            wins: Boolean array, True where the boss was defeated
+            losses: Boolean array, True where the player died
+            turns: Integer array of turns taken in each battle
+        """
+        self.wins = wins
+        self.losses = losses
+        self.turns = turns
+
+    def __len__(self):
+        return len(self.turns)
+
+    def win_rate(self):
+        """Fraction of battles won by the player"""
+        return float(self.wins.mean()) if len(self) else 0.0
+
+    def mean_turns(self, won_only=False):
+        """Average number of turns per battle (optionally only counting won battles)"""
+        turns = self.turns[self.wins] if won_only else self.turns
+        return float(turns.mean()) if len(turns) else 0.0
+
+    def turn_distribution(self, won_only=False):
+        """
+        Histogram of battle lengths
+
+        Returns:
+            Array where entry t is the number of battles that took t turns
+        """
+        turns = self.turns[self.wins] if won_only else self.turns
+        return np.bincount(turns, minlength=1)
+
+
+def _place_random(boards, rng, start, end, count, tile_type):
+    """
+    Turn `count` random empty tiles between start and end of every board into tile_type
+
+    Boards with fewer empty tiles in that range get all of them.
+    """
+    width = end - start
+    count = min(count, width)
+    if count <= 0:
+        return
+
+    # Keep the tiles holding the `count` smallest random keys, occupied tiles never win
+    region = boards[:, start:end]
+    keys = rng.random((len(boards), width))
+    keys[region != TILE_EMPTY] = 2.0
+    threshold = np.partition(keys, count - 1, axis=1)[:, count - 1:count]
+    region[(keys <= threshold) & (keys < 2.0)] = tile_type
+
+
+def _place_fixed(boards, tiles, tile_type, only_empty):
+    """
+    Turn the same tiles of every board into tile_type, with the same rules as Board
+
+    Tile numbers off the board are ignored, and if only_empty, so are tiles
+    that are already taken on a board (e.g. a yellow tile on a green tile).
+    """
+    board_size = boards.shape[1]
+    columns = np.asarray([tile - 1 for tile in tiles if 1 <= tile <= board_size], dtype=np.intp)
+    if only_empty:
+        region = boards[:, columns]
+        boards[:, columns] = np.where(region == TILE_EMPTY, tile_type, region)
+    else:
+        boards[:, columns] = tile_type
+
+
+def _random_boards(rng, num_battles, num_yellow_tiles, green_tiles=None, red_tiles=None, yellow_tiles=None,
+                   board_size=BOARD_SIZE):
+    """
+    Build one board per battle as a (num_battles, board_size) matrix of tile types
+
+    Tiles that are passed in are shared by every battle, missing ones are drawn
+    independently per battle with the same rules as board.py. Overlapping tiles
+    are resolved like Board does: green first, then red and yellow only on
+    tiles that are still empty.
+    """
+    boards = np.zeros((num_battles, board_size), dtype=np.int8)
+
+    if green_tiles is not None:
+        _place_fixed(boards, green_tiles, TILE_GREEN, only_empty=False)
+    else:
+        _place_random(boards, rng, 0, board_size, NUM_GREEN_TILES, TILE_GREEN)
+
+    if red_tiles is not None:
+        _place_fixed(boards, red_tiles, TILE_RED, only_empty=True)
+    else:
+        # Same number per side (2 on the standard board), only on tiles that aren't green
+        for start, end in get_board_sides(board_size):
+            _place_random(boards, rng, start - 1, end - 1, NUM_RED_TILES // 4, TILE_RED)
+
+    if yellow_tiles is not None:
+        _place_fixed(boards, yellow_tiles, TILE_YELLOW, only_empty=True)
+    else:
+        _place_random(boards, rng, 0, board_size, num_yellow_tiles, TILE_YELLOW)
+
+    return boards
+
+
+def simulate_battles(character, num_battles, dice_weights=None, green_tiles=None, red_tiles=None,
+                     yellow_tiles=None, max_turns=MAX_BATTLE_TURNS, seed=None, batch_size=DEFAULT_BATCH_SIZE,
+                     board_size=BOARD_SIZE):
+    """
+    Simulate many independent single-player battles in lockstep
+
+    Every battle follows the same rules as BattleEngine.play_battle, but the
+    state of all battles is held in NumPy arrays and advanced one turn at a
+    time. Finished battles are dropped from the arrays so the cost of a turn
+    shrinks as battles end.
+
+    Args:
+        character: Character instance with dice_sets, dice_damage and yellow effect set
+        num_battles: Number of battles to simulate
+        dice_weights: Probability of choosing each dice every turn (uniform if None)
+        green_tiles: Fixed green tiles for every battle (random per battle if None)
+        red_tiles: Fixed red tiles for every battle (random per battle if None)
+        yellow_tiles: Fixed yellow tiles for every battle (random empty tiles per battle if None)
+        max_turns: Battles still running after this many turns count as neither win nor loss
+        seed: Seed for the NumPy random generator
+        batch_size: Maximum number of battles held in memory at once
+        board_size: Number of tiles on the board
+
+    Returns:
+        BattleResults for all battles
+    """
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(num_battles, dtype=bool)
+    losses = np.zeros(num_battles, dtype=bool)
+    turns = np.zeros(num_battles, dtype=np.int32)
+
+    for start in range(0, num_battles, batch_size):
+        end = min(start + batch_size, num_battles)
+        _simulate_batch(rng, character, end - start, dice_weights, green_tiles, red_tiles, yellow_tiles,
+                        max_turns, board_size, wins[start:end], losses[start:end], turns[start:end])
+
+    return BattleResults(wins, losses, turns)
+
+
+def _simulate_batch(rng, character, num_battles, dice_weights, green_tiles, red_tiles, yellow_tiles, max_turns,
+                    board_size, wins_out, losses_out, turns_out):
+    """Run one batch of battles, writing results into the given output slices"""
+    num_dice = len(character.dice_sets)
+
+    # Dice values padded into a table, sampled by picking a random face per dice
+    faces = np.array([len(values) for values in character.dice_sets])
+    face_table = np.zeros((num_dice, faces.max()), dtype=np.int32)
+    for i, values in enumerate(character.dice_sets):
+        face_table[i, :len(values)] = values
+    dice_damage = np.asarray(character.dice_damage, dtype=np.int32)
+    dice_cdf = None if dice_weights is None else np.cumsum(dice_weights) / np.sum(dice_weights)
+
+    # Cumulative lap damage so several laps in one move can be charged at once
+    max_laps = max_turns * (2 * int(np.abs(face_table).max()) // board_size + 1) + 1
+    lap_damage = np.zeros(max_laps + 1, dtype=np.int64)
+    for lap in range(1, max_laps + 1):
+        lap_damage[lap] = lap_damage[lap - 1] + character.get_lap_damage(lap)
+
+    yellow_bonus = character.get_yellow_tile_damage()
+    effect = character.yellow_tile_effect()
+    max_hp = character.max_hp
+
+    boards = _random_boards(rng, num_battles, character.num_yellow_tiles, green_tiles, red_tiles, yellow_tiles,
+                            board_size)
+
+    # Battle state, compacted to the battles that are still running
+    ids = np.arange(num_battles)
+    position = np.ones(num_battles, dtype=np.int32)
+    player_hp = np.full(num_battles, max_hp, dtype=np.int32)
+    boss_hp = np.full(num_battles, BOSS_MAX_HP, dtype=np.int32)
+    debuff_stacks = np.zeros(num_battles, dtype=np.int32)
+    boss_poison_stacks = np.zeros(num_battles, dtype=np.int32)
+    boss_burn_stacks = np.zeros(num_battles, dtype=np.int32)
+    chain_lightning_stacks = np.zeros(num_battles, dtype=np.int32)
+    laps_completed = np.zeros(num_battles, dtype=np.int32)
+    boss_attack_count = np.zeros(num_battles, dtype=np.int32)
+    yellow_buff_active = np.zeros(num_battles, dtype=bool)
+    lifesteal_active = np.zeros(num_battles, dtype=bool)
+
+    turn = 0
+    while len(ids) and turn < max_turns:
+        turn += 1
+        count = len(ids)
+
+        # Roll the chosen dice
+        if dice_cdf is None:
+            dice = rng.integers(0, num_dice, count)
+        else:
+            dice = np.searchsorted(dice_cdf, rng.random(count), side='right')
+        face = (rng.random(count) * faces[dice]).astype(np.intp)
+        moves = face_table[dice, face]
+        moves = np.where(yellow_buff_active, moves * 2, moves)
+        yellow_buff_active[:] = False
+        damage = dice_damage[dice]
+
+        # Start-of-turn effects
+        player_hp -= DEBUFF_DAMAGE * debuff_stacks
+        boss_hp -= boss_poison_stacks
+        np.maximum(boss_poison_stacks - 1, 0, out=boss_poison_stacks)
+        boss_hp -= boss_burn_stacks * BURN_DAMAGE_PER_STACK
+        boss_hp -= np.where(chain_lightning_stacks > 0, CHAIN_LIGHTNING_DOT_DAMAGE, 0)
+        np.maximum(chain_lightning_stacks - 1, 0, out=chain_lightning_stacks)
+
+        # Move, charging lap damage for every pass over the last tile
+        laps = np.where(moves > 0, (position - 1 + moves) // board_size, 0)
+        boss_hp -= (lap_damage[laps_completed + laps] - lap_damage[laps_completed]).astype(np.int32)
+        laps_completed += laps
+        position = (position - 1 + moves) % board_size + 1
+
+        # Landing effects
+        tile = boards[ids, position - 1]
+
+        on_green = tile == TILE_GREEN
+        player_hp[on_green] = np.minimum(max_hp, player_hp[on_green] + GREEN_TILE_HEAL)
+        debuff_stacks[on_green] = 0
+
+        debuff_stacks += tile == TILE_RED
+
+        on_yellow = tile == TILE_YELLOW
+        if on_yellow.any():
+            boss_hp[on_yellow] -= yellow_bonus
+            if effect == "double_movement":
+                yellow_buff_active |= on_yellow
+            elif effect == "poison_5":
+                boss_poison_stacks[on_yellow] += POISON_STACKS_APPLIED
+                boss_hp[on_yellow] -= boss_poison_stacks[on_yellow]
+            elif effect == "burning_strike":
+                boss_burn_stacks[on_yellow] += BURN_STACKS_APPLIED
+            elif effect == "lifesteal":
+                lifesteal_active |= on_yellow
+            elif effect == "chain_lightning":
+                boss_hp[on_yellow] -= CHAIN_LIGHTNING_INITIAL_DAMAGE
+                chain_lightning_stacks[on_yellow] = CHAIN_LIGHTNING_TURNS
+
+        on_normal = tile == TILE_EMPTY
+        boss_hp -= np.where(on_normal, damage, 0)
+        healed = on_normal & lifesteal_active
+        player_hp[healed] = np.minimum(max_hp, player_hp[healed] + damage[healed])
+        lifesteal_active &= ~on_normal
+        player_hp -= np.where(on_normal, BOSS_INITIAL_DAMAGE + boss_attack_count * BOSS_DAMAGE_INCREMENT, 0)
+        boss_attack_count += on_normal
+
+        # Record finished battles and drop them from the state arrays
+        won = boss_hp <= 0
+        lost = ~won & (player_hp <= 0)
+        finished = won | lost
+        if finished.any():
+            wins_out[ids[won]] = True
+            losses_out[ids[lost]] = True
+            turns_out[ids[finished]] = turn
+
+            running = ~finished
+            ids = ids[running]
+            position = position[running]
+            player_hp = player_hp[running]
+            boss_hp = boss_hp[running]
+            debuff_stacks = debuff_stacks[running]
+            boss_poison_stacks = boss_poison_stacks[running]
+            boss_burn_stacks = boss_burn_stacks[running]
+            chain_lightning_stacks = chain_lightning_stacks[running]
+            laps_completed = laps_completed[running]
+            boss_attack_count = boss_attack_count[running]
+            yellow_buff_active = yellow_buff_active[running]
+            lifesteal_active = lifesteal_active[running]
+
+    # Battles that hit the turn limit
+    turns_out[ids] = turn
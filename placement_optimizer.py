@@ -0,0 +1,383 @@
+import argparse
+import heapq
+import time
+from itertools import combinations
+import numpy as np
+from analysis_cache import AnalysisCache, simulate_board
+from battle_engine import (BURN_DAMAGE_PER_STACK, BURN_STACKS_APPLIED, CHAIN_LIGHTNING_DOT_DAMAGE,
+                           CHAIN_LIGHTNING_INITIAL_DAMAGE, CHAIN_LIGHTNING_TURNS, NUM_GREEN_TILES, NUM_RED_TILES,
+                           POISON_STACKS_APPLIED)
+from board import BOARD_SIZE, generate_board
+from characters import YELLOW_TILE_OPTIONS, create_character
+from game_random import GameRandom
+from landing_table import get_landing_table, laps_crossed
+
+DEFAULT_TOP_K = 5
+DEFAULT_TIME_BUDGET = 0.2  # Seconds, short enough to run between frames
+DEFAULT_HORIZON = 20  # Turns scored, about the length of a typical battle
+DEFAULT_NUM_BATTLES = 2_000  # Battles simulated per placement by the 'win' objective
+DEFAULT_SEED = 0  # Every placement is simulated on the same rolls, so they compare fairly and can be cached
+WIN_CANDIDATES = 12  # Best placements by damage that the 'win' objective simulates
+MAX_LANDING_TABLES = 1024  # The cache is emptied when it grows past this
+
+# How placements are ranked:
+#   'damage' - expected damage dealt to the boss within the horizon (fast, exact for the model below)
+#   'win'    - simulated win rate of the best placements by damage (slower, counts healing and boss attacks too)
+OBJECTIVES = ('damage', 'win')
+
+
+# ===== LANDING TABLES =====
+class TurnLandingTable:
+    def __init__(self, character, double_tiles, horizon, dice_weights=None, board_size=BOARD_SIZE):
+        """
+        Chance of landing on every tile on every turn of a battle
+
+        The token is followed as a distribution over (laps completed, double
+        movement active, tile) from tile 1, with a dice picked by dice_weights
+        every turn, so lap damage comes from character.get_lap_damage for
+        every lap. Where the token lands doesn't depend on what the tiles do,
+        except for double movement tiles, so one table scores every
+        placement of the other effects.
+
+        Args:
+            character: Character instance with dice_sets and dice_damage
+            double_tiles: Tile numbers with the double movement effect
+            horizon: Number of turns followed
+            dice_weights: Probability of choosing each dice every turn (uniform if None)
+            board_size: Number of tiles on the board
+        """
+        landing_table = get_landing_table(character.dice_sets, board_size)
+        num_dice = len(character.dice_sets)
+        weights = [1 / num_dice] * num_dice if dice_weights is None else list(dice_weights)
+
+        # Total lap damage after each number of laps, so crossing from L to L + c laps deals the difference
+        max_laps = get_max_laps(character, horizon, board_size)
+        lap_damage_total = np.zeros(max_laps + 1)
+        for lap in range(1, max_laps + 1):
+            lap_damage_total[lap] = lap_damage_total[lap - 1] + character.get_lap_damage(lap)
+        laps_done = np.arange(max_laps + 1)[:, None, None]
+
+        is_double = np.zeros(board_size + 1, dtype=bool)
+        is_double[list(double_tiles)] = True
+
+        # Probability mass indexed [doubled][laps completed][tile]; tile 0 is unused
+        mass = np.zeros((2, max_laps + 1, board_size + 1))
+        mass[0, 0, 1] = 1.0
+
+        # Chance of landing on each tile each turn, and the dice damage dealt if the tile is a normal tile
+        self.landing = np.zeros((horizon, board_size + 1))
+        self.dice_damage = np.zeros(board_size + 1)
+        self.lap_damage = 0.0
+
+        moves = [[_get_moves(landing_table, dice_index, doubled, board_size) for doubled in (False, True)]
+                 for dice_index in range(num_dice)]
+        for turn in range(horizon):
+            new_mass = np.zeros((max_laps + 1, board_size + 1))
+            for doubled in (0, 1):
+                if not mass[doubled].any():
+                    continue
+                for dice_index, weight in enumerate(weights):
+                    if weight == 0:
+                        continue
+                    tiles, laps, probabilities = moves[dice_index][doubled]
+                    # Shaped (laps completed, faces, tiles)
+                    flow = mass[doubled][:, None, :] * probabilities * weight
+                    # Clipped only where the mass is zero: no reachable state goes past max_laps
+                    new_laps = np.minimum(laps_done + laps, max_laps)
+                    landed = np.bincount((new_laps * (board_size + 1) + tiles).ravel(), flow.ravel(),
+                                         new_mass.size).reshape(new_mass.shape)
+                    new_mass += landed
+                    landed = landed.sum(axis=0)
+                    self.landing[turn] += landed
+                    self.dice_damage += landed * character.dice_damage[dice_index]
+                    self.lap_damage += float((flow * (lap_damage_total[new_laps] - lap_damage_total[laps_done])).sum())
+            mass[0] = np.where(is_double, 0.0, new_mass)
+            mass[1] = np.where(is_double, new_mass, 0.0)
+
+    def expected_damage(self, character, yellow_effects, empty_tiles):
+        """
+        Expected damage dealt to the boss within the horizon
+
+        Args:
+            character: Character the table was built for
+            yellow_effects: Dictionary of yellow tile number -> effect
+            empty_tiles: Tile numbers that are neither green, red nor yellow
+
+        Returns:
+            Damage from laps, normal tiles and yellow tiles
+        """
+        damage = self.lap_damage + float(self.dice_damage[list(empty_tiles)].sum())
+        for tile, effect in yellow_effects.items():
+            damage += float(self.landing[:, tile] @ get_yellow_damage(character, effect, len(self.landing)))
+        return damage
+
+
+def _get_moves(landing_table, dice_index, doubled, board_size):
+    """
+    Get a dice's outcomes from every tile as arrays
+
+    Returns:
+        Tuple of (landing tiles, laps crossed, probabilities), each shaped (faces, board_size + 1)
+    """
+    num_faces = len(landing_table.faces[dice_index])
+    tiles = np.zeros((num_faces, board_size + 1), dtype=np.intp)
+    laps = np.zeros((num_faces, board_size + 1), dtype=np.intp)
+    probabilities = np.zeros((num_faces, board_size + 1))
+    for position in range(1, board_size + 1):
+        for face, (tile, crossed, probability) in enumerate(landing_table.outcomes(dice_index, position, doubled)):
+            tiles[face, position] = tile
+            laps[face, position] = crossed
+            probabilities[face, position] = probability
+    return tiles, laps, probabilities
+
+
+def get_max_laps(character, horizon, board_size):
+    """Most laps the token can complete within the horizon (every turn with the longest doubled move)"""
+    longest_move = 2 * max(max(values) for values in character.dice_sets)
+    return horizon * laps_crossed(board_size, max(longest_move, 0), board_size)
+
+
+# Turn landing tables already built, keyed by loadout, lap damage, double movement tiles and horizon
+_turn_landing_tables = {}
+
+
+def get_turn_landing_table(character, double_tiles, horizon, dice_weights=None, board_size=BOARD_SIZE):
+    """Get the TurnLandingTable for a loadout, building it the first time it is needed"""
+    lap_damage = tuple(character.get_lap_damage(lap)
+                       for lap in range(1, get_max_laps(character, horizon, board_size) + 1))
+    key = (tuple(tuple(values) for values in character.dice_sets), tuple(character.dice_damage), lap_damage,
+           tuple(sorted(double_tiles)), horizon, None if dice_weights is None else tuple(dice_weights), board_size)
+    table = _turn_landing_tables.get(key)
+    if table is None:
+        if len(_turn_landing_tables) >= MAX_LANDING_TABLES:
+            _turn_landing_tables.clear()
+        table = TurnLandingTable(character, double_tiles, horizon, dice_weights, board_size)
+        _turn_landing_tables[key] = table
+    return table
+
+
+def get_yellow_damage(character, effect, horizon):
+    """
+    Damage a yellow tile deals to the boss when landed on, by the turn it is landed on
+
+    Damage over time is counted up to the end of the horizon. Poison is
+    counted as if the boss had no stacks yet, so stacking is undervalued.
+
+    Returns:
+        Array of damage for a landing on turn 1 to horizon
+    """
+    remaining = np.arange(horizon - 1, -1, -1)  # Turns left after landing on each turn
+    damage = np.full(horizon, float(character.get_yellow_tile_damage()))
+    if effect == "poison_5":
+        # Immediate damage, then the stacks each turn as they decay by one
+        ticks = np.minimum(remaining, POISON_STACKS_APPLIED)
+        damage += POISON_STACKS_APPLIED + ticks * POISON_STACKS_APPLIED - ticks * (ticks - 1) / 2
+    elif effect == "burning_strike":
+        damage += BURN_STACKS_APPLIED * BURN_DAMAGE_PER_STACK * remaining
+    elif effect == "chain_lightning":
+        damage += CHAIN_LIGHTNING_INITIAL_DAMAGE + CHAIN_LIGHTNING_DOT_DAMAGE * np.minimum(remaining,
+                                                                                          CHAIN_LIGHTNING_TURNS)
+    return damage
+
+
+# ===== SEARCH =====
+def _search_additive(gains, num_tiles, top_k, deadline):
+    """
+    Find the placements with the highest total gain, when each tile's gain doesn't depend on the others
+
+    Branch and bound over combinations (the order tiles are placed in
+    doesn't matter): tiles are tried from the highest gain down, and a
+    branch stops once even the best tiles left can't beat the k-th best
+    placement found so far.
+
+    Args:
+        gains: Dictionary of tile number -> gain from placing a yellow tile there
+        num_tiles: Tiles in a placement
+        top_k: Number of placements kept
+        deadline: time.perf_counter() value to give up at
+
+    Returns:
+        Tuple of ((gain, tiles) list from best to worst, number of placements scored, True if the search finished)
+    """
+    tiles = sorted(gains, key=lambda tile: (-gains[tile], tile))
+    values = [gains[tile] for tile in tiles]
+    best = []  # Min-heap of (gain, tiles), the k-th best placement on top
+    scored = 0
+    stack = [(0, (), 0.0)]  # (next index to try, tiles chosen, their gain)
+    complete = True
+
+    while stack:
+        # Stopping only once a placement is found means even a tiny budget gets the greedy best
+        if best and time.perf_counter() > deadline:
+            complete = False
+            break
+        start, chosen, gain = stack.pop()
+        remaining = num_tiles - len(chosen)
+        if remaining == 0:
+            scored += 1
+            entry = (gain, tuple(sorted(chosen)))
+            if len(best) < top_k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+            continue
+
+        # Pushed in reverse so the highest gain branch is searched first and fills the heap with good placements
+        children = []
+        for index in range(start, len(tiles) - remaining + 1):
+            bound = gain + sum(values[index:index + remaining])
+            if len(best) == top_k and bound <= best[0][0]:
+                break  # Tiles are sorted, so every later branch has a lower bound too
+            children.append((index + 1, chosen + (tiles[index],), gain + values[index]))
+        stack.extend(reversed(children))
+
+    return sorted(best, reverse=True), scored, complete
+
+
+def _search_double_movement(character, board, candidates, num_tiles, top_k, horizon, dice_weights, deadline):
+    """
+    Score double movement placements, which change where the token lands, one table each
+
+    Placements are tried in order of their tiles' single-tile scores, so
+    the most promising are scored first if the budget runs out.
+
+    Returns:
+        Tuple of ((damage, tiles) list from best to worst, number of placements scored, True if all were scored)
+    """
+    existing = {tile: board.yellow_effect(tile) for tile in board.yellow_tiles}
+    empty_tiles = set(board.empty_tiles())
+
+    def score(tiles):
+        yellow_effects = dict(existing)
+        yellow_effects.update((tile, "double_movement") for tile in tiles)
+        double_tiles = [tile for tile, effect in yellow_effects.items() if effect == "double_movement"]
+        table = get_turn_landing_table(character, double_tiles, horizon, dice_weights, board.size)
+        return table.expected_damage(character, yellow_effects, empty_tiles.difference(tiles))
+
+    order = sorted(candidates, key=lambda tile: (-score((tile,)), tile))
+    results = []
+    complete = True
+    for tiles in combinations(order, num_tiles):
+        if results and time.perf_counter() > deadline:
+            complete = False
+            break
+        results.append((score(tiles), tuple(sorted(tiles))))
+    return heapq.nlargest(top_k, results), len(results), complete
+
+
+def optimize_placement(character, board, num_tiles, top_k=DEFAULT_TOP_K, objective='damage',
+                       time_budget=DEFAULT_TIME_BUDGET, horizon=DEFAULT_HORIZON, dice_weights=None,
+                       num_battles=DEFAULT_NUM_BATTLES, seed=DEFAULT_SEED, cache=None):
+    """
+    Find the best empty tiles for a character's remaining yellow tiles
+
+    Raises ValueError for an unknown objective.
+
+    Args:
+        character: Character instance with dice_sets, dice_damage and yellow effect set
+        board: Board with the green, red and already placed yellow tiles
+        num_tiles: Yellow tiles left to place
+        top_k: Number of placements returned
+        objective: One of OBJECTIVES
+        time_budget: Seconds to search for (the best placements found so far are returned when it runs out)
+        horizon: Turns of the battle the damage is counted over
+        dice_weights: Probability of choosing each dice every turn (uniform if None)
+        num_battles: Battles simulated per placement by the 'win' objective
+        seed: Seed for the 'win' objective's simulations
+        cache: AnalysisCache for the 'win' objective's simulations (always simulates if None)
+
+    Returns:
+        Dictionary with placements (best first, each a dictionary with tiles and expected_damage, plus win_rate
+        and mean_turns for the 'win' objective), scored (placements scored) and complete (False if the time
+        budget ran out before the search finished)
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective} (expected one of {', '.join(OBJECTIVES)})")
+    deadline = time.perf_counter() + time_budget
+    effect = character.yellow_tile_effect()
+    empty_tiles = board.empty_tiles()
+    num_tiles = min(num_tiles, len(empty_tiles))
+    if num_tiles <= 0:
+        return {'placements': [], 'scored': 0, 'complete': True}
+    # The 'win' objective re-ranks the best placements by damage, so it needs more of them
+    num_candidates = max(top_k, WIN_CANDIDATES) if objective == 'win' else top_k
+
+    if effect == "double_movement":
+        ranked, scored, complete = _search_double_movement(character, board, empty_tiles, num_tiles,
+                                                           num_candidates, horizon, dice_weights, deadline)
+    else:
+        yellow_effects = {tile: board.yellow_effect(tile) for tile in board.yellow_tiles}
+        double_tiles = [tile for tile, tile_effect in yellow_effects.items() if tile_effect == "double_movement"]
+        table = get_turn_landing_table(character, double_tiles, horizon, dice_weights, board.size)
+        # A yellow tile's damage replaces the dice damage of the normal tile it covers
+        yellow_damage = get_yellow_damage(character, effect, horizon)
+        gains = {tile: float(table.landing[:, tile] @ yellow_damage - table.dice_damage[tile])
+                 for tile in empty_tiles}
+        base = table.expected_damage(character, yellow_effects, empty_tiles)
+        ranked, scored, complete = _search_additive(gains, num_tiles, num_candidates, deadline)
+        ranked = [(base + gain, tiles) for gain, tiles in ranked]
+
+    placements = [{'tiles': list(tiles), 'expected_damage': damage} for damage, tiles in ranked]
+    if objective == 'win':
+        simulated = []
+        for placement in placements:
+            # Always simulate the best placement by damage, so there is a result however short the budget
+            if simulated and time.perf_counter() > deadline:
+                complete = False
+                break
+            result = simulate_board(character, board.green_tiles, board.red_tiles,
+                                    board.yellow_tiles + placement['tiles'], num_battles, seed, dice_weights, cache,
+                                    board.size)
+            placement['win_rate'] = result['win_rate']
+            placement['mean_turns'] = result['mean_turns']
+            simulated.append(placement)
+        placements = sorted(simulated, key=lambda row: (-row['win_rate'], row['mean_turns']))
+
+    return {'placements': placements[:top_k], 'scored': scored, 'complete': complete}
+
+
+def format_placements(result):
+    """Format the placements from optimize_placement as a text table"""
+    placements = result['placements']
+    show_win = bool(placements) and 'win_rate' in placements[0]
+    lines = [f"{'#':>4}  {'Tiles':<20}{'Damage':>8}" + (f"{'Win rate':>10}{'Turns':>8}" if show_win else "")]
+    for rank, row in enumerate(placements, start=1):
+        line = f"{rank:>4}  {', '.join(map(str, row['tiles'])):<20}{row['expected_damage']:>8.1f}"
+        if show_win:
+            line += f"{row['win_rate']:>10.1%}{row['mean_turns']:>8.2f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the best yellow tile placements on a random board")
+    parser.add_argument('character', choices=['Lapper', 'Huntsman'])
+    parser.add_argument('--effect', choices=[option['effect'] for option in YELLOW_TILE_OPTIONS],
+                        default='double_movement')
+    parser.add_argument('--seed', type=int, default=None, help="seed for the board (random if omitted)")
+    parser.add_argument('--objective', choices=OBJECTIVES, default='damage')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP_K, help="placements to show")
+    parser.add_argument('--budget', type=float, default=DEFAULT_TIME_BUDGET, help="search time in seconds")
+    parser.add_argument('--horizon', type=int, default=DEFAULT_HORIZON, help="turns the damage is counted over")
+    parser.add_argument('--cache-dir', default=None, help="cache the 'win' objective's simulations in this folder")
+    args = parser.parse_args()
+
+    option = next(option for option in YELLOW_TILE_OPTIONS if option['effect'] == args.effect)
+    character = create_character(args.character)
+    character.set_yellow_effect(option['effect'], option['icon'])
+    board = generate_board(NUM_GREEN_TILES, NUM_RED_TILES, BOARD_SIZE, rng=GameRandom(args.seed))
+    cache = AnalysisCache(args.cache_dir) if args.cache_dir else None
+
+    start = time.perf_counter()
+    result = optimize_placement(character, board, option['num_tiles'], args.top, args.objective, args.budget,
+                                args.horizon, cache=cache)
+    seconds = time.perf_counter() - start
+
+    print(f"Board: {board.fingerprint()}  ({len(board.empty_tiles())} empty tiles, {option['num_tiles']} to place)")
+    print(format_placements(result))
+    print(f"Scored {result['scored']} placements in {seconds * 1000:.0f} ms"
+          + ("" if result['complete'] else " (time budget ran out)"))
+
+
+if __name__ == "__main__":
+    main()
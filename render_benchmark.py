@@ -0,0 +1,312 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Benchmarks run headless - pick SDL's dummy drivers before pygame is initialized
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from battle_engine import BattleEngine
+from campaign_dice_select import CampaignDiceSelect
+from campaign_engine import CampaignEngine, create_campaign_character
+from characters import YELLOW_TILE_OPTIONS, create_character
+from dice_select import DiceSelect
+from frame_profiler import percentile
+from game_random import GameRandom
+from main import Game, WINDOW_WIDTH, WINDOW_HEIGHT, available_characters
+from ui_constants import colors, fonts
+from yellow_tile_select import YellowTileSelect
+
+# Fixed board so every run draws the same tiles
+GREEN_TILES = [2, 5, 9, 14, 18]
+RED_TILES = [3, 4, 10, 11, 15, 16, 21, 22]
+YELLOW_TILES = [7, 12, 19, 23, 13, 6]  # Empty tiles, used in this order
+
+DEFAULT_FRAMES = 300
+WARMUP_FRAMES = 10  # Untimed frames first, so caches are filled like in a running game
+DEFAULT_TOLERANCE = 0.10  # Fraction of baseline fps a scenario may lose before it counts as a regression
+BENCHMARK_SEED = 1
+
+
+# ===== SYNTHETIC STATE =====
+def _yellow_option(effect):
+    """Get the yellow tile option with an effect"""
+    for option in YELLOW_TILE_OPTIONS:
+        if option['effect'] == effect:
+            return option
+    raise ValueError(f"Unknown yellow tile effect: {effect}")
+
+
+def _add_effects(engine):
+    """Give the boss every kind of stack, and lifesteal to the player(s), so all status lines are drawn"""
+    boss = engine.boss
+    boss.poison_stacks = 10
+    boss.burn_stacks = 6
+    boss.chain_lightning_stacks = 2
+    if isinstance(engine, CampaignEngine):
+        engine.turn.lifesteal_active = True
+    else:
+        engine.player.lifesteal_active = True
+    boss.current_damage = 14
+
+
+def setup_single_battle(game, character_name, effect, yellow_tiles_placed, hovered_dice=None, effects=False,
+                        moving=False):
+    """
+    Put the game in a single-player battle
+
+    Args:
+        game: main.Game to set up
+        character_name: Character to play
+        effect: Yellow tile effect (its option sets the number of yellow tiles)
+        yellow_tiles_placed: Yellow tiles already placed (the battle is rolling once all are)
+        hovered_dice: Dice index the mouse is over (highlights its landing tiles)
+        effects: Give the player and boss active status effects
+        moving: Show the token part way through a move
+    """
+    option = _yellow_option(effect)
+    character = create_character(character_name)
+    character.set_yellow_effect(option['effect'], option['icon'])
+    character.num_yellow_tiles = option['num_tiles']
+
+    engine = BattleEngine(character, GREEN_TILES, RED_TILES, YELLOW_TILES[:yellow_tiles_placed],
+                          rng=GameRandom(BENCHMARK_SEED))
+    if effects:
+        _add_effects(engine)
+        player = engine.player
+        player.debuff_stacks = 3
+        player.yellow_buff_active = True
+        player.current_hp = player.max_hp // 3
+        player.laps_completed = 2
+    if moving:
+        engine.player.position = 8
+        engine.player.is_moving = True
+        engine.player.moves_remaining = 3
+
+    game.battle_engine = engine
+    game.campaign_mode = False
+    game.hovered_dice = hovered_dice
+    game.game_state = "battle"
+
+
+def setup_campaign_battle(game, yellow_tiles_placed, effects=False, moving=False):
+    """
+    Put the game in a campaign battle with Lapper and Huntsman
+
+    Args:
+        game: main.Game to set up
+        yellow_tiles_placed: Yellow tiles already placed (the battle is rolling once all are)
+        effects: Give the characters and boss active status effects
+        moving: Show the first character part way through a move
+    """
+    character_1 = create_campaign_character('Lapper', ['mid', 'high', 'risk'])
+    character_2 = create_campaign_character('Huntsman', ['even', 'odd', 'low'])
+    engine = CampaignEngine(character_1, character_2, GREEN_TILES, RED_TILES, YELLOW_TILES[:yellow_tiles_placed],
+                            rng=GameRandom(BENCHMARK_SEED))
+    if effects:
+        _add_effects(engine)
+        engine.turn.turn_phase = "character_2_second"
+        for state in engine.character_states:
+            state.debuff_stacks = 2
+            state.yellow_buff_active = True
+            state.current_hp = state.max_hp // 2
+    if moving:
+        state = engine.character_1_state
+        state.position = 8
+        state.is_moving = True
+        state.moves_remaining = 3
+
+    game.campaign_engine = engine
+    game.campaign_mode = True
+    game.game_state = "battle"
+
+
+def draw_battle(game):
+    """Get the draw function of the battle screen, refreshing the battle view every frame like the game does"""
+    return lambda screen: game.battle_renderer.draw_battle_screen(screen, game.get_battle_state())
+
+
+def _start_menu(game):
+    return game.start_menu.draw
+
+
+def _character_select(game):
+    return game.character_select.draw
+
+
+def _campaign_team_select(game):
+    game.campaign_team_select.selected_slot_1 = available_characters[0]
+    game.campaign_team_select.selected_slot_2 = available_characters[1]
+    return game.campaign_team_select.draw
+
+
+def _dice_select(game):
+    dice_select = DiceSelect(WINDOW_WIDTH, WINDOW_HEIGHT, colors, fonts, create_character('Lapper'))
+    dice_select.selected_dice = [dice_key for _, dice_key, _ in dice_select.dice_buttons[:2]]
+    return dice_select.draw
+
+
+def _yellow_tile_select(game):
+    return YellowTileSelect(WINDOW_WIDTH, WINDOW_HEIGHT, colors, fonts, create_character('Huntsman')).draw
+
+
+def _campaign_dice_select(game):
+    character_1, character_2 = available_characters
+    campaign_dice_select = CampaignDiceSelect(WINDOW_WIDTH, WINDOW_HEIGHT, colors, fonts, character_1, character_2)
+    campaign_dice_select.char_1_selected = list(character_1.available_dice[:3])
+    campaign_dice_select.char_2_selected = list(character_2.available_dice[:1])
+    return campaign_dice_select.draw
+
+
+def _battle(setup, *args, **kwargs):
+    """Make a scenario that sets up a battle and draws the battle screen"""
+    def scenario(game):
+        setup(game, *args, **kwargs)
+        return draw_battle(game)
+    return scenario
+
+
+# Name -> function taking the game and returning a draw function taking the screen
+SCENARIOS = {
+    'start_menu': _start_menu,
+    'character_select': _character_select,
+    'campaign_team_select': _campaign_team_select,
+    'dice_select': _dice_select,
+    'yellow_tile_select': _yellow_tile_select,
+    'campaign_dice_select': _campaign_dice_select,
+    'battle_place_yellow': _battle(setup_single_battle, 'Huntsman', 'poison_5', 1),
+    'battle_1_yellow': _battle(setup_single_battle, 'Lapper', 'double_movement', 1),
+    'battle_1_yellow_hover': _battle(setup_single_battle, 'Lapper', 'double_movement', 1, hovered_dice=2),
+    'battle_3_yellow_effects': _battle(setup_single_battle, 'Lapper', 'chain_lightning', 3, hovered_dice=0,
+                                       effects=True),
+    'battle_4_yellow_moving': _battle(setup_single_battle, 'Huntsman', 'poison_5', 4, effects=True, moving=True),
+    'campaign_place_yellow': _battle(setup_campaign_battle, 2),
+    'campaign_rolling': _battle(setup_campaign_battle, 5),
+    'campaign_effects_moving': _battle(setup_campaign_battle, 5, effects=True, moving=True)
+}
+
+
+# ===== MEASUREMENT =====
+def measure(draw, screen, frames=DEFAULT_FRAMES):
+    """
+    Time a draw function over a number of frames
+
+    Returns:
+        Dictionary with frames per second, mean, median and p95 milliseconds per frame, and the frame count
+    """
+    for _ in range(WARMUP_FRAMES):
+        draw(screen)
+
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw(screen)
+        times.append((time.perf_counter() - start) * 1000)
+
+    times.sort()
+    mean_ms = sum(times) / len(times)
+    return {
+        'fps': 1000 / mean_ms if mean_ms > 0 else 0.0,
+        'mean_ms': mean_ms,
+        'median_ms': percentile(times, 0.5),
+        'p95_ms': percentile(times, 0.95),
+        'frames': frames
+    }
+
+
+def run_benchmarks(frames=DEFAULT_FRAMES, names=None, on_result=None):
+    """
+    Measure every scenario headless
+
+    Args:
+        frames: Timed frames per scenario
+        names: Scenario names to run (all if None)
+        on_result: Function called with (name, result) after each scenario
+
+    Returns:
+        Dictionary with the environment under 'meta' and each scenario's measure() result under 'results'
+    """
+    game = Game(BENCHMARK_SEED, max_fps=0, verbose=False, idle_wait=False)
+    results = {}
+    for name in names or SCENARIOS:
+        draw = SCENARIOS[name](game)
+        results[name] = measure(draw, game.screen, frames)
+        if on_result is not None:
+            on_result(name, results[name])
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'sdl_videodriver': os.environ.get('SDL_VIDEODRIVER'),
+            'platform': platform.platform(),
+            'frames': frames
+        },
+        'results': results
+    }
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare a report against a saved baseline report
+
+    Args:
+        report: run_benchmarks() result
+        baseline: Earlier run_benchmarks() result loaded from JSON
+        tolerance: Fraction of baseline fps a scenario may lose before it counts as a regression
+
+    Returns:
+        List of (name, baseline fps, fps, relative change, regressed) for scenarios in both reports
+    """
+    rows = []
+    for name, result in report['results'].items():
+        if name not in baseline['results']:
+            continue
+        baseline_fps = baseline['results'][name]['fps']
+        change = result['fps'] / baseline_fps - 1 if baseline_fps > 0 else 0.0
+        rows.append((name, baseline_fps, result['fps'], change, change < -tolerance))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the draw speed of every screen headless")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES, help="timed frames per scenario")
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help="scenario to run (repeat for several, all if omitted)")
+    parser.add_argument('--output', default=None, help="write the results to this JSON file")
+    parser.add_argument('--baseline', default=None,
+                        help="compare against a JSON file from --output and exit with status 1 on a regression")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"fps drop counted as a regression (default: {DEFAULT_TOLERANCE * 100:.0f}%%)")
+    args = parser.parse_args()
+
+    def show_result(name, result):
+        print(f"{name:<26}{result['fps']:>9.0f} fps  mean {result['mean_ms']:.3f} ms  p95 {result['p95_ms']:.3f} ms")
+
+    report = run_benchmarks(args.frames, args.scenario, show_result)
+    pygame.quit()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.tolerance)
+        print(f"\nCompared with {args.baseline}:")
+        for name, baseline_fps, fps, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<26}{baseline_fps:>9.0f} -> {fps:>6.0f} fps ({change:+.1%}){flag}")
+        regressions = sum(1 for row in rows if row[4])
+        print(f"{regressions} regression(s) beyond {args.tolerance:.0%}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource  # Unix only - memory high-water marks are skipped without it
+except ImportError:
+    resource = None
+
+import numpy as np
+from battle_engine import BattleEngine
+from campaign_engine import simulate_campaign_battles
+from characters import CHARACTER_CLASSES, YELLOW_TILE_OPTIONS, create_character, get_available_dice
+from game_random import GameRandom
+from monte_carlo import simulate_battles
+
+# Battles per case for each simulator (scaled with --scale)
+DEFAULT_BATTLES = {
+    'engine': 2_000,  # BattleEngine.play_battle, one battle at a time
+    'vectorized': 200_000,  # monte_carlo.simulate_battles, all battles in lockstep
+    'campaign': 1_000  # CampaignEngine.play_battle
+}
+DEFAULT_TOLERANCE = 0.10  # Fraction of baseline battles/s a case may lose before it counts as a regression
+DEFAULT_RESULTS_DIR = 'benchmark_results'
+BENCHMARK_SEED = 1
+
+
+# ===== CASES =====
+def get_benchmark_loadouts(character_name):
+    """
+    List the loadouts benchmarked for a character
+
+    The character's own dice with every yellow tile effect, then the first and
+    last three dice of its DICE_LIBRARY choices with the first effect.
+
+    Returns:
+        List of (dice_keys or None for the character's own dice, yellow effect) tuples
+    """
+    dice_keys = list(get_available_dice(character_name))
+    loadouts = [(None, option['effect']) for option in YELLOW_TILE_OPTIONS]
+    first_effect = YELLOW_TILE_OPTIONS[0]['effect']
+    loadouts.append((tuple(dice_keys[:3]), first_effect))
+    loadouts.append((tuple(dice_keys[-3:]), first_effect))
+    return loadouts
+
+
+def get_benchmark_teams():
+    """
+    List the campaign teams benchmarked
+
+    Returns:
+        List of teams, each two (character_name, dice_keys) tuples
+    """
+    teams = []
+    names = list(CHARACTER_CLASSES)
+    for name_1 in names:
+        for name_2 in names:
+            if name_1 == name_2:
+                continue
+            dice_1 = create_character(name_1).available_dice
+            dice_2 = create_character(name_2).available_dice
+            teams.append([(name_1, tuple(dice_1[:3])), (name_2, tuple(dice_2[:3]))])
+            teams.append([(name_1, tuple(dice_1[-3:])), (name_2, tuple(dice_2[-3:]))])
+    return teams
+
+
+def get_cases(kinds=None):
+    """
+    List every benchmark case
+
+    Args:
+        kinds: Simulator names from DEFAULT_BATTLES to include (all if None)
+
+    Returns:
+        List of (case name, simulator, spec) tuples - spec is a loadout
+        (character_name, dice_keys, effect) or a campaign team
+    """
+    cases = []
+    for kind in kinds or DEFAULT_BATTLES:
+        if kind == 'campaign':
+            for team in get_benchmark_teams():
+                name = '/'.join(f"{character}:{'+'.join(dice_keys)}" for character, dice_keys in team)
+                cases.append((f"campaign/{name}", kind, team))
+            continue
+        for character_name in CHARACTER_CLASSES:
+            for dice_keys, effect in get_benchmark_loadouts(character_name):
+                dice_name = '+'.join(dice_keys) if dice_keys else 'own'
+                cases.append((f"{kind}/{character_name}/{dice_name}/{effect}", kind,
+                              (character_name, dice_keys, effect)))
+    return cases
+
+
+def _create_loadout_character(character_name, dice_keys, effect):
+    """Create a character with a benchmark loadout"""
+    character = create_character(character_name)
+    if dice_keys:
+        character.set_dice(dice_keys)
+    for option in YELLOW_TILE_OPTIONS:
+        if option['effect'] == effect:
+            character.set_yellow_effect(option['effect'], option['icon'])
+            character.num_yellow_tiles = option['num_tiles']
+    return character
+
+
+def run_case(kind, spec, num_battles, seed):
+    """
+    Simulate the battles of one case (also the worker function of the process pool)
+
+    Returns:
+        Dictionary with battles, turns, wins, seconds spent simulating and the process's peak memory
+    """
+    start = time.perf_counter()
+    if kind == 'campaign':
+        results = simulate_campaign_battles(spec, num_battles, seed=seed)
+        turns = sum(results['turns'])
+        wins = results['wins']
+
+    elif kind == 'vectorized':
+        results = simulate_battles(_create_loadout_character(*spec), num_battles, seed=seed)
+        turns = int(results.turns.sum())
+        wins = int(results.wins.sum())
+
+    else:
+        character = _create_loadout_character(*spec)
+        rng = GameRandom(seed)
+        turns = 0
+        wins = 0
+        for _ in range(num_battles):
+            engine = BattleEngine(character, rng=rng.spawn())
+            wins += engine.play_battle() == "player"
+            turns += engine.turn.turns_taken
+
+    return {'battles': num_battles, 'turns': turns, 'wins': wins, 'seconds': time.perf_counter() - start,
+            'peak_memory_mb': peak_memory_mb()}
+
+
+# ===== MEASUREMENT =====
+def peak_memory_mb():
+    """Get the memory high-water mark of this process in MB (None if unknown)"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def measure_case(kind, spec, num_battles, executor=None, workers=1):
+    """
+    Time one case, in this process or split evenly across a process pool
+
+    Returns:
+        Dictionary with battles and turns per second, totals, wall-clock seconds and the highest
+        peak memory of the processes that ran it
+    """
+    start = time.perf_counter()
+    if executor is None:
+        parts = [run_case(kind, spec, num_battles, BENCHMARK_SEED)]
+    else:
+        # Every worker gets its own share and seed, so the battles differ between workers
+        seeds = GameRandom(BENCHMARK_SEED)
+        shares = [num_battles // workers + (i < num_battles % workers) for i in range(workers)]
+        futures = [executor.submit(run_case, kind, spec, share, seeds.spawn().randrange(2 ** 63))
+                   for share in shares if share]
+        parts = [future.result() for future in futures]
+    seconds = time.perf_counter() - start
+
+    battles = sum(part['battles'] for part in parts)
+    turns = sum(part['turns'] for part in parts)
+    peaks = [part['peak_memory_mb'] for part in parts if part['peak_memory_mb'] is not None]
+    return {
+        'battles': battles,
+        'turns': turns,
+        'wins': sum(part['wins'] for part in parts),
+        'seconds': seconds,
+        'battles_per_second': battles / seconds if seconds > 0 else 0.0,
+        'turns_per_second': turns / seconds if seconds > 0 else 0.0,
+        'peak_memory_mb': max(peaks) if peaks else None
+    }
+
+
+def run_benchmarks(kinds=None, scale=1.0, workers=None, on_result=None):
+    """
+    Measure every case single-threaded, then across a process pool
+
+    Args:
+        kinds: Simulator names from DEFAULT_BATTLES to include (all if None)
+        scale: Multiplier for the number of battles per case
+        workers: Process pool size (os.cpu_count() if None, 0 skips the pool runs)
+        on_result: Function called with (name, result) after each measurement
+
+    Returns:
+        Dictionary with the environment under 'meta' and each measurement under 'results',
+        keyed '<case>' for single-threaded and '<case>@pool' for process pool runs
+    """
+    workers = os.cpu_count() if workers is None else workers
+    cases = get_cases(kinds)
+    results = {}
+
+    def record(name, result):
+        results[name] = result
+        if on_result is not None:
+            on_result(name, result)
+
+    for name, kind, spec in cases:
+        record(name, measure_case(kind, spec, max(1, int(DEFAULT_BATTLES[kind] * scale))))
+
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Start the workers before timing anything
+            _, kind, spec = cases[0]
+            list(executor.map(run_case, [kind] * workers, [spec] * workers, [1] * workers, [BENCHMARK_SEED] * workers))
+            for name, kind, spec in cases:
+                num_battles = max(workers, int(DEFAULT_BATTLES[kind] * scale))
+                record(f"{name}@pool", measure_case(kind, spec, num_battles, executor, workers))
+
+    return {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'workers': workers,
+            'scale': scale
+        },
+        'results': results
+    }
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compare a report against a saved baseline report
+
+    Args:
+        report: run_benchmarks() result
+        baseline: Earlier run_benchmarks() result loaded from JSON
+        tolerance: Fraction of baseline battles/s a case may lose before it counts as a regression
+
+    Returns:
+        List of (name, baseline battles/s, battles/s, relative change, regressed) for cases in both reports
+    """
+    rows = []
+    for name, result in report['results'].items():
+        if name not in baseline['results']:
+            continue
+        baseline_rate = baseline['results'][name]['battles_per_second']
+        change = result['battles_per_second'] / baseline_rate - 1 if baseline_rate > 0 else 0.0
+        rows.append((name, baseline_rate, result['battles_per_second'], change, change < -tolerance))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure battles and turns per second of the battle simulators")
+    parser.add_argument('--kind', action='append', choices=list(DEFAULT_BATTLES),
+                        help="simulator to benchmark (repeat for several, all if omitted)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="multiplier for the number of battles per case (e.g., 0.1 for a quick run)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: one per core, 0 skips the pool runs)")
+    parser.add_argument('--results-dir', default=DEFAULT_RESULTS_DIR,
+                        help=f"directory every run is saved to (default: {DEFAULT_RESULTS_DIR})")
+    parser.add_argument('--baseline', default=None,
+                        help="compare against a saved run and exit with status 1 on a regression")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"battles/s drop counted as a regression (default: {DEFAULT_TOLERANCE * 100:.0f}%%)")
+    args = parser.parse_args()
+
+    def show_result(name, result):
+        memory = result['peak_memory_mb']
+        memory_text = f"  peak {memory:.0f} MB" if memory is not None else ""
+        print(f"{name:<66}{result['battles_per_second']:>11.0f} battles/s"
+              f"{result['turns_per_second']:>12.0f} turns/s{memory_text}")
+
+    report = run_benchmarks(args.kind, args.scale, args.workers, show_result)
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    path = os.path.join(args.results_dir, f"simulation_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.tolerance)
+        print(f"\nCompared with {args.baseline}:")
+        for name, baseline_rate, rate, change, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<66}{baseline_rate:>11.0f} -> {rate:>9.0f} battles/s ({change:+.1%}){flag}")
+        regressions = sum(1 for row in rows if row[4])
+        print(f"{regressions} regression(s) beyond {args.tolerance:.0%}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
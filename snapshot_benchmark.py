@@ -0,0 +1,129 @@
+import argparse
+import sys
+import time
+from battle_engine import BattleEngine
+from campaign_engine import CampaignEngine, create_campaign_character
+from characters import create_character
+from game_random import GameRandom
+
+DEFAULT_CYCLES = 1_000_000
+BENCHMARK_SEED = 1
+BENCHMARK_TURNS = 8  # Turns played before measuring, so the boss has stacks and the player has moved
+
+
+# ===== ENGINES =====
+def create_battle_engine():
+    """Create a single-player battle a few turns in, with poison stacks on the boss"""
+    character = create_character('Huntsman')
+    character.set_yellow_effect('poison_5', 'poison.png')
+    character.num_yellow_tiles = 4
+    engine = BattleEngine(character, rng=GameRandom(BENCHMARK_SEED))
+    engine.place_random_yellow_tiles()
+    for _ in range(BENCHMARK_TURNS):
+        engine.play_turn(engine.rng.randrange(len(engine.dice_options)))
+    return engine
+
+
+def create_campaign_engine():
+    """Create a campaign battle a few turns in"""
+    character_1 = create_campaign_character('Lapper', ['mid', 'high', 'risk'])
+    character_2 = create_campaign_character('Huntsman', ['even', 'odd', 'low'])
+    engine = CampaignEngine(character_1, character_2, rng=GameRandom(BENCHMARK_SEED))
+    engine.place_random_yellow_tiles()
+    for _ in range(BENCHMARK_TURNS):
+        engine.play_turn(0, engine.rng.randrange(3), engine.rng.randrange(3))
+    return engine
+
+
+def get_snapshot_size(snapshot):
+    """Get the bytes of the tuples and byte strings a snapshot allocates (its ints and strings are shared)"""
+    if isinstance(snapshot, tuple):
+        return sys.getsizeof(snapshot) + sum(get_snapshot_size(item) for item in snapshot)
+    if isinstance(snapshot, bytes):
+        return sys.getsizeof(snapshot)
+    return 0
+
+
+# ===== CASES =====
+def snapshot_restore(engine, cycles):
+    """Take a snapshot and restore it, cycles times"""
+    snapshot = engine.snapshot
+    restore = engine.restore
+    for _ in range(cycles):
+        restore(snapshot())
+    return cycles
+
+
+def lookahead(engine, cycles):
+    """
+    Try every face of every dice from the same state, rolling back after each
+
+    Every try is one snapshot, a whole turn played with that face and a
+    restore - what a one-turn search does for each child of a node.
+
+    Returns:
+        Number of tries made (cycles rounded up to whole passes over the faces)
+    """
+    outcomes = [(dice_index, value) for dice_index, faces in enumerate(engine.dice_options) for value in set(faces)]
+    passes = -(-cycles // len(outcomes))
+    for _ in range(passes):
+        for dice_index, value in outcomes:
+            snapshot = engine.snapshot()
+            engine.play_turn(dice_index, value)
+            engine.restore(snapshot)
+    return passes * len(outcomes)
+
+
+# Name -> (engine factory, function running the cycles and returning how many it ran)
+CASES = {
+    'engine': (create_battle_engine, snapshot_restore),
+    'campaign': (create_campaign_engine, snapshot_restore),
+    'lookahead': (create_battle_engine, lookahead)
+}
+
+
+# ===== MEASUREMENT =====
+def measure(name, cycles=DEFAULT_CYCLES):
+    """
+    Time one case
+
+    Returns:
+        Dictionary with cycles run, seconds, cycles per second and minute, and the snapshot size in bytes
+    """
+    create_engine, run = CASES[name]
+    engine = create_engine()
+    before = engine.snapshot()
+    size = get_snapshot_size(before)
+
+    start = time.perf_counter()
+    cycles = run(engine, cycles)
+    seconds = time.perf_counter() - start
+
+    if engine.snapshot() != before:
+        raise ValueError(f"{name}: the engine was not restored to the state it started in")
+    rate = cycles / seconds if seconds > 0 else 0.0
+    return {
+        'cycles': cycles,
+        'seconds': seconds,
+        'cycles_per_second': rate,
+        'cycles_per_minute': rate * 60,
+        'snapshot_bytes': size
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure battle state snapshot/restore cycles per minute")
+    parser.add_argument('--cycles', type=int, default=DEFAULT_CYCLES, help="cycles per case")
+    parser.add_argument('--case', action='append', choices=list(CASES),
+                        help="case to run (repeat for several, all if omitted)")
+    args = parser.parse_args()
+
+    for name in args.case or CASES:
+        result = measure(name, args.cycles)
+        print(f"{name:<12}{result['cycles_per_minute'] / 1e6:>9.1f}M cycles/min"
+              f"{result['seconds'] / result['cycles'] * 1e6:>9.2f} us/cycle"
+              f"  snapshot {result['snapshot_bytes']} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,664 @@
+import numpy as np
+from battle_engine import (BOARD_SIZE, DEBUFF_DAMAGE, GREEN_TILE_HEAL, BOSS_MAX_HP, BOSS_INITIAL_DAMAGE,
+                           BOSS_DAMAGE_INCREMENT, POISON_STACKS_APPLIED, BURN_STACKS_APPLIED, BURN_DAMAGE_PER_STACK,
+                           CHAIN_LIGHTNING_INITIAL_DAMAGE, CHAIN_LIGHTNING_DOT_DAMAGE, CHAIN_LIGHTNING_TURNS)
+from board import TILE_GREEN, TILE_RED, TILE_YELLOW, Board
+from landing_table import get_landing_table, landing_tile, laps_crossed
+from state_key import (ATTACK_COUNT_SHIFT, BOSS_HP_SHIFT, BURN_SHIFT, CHAIN_SHIFT, DEBUFF_SHIFT, LAPS_SHIFT,
+                       LIFESTEAL_SHIFT, PLAYER_HP_SHIFT, POISON_SHIFT, YELLOW_BUFF_SHIFT, pack_state, unpack_state,
+                       unpack_states)
+from transposition_table import DEFAULT_MAX_ENTRIES, TranspositionTable
+
+# Successor ids used for finished battles (below every state id, compare with ==).
+# As NumPy indices they pick the last two entries of the value arrays, which hold their values.
+WIN = -1
+LOSS = -2
+
+# Each state takes about 150 bytes and 2 microseconds while solving, so a battle gives up within seconds.
+# Standard boards with poison or burning strike reach 5-20 million states and need a larger max_states.
+DEFAULT_MAX_STATES = 3_000_000
+
+# Win probabilities closer than this count as a tie between dice
+_TIE_EPSILON = 1e-12
+_CONVERGENCE_EPSILON = 1e-12
+
+# Laps beyond this are never reached before the boss dies
+_MAX_LAPS_CHECKED = 64
+
+# Largest boss HP a state key holds
+_MAX_BOSS_HP = 511
+
+# Every state whose damage over time kills the boss at the start of the next turn plays the same,
+# so they are all stored as this one (poison 1 against 1 HP)
+_CERTAIN_WIN = (1, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0)
+
+# search() keys its transposition table on the state key and the depth left below 2 ** _DEPTH_BITS
+_DEPTH_BITS = 8
+
+
+def _unique(keys):
+    """Sorted distinct values of an int64 array (np.unique without its hash table, which is slower here)"""
+    keys = np.sort(keys)
+    return keys[np.concatenate(([True], keys[1:] != keys[:-1]))] if len(keys) else keys
+
+
+def state_from_engine(engine):
+    """
+    Get the solver state of a BattleEngine that is waiting for a roll
+
+    Returns:
+        State tuple (position, player_hp, boss_hp, debuff_stacks, boss_poison_stacks,
+        boss_burn_stacks, chain_lightning_stacks, yellow_buff_active, lifesteal_active,
+        boss_attack_count, laps_completed)
+    """
+    player = engine.player
+    boss = engine.boss
+    return (player.position, player.current_hp, boss.current_hp, player.debuff_stacks, boss.poison_stacks,
+            boss.burn_stacks, boss.chain_lightning_stacks, int(player.yellow_buff_active), int(player.lifesteal_active),
+            boss.attack_count, player.laps_completed)
+
+
+class SolverResult:
+    def __init__(self, solver, root):
+        """
+        Exact values of a solved battle
+
+        Args:
+            solver: The BattleSolver that produced the result
+            root: State id the battle was solved from
+        """
+        self._solver = solver
+        self.win_probability = float(solver.win_probability[root])
+        # Expected number of turns until the boss dies, given that the player wins
+        expected_win_turns = float(solver.expected_win_turns[root])
+        self.expected_turns = expected_win_turns / self.win_probability if self.win_probability > 0 else None
+        self.num_states = solver.num_states
+
+    def best_dice(self, state):
+        """
+        Optimal dice index for a state reached from the solved start state
+
+        Args:
+            state: State tuple as returned by state_from_engine
+
+        Returns:
+            Dice index (0-2), or None if the state was never reached
+        """
+        solver = self._solver
+        state_id = solver.find(pack_state(solver.compress(state)))
+        return None if state_id is None else int(solver.policy[state_id])
+
+    def win_probability_of(self, state):
+        """Exact win probability from a state reached from the solved start state (None if never reached)"""
+        solver = self._solver
+        state_id = solver.find(pack_state(solver.compress(state)))
+        return None if state_id is None else float(solver.win_probability[state_id])
+
+
+class BattleSolver:
+    def __init__(self, character, green_tiles, red_tiles, yellow_tiles, max_states=DEFAULT_MAX_STATES,
+                 board_size=BOARD_SIZE, table_size=DEFAULT_MAX_ENTRIES, eviction='lru'):
+        """
+        Exact solver for a single-player battle on a fixed board
+
+        The battle is a finite Markov decision process over the state tuples
+        returned by state_from_engine. Boss HP never goes up, so reachable
+        states are explored from the highest boss HP down, one group of
+        states with the same boss HP at a time, and solved from the lowest
+        boss HP up: every state only moves to solved groups or its own, and
+        loops inside a group (e.g. bouncing between green tiles) are solved
+        by value iteration. States are stored as pack_state integer keys and
+        each group is expanded and solved with NumPy.
+
+        compress() stores states that play the same under one key: damage
+        over time that kills the boss next turn, boss attacks that kill the
+        player from full HP, and laps past the point where lap damage stops
+        changing or always kills the boss, and boss attack counts once the
+        next normal tile kills the boss before it can attack.
+
+        solve() raises RuntimeError once more than max_states states are
+        reachable, rather than running out of memory or time.
+
+        Args:
+            character: Character instance with dice_sets, dice_damage and yellow effect set
+            green_tiles: List of green tile numbers
+            red_tiles: List of red tile numbers
+            yellow_tiles: List of yellow tile numbers
+            max_states: Give up once more states than this are reachable
+            board_size: Number of tiles on the board
+            table_size: Most search() results kept in the transposition table
+            eviction: Transposition table eviction policy (see transposition_table.EVICTION_POLICIES)
+        """
+        self.character = character
+        self.max_states = max_states
+
+        # Tile types indexed by tile number
+        self.board = Board(board_size, green_tiles, red_tiles, yellow_tiles, character.yellow_tile_effect())
+        self.tile_types = self.board.tile_types
+
+        # Each dice as its distinct faces with their probabilities, and where each face lands
+        self.landing_table = get_landing_table(character.dice_sets, board_size)
+        self.dice_faces = self.landing_table.faces
+        self.dice_probs = self.landing_table.probabilities
+
+        self.yellow_bonus = character.get_yellow_tile_damage()
+        self.yellow_effect = character.yellow_tile_effect()
+        self._num_successors = sum(len(faces) for faces in self.dice_faces)
+
+        # Boss attacks past attack_cap already deal the player's max HP
+        self.attack_cap = max(0, -(-(character.max_hp - BOSS_INITIAL_DAMAGE) // BOSS_DAMAGE_INCREMENT))
+        # Once the boss has this little HP left, the next normal tile kills it before it can attack
+        self.least_damage = min(character.dice_damage)
+        self._certain_win_key = pack_state(_CERTAIN_WIN)
+
+        # Laps past lap_cap all deal the same damage, and laps past finish_laps[boss_hp] all kill the boss
+        lap_damages = [character.get_lap_damage(lap) for lap in range(1, _MAX_LAPS_CHECKED + 1)]
+        self.lap_cap = next(cap for cap in range(_MAX_LAPS_CHECKED) if len(set(lap_damages[cap:])) == 1)
+        least_damage_after = [min(lap_damages[laps:]) for laps in range(self.lap_cap + 1)]
+        self.finish_laps = [next((laps for laps, damage in enumerate(least_damage_after) if damage >= boss_hp),
+                                 self.lap_cap) for boss_hp in range(_MAX_BOSS_HP + 1)]
+
+        # Solved values, indexed by state id (the last two entries are the values of WIN and LOSS)
+        self.states = np.zeros(0, dtype=np.int64)  # State keys
+        self.win_probability = np.zeros(2)
+        self.expected_win_turns = np.zeros(2)
+        self.policy = np.zeros(0, dtype=np.uint8)
+        self._successors = np.zeros((0, self._num_successors), dtype=np.int32)
+        self._groups = {}  # Boss HP -> (sorted state keys, their state ids)
+
+        # search() results, keyed on the state key and the depth left
+        self.table = TranspositionTable(table_size, eviction)
+
+    @property
+    def num_states(self):
+        """Number of states reached by the last solve()"""
+        return len(self.states)
+
+    def initial_state(self):
+        """State at the first roll of a battle"""
+        return 1, self.character.max_hp, BOSS_MAX_HP, 0, 0, 0, 0, 0, 0, 0, 0
+
+    def compress(self, state):
+        """Replace state details that can't change the outcome, so states that play the same share a key"""
+        (position, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks,
+         yellow_buff, lifesteal, attack_count, laps) = state
+        next_damage = (poison_stacks + burn_stacks * BURN_DAMAGE_PER_STACK
+                       + (CHAIN_LIGHTNING_DOT_DAMAGE if chain_stacks else 0))
+        if next_damage >= boss_hp:
+            return _CERTAIN_WIN
+        if boss_hp - next_damage <= self.least_damage:
+            # The boss never attacks again, and lifesteal only heals on the hit that kills it
+            attack_count = lifesteal = 0
+        return (position, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks,
+                yellow_buff, lifesteal, min(attack_count, self.attack_cap),
+                min(laps, self.finish_laps[min(boss_hp, _MAX_BOSS_HP)]))
+
+    def find(self, key):
+        """Get the id of a state key reached by the last solve() (None if it wasn't)"""
+        group = self._groups.get(key >> BOSS_HP_SHIFT & _MAX_BOSS_HP)
+        if group is None:
+            return None
+        keys, state_ids = group
+        index = int(np.searchsorted(keys, key))
+        return int(state_ids[index]) if index < len(keys) and keys[index] == key else None
+
+    def advance(self, state, value, damage):
+        """
+        Play one turn from a state with a rolled dice value
+
+        Args:
+            state: State tuple at the start of the turn
+            value: Rolled dice value
+            damage: Damage of the rolled dice
+
+        Returns:
+            Next state tuple (compressed), or WIN / LOSS if the battle is over
+        """
+        started = self._start_turn(state)
+        position = started[0]
+        moves = value * 2 if started[7] else value
+        board_size = self.board.size
+        return self._move_and_land(started, landing_tile(position, moves, board_size),
+                                   laps_crossed(position, moves, board_size), damage)
+
+    def _start_turn(self, state):
+        """Apply start-of-turn effects, which don't depend on the dice that is rolled"""
+        (position, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks,
+         yellow_buff, lifesteal, attack_count, laps) = state
+
+        player_hp -= DEBUFF_DAMAGE * debuff_stacks
+        if poison_stacks:
+            boss_hp -= poison_stacks
+            poison_stacks -= 1
+        boss_hp -= burn_stacks * BURN_DAMAGE_PER_STACK
+        if chain_stacks:
+            boss_hp -= CHAIN_LIGHTNING_DOT_DAMAGE
+            chain_stacks -= 1
+
+        return (position, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks,
+                yellow_buff, lifesteal, attack_count, laps)
+
+    def _move_and_land(self, state, position, crossed, damage):
+        """
+        Move to a landing tile and apply it
+
+        Args:
+            state: State tuple after start-of-turn effects
+            position: Landing tile from the landing table
+            crossed: Laps completed on the way there
+            damage: Damage of the rolled dice
+
+        Returns:
+            Next state tuple (compressed), or WIN / LOSS if the battle is over
+        """
+        (_, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks,
+         _, lifesteal, attack_count, laps) = state
+        character = self.character
+        yellow_buff = 0
+
+        # Lap damage for every pass over the last tile
+        for _ in range(crossed):
+            laps += 1
+            boss_hp -= character.get_lap_damage(laps)
+
+        # Landing effects
+        tile_type = self.tile_types[position]
+        if tile_type == TILE_GREEN:
+            player_hp = min(character.max_hp, player_hp + GREEN_TILE_HEAL)
+            debuff_stacks = 0
+        elif tile_type == TILE_RED:
+            debuff_stacks += 1
+        elif tile_type == TILE_YELLOW:
+            boss_hp -= self.yellow_bonus
+            effect = self.yellow_effect
+            if effect == "double_movement":
+                yellow_buff = 1
+            elif effect == "poison_5":
+                poison_stacks += POISON_STACKS_APPLIED
+                boss_hp -= poison_stacks
+            elif effect == "burning_strike":
+                burn_stacks += BURN_STACKS_APPLIED
+            elif effect == "lifesteal":
+                lifesteal = 1
+            elif effect == "chain_lightning":
+                boss_hp -= CHAIN_LIGHTNING_INITIAL_DAMAGE
+                chain_stacks = CHAIN_LIGHTNING_TURNS
+        else:
+            boss_hp -= damage
+            if lifesteal:
+                player_hp = min(character.max_hp, player_hp + damage)
+                lifesteal = 0
+            player_hp -= BOSS_INITIAL_DAMAGE + attack_count * BOSS_DAMAGE_INCREMENT
+            attack_count += 1
+
+        if boss_hp <= 0:
+            return WIN
+        if player_hp <= 0:
+            return LOSS
+        return self.compress((position, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks,
+                              yellow_buff, lifesteal, attack_count, laps))
+
+    # ===== SOLVE =====
+    def _build_tables(self):
+        """Lay out every dice face as a column, so a group of states is expanded with array operations"""
+        landing_table = self.landing_table
+        board_size = self.board.size
+        slots = [(dice_index, face_index) for dice_index, faces in enumerate(self.dice_faces)
+                 for face_index in range(len(faces))]
+
+        # Landing tile, tile type and laps crossed of every column, indexed [doubled * (board_size + 1) + position]
+        self._slot_tiles = np.zeros((2 * (board_size + 1), len(slots)), dtype=np.int64)
+        self._slot_crossed = np.zeros((2 * (board_size + 1), len(slots)), dtype=np.int64)
+        for column, (dice_index, face_index) in enumerate(slots):
+            for doubled in (0, 1):
+                for position in range(1, board_size + 1):
+                    tile, crossed, _ = landing_table.outcomes(dice_index, position, doubled)[face_index]
+                    self._slot_tiles[doubled * (board_size + 1) + position, column] = tile
+                    self._slot_crossed[doubled * (board_size + 1) + position, column] = crossed
+        self._slot_types = np.array(self.tile_types, dtype=np.int64)[self._slot_tiles]
+        self._slot_damage = np.array([self.character.dice_damage[dice_index] for dice_index, _ in slots])
+
+        # Probability of each column for each dice, so a matrix product sums a dice's faces
+        self._slot_probs = np.zeros((len(slots), len(self.dice_faces)))
+        for column, (dice_index, face_index) in enumerate(slots):
+            self._slot_probs[column, dice_index] = self.dice_probs[dice_index][face_index]
+
+        # Total lap damage after each number of laps (laps are stored up to lap_cap)
+        max_laps = self.lap_cap + int(self._slot_crossed.max())
+        self._lap_damage_total = np.zeros(max_laps + 1, dtype=np.int64)
+        for lap in range(1, max_laps + 1):
+            self._lap_damage_total[lap] = self._lap_damage_total[lap - 1] + self.character.get_lap_damage(lap)
+        self._finish_laps = np.array(self.finish_laps, dtype=np.int64)
+
+    def _expand(self, keys):
+        """
+        Get the successors of many states at once, like _start_turn and _move_and_land for every dice face
+
+        Successor keys are built by adding each field's change to the key,
+        then compressed like compress().
+
+        Args:
+            keys: int64 array of state keys
+
+        Returns:
+            int64 array shaped (states, dice faces) of successor keys, or WIN / LOSS
+        """
+        (position, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks,
+         yellow_buff, lifesteal, attack_count, laps) = unpack_states(keys)
+        max_hp = self.character.max_hp
+        effect = self.yellow_effect
+        if (debuff_stacks.max() >= 63 or poison_stacks.max() + POISON_STACKS_APPLIED >= 128
+                or burn_stacks.max() + BURN_STACKS_APPLIED >= 128):
+            raise ValueError("States don't fit in state keys")
+
+        # Start of the turn
+        player_hp = player_hp - DEBUFF_DAMAGE * debuff_stacks
+        boss_hp = (boss_hp - poison_stacks - BURN_DAMAGE_PER_STACK * burn_stacks
+                   - CHAIN_LIGHTNING_DOT_DAMAGE * (chain_stacks > 0))
+        poison_stacks = poison_stacks - (poison_stacks > 0)
+        chain_stacks = chain_stacks - (chain_stacks > 0)
+        # Fields that only change on some tiles, as they are at the start of the turn
+        unchanged = (debuff_stacks << DEBUFF_SHIFT | poison_stacks << POISON_SHIFT | burn_stacks << BURN_SHIFT
+                     | chain_stacks << CHAIN_SHIFT | lifesteal << LIFESTEAL_SHIFT | attack_count << ATTACK_COUNT_SHIFT
+                     | laps << LAPS_SHIFT)
+        column = lambda values: values[:, None]  # noqa: E731
+        poison_stacks, burn_stacks, chain_stacks = column(poison_stacks), column(burn_stacks), column(chain_stacks)
+        lifesteal = column(lifesteal)
+
+        # Every dice face at once, shaped (states, faces)
+        row = yellow_buff * (self.board.size + 1) + position
+        tile = self._slot_tiles[row]
+        tile_type = self._slot_types[row]
+        green = tile_type == TILE_GREEN
+        red = tile_type == TILE_RED
+        yellow = tile_type == TILE_YELLOW
+        normal = ~(green | red | yellow)
+        player_hp = player_hp[:, None]
+        boss_hp = boss_hp[:, None]
+
+        # Green heals and clears the debuff, red adds a stack
+        player_hp = np.where(green, np.minimum(max_hp, player_hp + GREEN_TILE_HEAL), player_hp)
+        key = unchanged[:, None] + tile + red * (1 << DEBUFF_SHIFT) - green * column(debuff_stacks << DEBUFF_SHIFT)
+
+        # Yellow tiles
+        boss_hp = boss_hp - yellow * self.yellow_bonus
+        if effect == "double_movement":
+            key += yellow * (1 << YELLOW_BUFF_SHIFT)
+        elif effect == "poison_5":
+            poison_stacks = poison_stacks + yellow * POISON_STACKS_APPLIED
+            boss_hp = boss_hp - yellow * poison_stacks
+            key += yellow * (POISON_STACKS_APPLIED << POISON_SHIFT)
+        elif effect == "burning_strike":
+            burn_stacks = burn_stacks + yellow * BURN_STACKS_APPLIED
+            key += yellow * (BURN_STACKS_APPLIED << BURN_SHIFT)
+        elif effect == "lifesteal":
+            key += yellow * (1 - lifesteal << LIFESTEAL_SHIFT)
+            lifesteal = lifesteal | yellow
+        elif effect == "chain_lightning":
+            boss_hp = boss_hp - yellow * CHAIN_LIGHTNING_INITIAL_DAMAGE
+            key += yellow * (CHAIN_LIGHTNING_TURNS - chain_stacks << CHAIN_SHIFT)
+            chain_stacks = np.where(yellow, CHAIN_LIGHTNING_TURNS, chain_stacks)
+
+        # Normal tiles: dice damage (healing with lifesteal), then the boss attacks
+        damage = self._slot_damage
+        boss_hp = boss_hp - normal * damage
+        if np.any(lifesteal):
+            healed = normal & (lifesteal == 1)
+            player_hp = np.where(healed, np.minimum(max_hp, player_hp + damage), player_hp)
+            key -= healed * (1 << LIFESTEAL_SHIFT)
+        player_hp = player_hp - normal * column(BOSS_INITIAL_DAMAGE + attack_count * BOSS_DAMAGE_INCREMENT)
+        key += normal * column((attack_count < self.attack_cap).astype(np.int64) << ATTACK_COUNT_SHIFT)
+
+        # Lap damage for every pass over the last tile
+        if self._lap_damage_total.any():
+            lap_damage_total = self._lap_damage_total
+            new_laps = column(laps) + self._slot_crossed[row]
+            boss_hp = boss_hp - (lap_damage_total[new_laps] - column(lap_damage_total[laps]))
+            new_laps = np.minimum(new_laps, self._finish_laps[np.clip(boss_hp, 0, _MAX_BOSS_HP)])
+            key += new_laps - column(laps) << LAPS_SHIFT
+
+        # Compressed like compress()
+        next_damage = (poison_stacks + BURN_DAMAGE_PER_STACK * burn_stacks
+                       + CHAIN_LIGHTNING_DOT_DAMAGE * (chain_stacks > 0))
+        unattacked = boss_hp - next_damage <= self.least_damage
+        if np.any(unattacked):
+            fields = unpack_states(key[unattacked])
+            key[unattacked] -= fields[9] << ATTACK_COUNT_SHIFT | fields[8] << LIFESTEAL_SHIFT
+        key += player_hp << PLAYER_HP_SHIFT | boss_hp << BOSS_HP_SHIFT
+
+        won = boss_hp <= 0
+        lost = player_hp <= 0
+        key = np.where(next_damage >= boss_hp, self._certain_win_key, key)
+        return np.where(won, WIN, np.where(lost, LOSS, key))
+
+    def _explore(self, root_key):
+        """
+        Find every state reachable from a state key and the ids of their successors
+
+        Groups of states with the same boss HP are expanded from the
+        highest boss HP down. Successor keys wait until their group is
+        complete, then are resolved to state ids by searching that group's
+        sorted keys.
+
+        Returns:
+            List of (first state id, end state id) of every group, in the order they were explored
+        """
+        self._build_tables()
+        num_successors = self._num_successors
+        successors = np.zeros((1024, num_successors), dtype=np.int32)
+        state_keys = []
+        group_ranges = []
+        self._groups = {}
+        pending = {}  # Boss HP -> list of (successor keys, flat indices into successors) waiting for their group
+        num_states = 0
+
+        root_boss_hp = root_key >> BOSS_HP_SHIFT & _MAX_BOSS_HP
+        for boss_hp in range(root_boss_hp, 0, -1):
+            refs = pending.pop(boss_hp, [])
+            if boss_hp == root_boss_hp:
+                batch = np.array([root_key], dtype=np.int64)
+            elif refs:
+                batch = _unique(np.concatenate([keys for keys, _ in refs]))
+            else:
+                continue
+
+            # Expand the group, adding states that stay at this boss HP until there are no new ones
+            group_start = num_states
+            group_keys = []
+            seen = batch
+            while len(batch):
+                first = num_states
+                num_states += len(batch)
+                if num_states > self.max_states:
+                    raise RuntimeError(f"Battle has more than {self.max_states} reachable states")
+                if num_states > len(successors):
+                    grown = np.zeros((max(num_states, 2 * len(successors)), num_successors), dtype=np.int32)
+                    grown[:first] = successors[:first]
+                    successors = grown
+                group_keys.append(batch)
+
+                next_keys = self._expand(batch).ravel()
+                flat_index = np.arange(first * num_successors, num_states * num_successors)
+                finished = next_keys < 0
+                successors.ravel()[flat_index[finished]] = next_keys[finished]
+
+                # Queue the rest for their group, sorted by boss HP
+                next_keys = next_keys[~finished]
+                flat_index = flat_index[~finished]
+                next_boss_hp = (next_keys >> BOSS_HP_SHIFT & _MAX_BOSS_HP).astype(np.int16)
+                order = np.argsort(next_boss_hp, kind='stable')  # A radix sort for int16
+                next_keys = next_keys[order]
+                flat_index = flat_index[order]
+                next_boss_hp = next_boss_hp[order]
+                starts = np.flatnonzero(np.diff(next_boss_hp)) + 1
+                starts = [0] + starts.tolist() if len(next_keys) else []
+                ends = starts[1:] + [len(next_keys)]
+                batch = batch[:0]
+                for start, end in zip(starts, ends):
+                    value = int(next_boss_hp[start])
+                    ref = (next_keys[start:end], flat_index[start:end])
+                    if value == boss_hp:
+                        refs.append(ref)
+                        batch = _unique(ref[0])
+                        batch = batch[~np.isin(batch, seen, assume_unique=True)]
+                        seen = np.concatenate((seen, batch))
+                    else:
+                        pending.setdefault(value, []).append(ref)
+
+            # The group is complete - resolve every successor key that leads into it
+            keys = np.concatenate(group_keys)
+            order = np.argsort(keys)
+            sorted_keys = keys[order]
+            sorted_ids = (group_start + order).astype(np.int32)
+            self._groups[boss_hp] = (sorted_keys, sorted_ids)
+            flat_successors = successors.ravel()
+            for ref_keys, indices in refs:
+                flat_successors[indices] = sorted_ids[np.searchsorted(sorted_keys, ref_keys)]
+            state_keys.extend(group_keys)
+            group_ranges.append((group_start, num_states))
+
+        self.states = np.concatenate(state_keys)
+        self._successors = successors[:num_states]
+        return group_ranges
+
+    def _update(self, state_ids):
+        """
+        Recompute the values of states from their successors
+
+        Returns:
+            Largest change of the states' values
+        """
+        if not len(state_ids):
+            return 0.0
+        win_probability = self.win_probability
+        expected_win_turns = self.expected_win_turns
+        next_ids = self._successors[state_ids]
+        next_win = win_probability[next_ids]
+        wins = next_win @ self._slot_probs
+        turns = (next_win + expected_win_turns[next_ids]) @ self._slot_probs
+
+        # Prefer the higher win chance, then the faster win
+        best_win = wins[:, 0]
+        best_turns = turns[:, 0]
+        best_dice = np.zeros(len(state_ids), dtype=np.uint8)
+        for dice_index in range(1, wins.shape[1]):
+            win = wins[:, dice_index]
+            better = ((win > best_win + _TIE_EPSILON)
+                      | ((win > best_win - _TIE_EPSILON) & (turns[:, dice_index] < best_turns)))
+            best_win = np.where(better, win, best_win)
+            best_turns = np.where(better, turns[:, dice_index], best_turns)
+            best_dice[better] = dice_index
+
+        change = max(float(np.abs(best_win - win_probability[state_ids]).max()),
+                     float(np.abs(best_turns - expected_win_turns[state_ids]).max()))
+        win_probability[state_ids] = best_win
+        expected_win_turns[state_ids] = best_turns
+        self.policy[state_ids] = best_dice
+        return change
+
+    def solve(self, state=None):
+        """
+        Solve the battle from a state
+
+        Solving from a state the last call reached returns at once; any
+        other state is explored and solved from scratch.
+
+        Args:
+            state: State tuple to solve from (start of the battle if None)
+
+        Returns:
+            SolverResult with the win probability and expected turns under optimal play
+        """
+        root_key = pack_state(self.compress(state or self.initial_state()))
+        root = self.find(root_key)
+        if root is not None:
+            return SolverResult(self, root)
+
+        group_ranges = self._explore(root_key)
+        num_states = len(self.states)
+        self.win_probability = np.zeros(num_states + 2)
+        self.expected_win_turns = np.zeros(num_states + 2)
+        self.win_probability[WIN] = 1.0
+        self.policy = np.zeros(num_states, dtype=np.uint8)
+
+        # Lowest boss HP first, so every successor outside a group is already solved
+        for start, end in reversed(group_ranges):
+            group = self._successors[start:end]
+            looping = ((group >= start) & (group < end)).any(axis=1)
+            self._update(np.flatnonzero(~looping) + start)
+            # States that can stay in the group - iterate until the values settle
+            loop_ids = np.flatnonzero(looping) + start
+            while self._update(loop_ids) > _CONVERGENCE_EPSILON:
+                pass
+        return SolverResult(self, self.find(root_key))
+
+    # ===== SEARCH =====
+    def search(self, state, depth):
+        """
+        Look a few turns ahead for the dice most likely to win within them
+
+        Expectimax over every face of every dice. Results are kept in the
+        transposition table, so states reached by several roll orders (and
+        by later calls) are only searched once. Much cheaper than solve()
+        early in a battle, but blind to anything after depth turns.
+
+        Args:
+            state: State tuple as returned by state_from_engine
+            depth: Turns to look ahead (1-255)
+
+        Returns:
+            (probability of winning within depth turns under the best play, best dice index)
+        """
+        if not 0 < depth < 1 << _DEPTH_BITS:
+            raise ValueError(f"depth must be 1-{(1 << _DEPTH_BITS) - 1}, got {depth}")
+        return self._search(pack_state(self.compress(state)), depth)
+
+    def _search(self, key, depth):
+        """Get (win probability within depth turns, best dice) of a state key, searching if it isn't in the table"""
+        table_key = key << _DEPTH_BITS | depth
+        entry = self.table.get(table_key)
+        if entry is not None:
+            return entry
+
+        started = self._start_turn(unpack_state(key))
+        outcomes = self.landing_table.outcomes
+        position = started[0]
+        doubled = started[7]
+        best_win = -1.0
+        best_dice = 0
+        for dice_index, damage in enumerate(self.character.dice_damage):
+            win = 0.0
+            for tile, crossed, prob in outcomes(dice_index, position, doubled):
+                next_state = self._move_and_land(started, tile, crossed, damage)
+                if next_state == WIN:
+                    win += prob
+                elif next_state != LOSS and depth > 1:
+                    win += prob * self._search(pack_state(next_state), depth - 1)[0]
+            if win > best_win + _TIE_EPSILON:
+                best_win, best_dice = win, dice_index
+
+        entry = (best_win, best_dice)
+        self.table.store(table_key, entry)
+        return entry
+
+
+def solve_battle(character, green_tiles, red_tiles, yellow_tiles, max_states=DEFAULT_MAX_STATES,
+                 board_size=BOARD_SIZE):
+    """
+    Compute the exact win probability of a battle under the optimal dice choice
+
+    Raises RuntimeError if more than max_states states are reachable, which the default
+    max_states keeps to a few seconds of work.
+
+    Args:
+        character: Character instance with dice_sets, dice_damage and yellow effect set
+        green_tiles: List of green tile numbers
+        red_tiles: List of red tile numbers
+        yellow_tiles: List of yellow tile numbers
+        max_states: Give up once more states than this are reachable
+        board_size: Number of tiles on the board
+
+    Returns:
+        SolverResult with win_probability and expected_turns (turns to kill the boss when winning)
+    """
+    return BattleSolver(character, green_tiles, red_tiles, yellow_tiles, max_states, board_size).solve()
@@ -1,4 +1,6 @@
 import pygame
+from hit_test import SpatialHash
+from text_cache import render_text
 
 
 class StartMenu:
@@ -30,6 +32,10 @@ class StartMenu:
         campaign_button_y = start_button_y + button_height + 30
         self.campaign_button = pygame.Rect(button_x, campaign_button_y, button_width, button_height)
 
+        self.hit_test = SpatialHash()
+        self.hit_test.add(self.start_button, 'start')
+        self.hit_test.add(self.campaign_button, 'campaign')
+
     def handle_click(self, mouse_pos):
         """
         Check if start button or campaign button was clicked
@@ -42,11 +48,7 @@ class StartMenu:
             'campaign' if campaign button clicked
             None if neither clicked
         """
-        if self.start_button.collidepoint(mouse_pos):
-            return 'start'
-        elif self.campaign_button.collidepoint(mouse_pos):
-            return 'campaign'
-        return None
+        return self.hit_test.hit(mouse_pos)
 
     def draw(self, screen):
         """
@@ -58,20 +60,20 @@ class StartMenu:
         screen.fill(self.colors['WHITE'])
 
         # Draw title
-        title = self.fonts['large'].render("Monopoly Dice Game", True, self.colors['BLACK'])
+        title = render_text(self.fonts['large'], "Monopoly Dice Game", True, self.colors['BLACK'])
         title_rect = title.get_rect(center=(self.screen_width // 2, 150))
         screen.blit(title, title_rect)
 
         # Draw Start Game button
         pygame.draw.rect(screen, self.colors['BLUE'], self.start_button, border_radius=10)
         pygame.draw.rect(screen, self.colors['BLACK'], self.start_button, 3, border_radius=10)
-        start_text = self.fonts['medium'].render("Start Game", True, self.colors['WHITE'])
+        start_text = render_text(self.fonts['medium'], "Start Game", True, self.colors['WHITE'])
         start_text_rect = start_text.get_rect(center=self.start_button.center)
         screen.blit(start_text, start_text_rect)
 
         # Draw Campaign Test button
         pygame.draw.rect(screen, self.colors['PURPLE'], self.campaign_button, border_radius=10)
         pygame.draw.rect(screen, self.colors['BLACK'], self.campaign_button, 3, border_radius=10)
-        campaign_text = self.fonts['medium'].render("Campaign (Test)", True, self.colors['WHITE'])
+        campaign_text = render_text(self.fonts['medium'], "Campaign (Test)", True, self.colors['WHITE'])
         campaign_text_rect = campaign_text.get_rect(center=self.campaign_button.center)
         screen.blit(campaign_text, campaign_text_rect)
\ No newline at end of file
@@ -0,0 +1,86 @@
+import numpy as np
+
+# Solver state tuples (see solver.state_from_engine) packed into one non-negative integer below 2 ** 63,
+# so millions of states fit in NumPy int64 arrays instead of tuples.
+#
+# Bit layout, lowest bits first:
+#   position                6 bits  tile 1-63
+#   player_hp               8 bits  0-255, enough for every character's max HP
+#   boss_hp                 9 bits  0-511, BOSS_MAX_HP is 350
+#   debuff_stacks           6 bits  the player dies long before 63 stacks
+#   boss_poison_stacks      7 bits
+#   boss_burn_stacks        7 bits
+#   chain_lightning_stacks  2 bits
+#   yellow_buff_active      1 bit
+#   lifesteal_active        1 bit
+#   boss_attack_count       8 bits  boss damage passes any max HP long before 255 attacks
+#   laps_completed          8 bits
+PLAYER_HP_SHIFT = 6
+BOSS_HP_SHIFT = 14
+DEBUFF_SHIFT = 23
+POISON_SHIFT = 29
+BURN_SHIFT = 36
+CHAIN_SHIFT = 43
+YELLOW_BUFF_SHIFT = 45
+LIFESTEAL_SHIFT = 46
+ATTACK_COUNT_SHIFT = 47
+LAPS_SHIFT = 55
+STATE_KEY_BITS = 63
+
+
+def pack_state(state):
+    """
+    Pack a solver state tuple into an integer key
+
+    Raises ValueError if a field is negative or too large for its bits.
+
+    Args:
+        state: State tuple (position, player_hp, boss_hp, debuff_stacks, boss_poison_stacks,
+               boss_burn_stacks, chain_lightning_stacks, yellow_buff_active, lifesteal_active,
+               boss_attack_count, laps_completed)
+
+    Returns:
+        Integer key below 2 ** STATE_KEY_BITS
+    """
+    (position, player_hp, boss_hp, debuff_stacks, poison_stacks, burn_stacks, chain_stacks, yellow_buff,
+     lifesteal, attack_count, laps) = state
+    # Any bits above a field's width (or a negative field, which shifts to -1) mean it doesn't fit
+    if (position >> 6 | player_hp >> 8 | boss_hp >> 9 | debuff_stacks >> 6 | poison_stacks >> 7 | burn_stacks >> 7
+            | chain_stacks >> 2 | yellow_buff >> 1 | lifesteal >> 1 | attack_count >> 8 | laps >> 8):
+        raise ValueError(f"State {state} doesn't fit in a state key")
+    return (position | player_hp << PLAYER_HP_SHIFT | boss_hp << BOSS_HP_SHIFT | debuff_stacks << DEBUFF_SHIFT
+            | poison_stacks << POISON_SHIFT | burn_stacks << BURN_SHIFT | chain_stacks << CHAIN_SHIFT
+            | yellow_buff << YELLOW_BUFF_SHIFT | lifesteal << LIFESTEAL_SHIFT | attack_count << ATTACK_COUNT_SHIFT
+            | laps << LAPS_SHIFT)
+
+
+def unpack_state(key):
+    """
+    Unpack an integer key into the state tuple it was packed from
+
+    Args:
+        key: Integer from pack_state
+
+    Returns:
+        State tuple in pack_state order
+    """
+    return (key & 63, key >> PLAYER_HP_SHIFT & 255, key >> BOSS_HP_SHIFT & 511, key >> DEBUFF_SHIFT & 63,
+            key >> POISON_SHIFT & 127, key >> BURN_SHIFT & 127, key >> CHAIN_SHIFT & 3, key >> YELLOW_BUFF_SHIFT & 1,
+            key >> LIFESTEAL_SHIFT & 1, key >> ATTACK_COUNT_SHIFT & 255, key >> LAPS_SHIFT & 255)
+
+
+def unpack_states(keys):
+    """
+    Unpack an array of integer keys into state columns, like unpack_state for every key
+
+    Args:
+        keys: int64 array of keys from pack_state
+
+    Returns:
+        Tuple of 11 int64 arrays in pack_state order
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    return (keys & 63, keys >> PLAYER_HP_SHIFT & 255, keys >> BOSS_HP_SHIFT & 511, keys >> DEBUFF_SHIFT & 63,
+            keys >> POISON_SHIFT & 127, keys >> BURN_SHIFT & 127, keys >> CHAIN_SHIFT & 3,
+            keys >> YELLOW_BUFF_SHIFT & 1, keys >> LIFESTEAL_SHIFT & 1, keys >> ATTACK_COUNT_SHIFT & 255,
+            keys >> LAPS_SHIFT & 255)
@@ -0,0 +1,73 @@
+import json
+import os
+
+from analysis_cache import AnalysisCache, simulate_board, solve_board
+from board import Board
+from characters import YELLOW_TILE_OPTIONS, create_character
+
+# (board size, green, red, yellow tiles) of a small board
+SMALL_BOARD = (8, [3], [1, 5, 6, 8], [2, 4, 7])
+
+
+def even_dice_character():
+    """Huntsman rolling only the all-even dice, so a token starting on tile 1 only lands on odd tiles"""
+    option = next(option for option in YELLOW_TILE_OPTIONS if option['effect'] == 'poison_5')
+    character = create_character('Huntsman')
+    character.set_yellow_effect(option['effect'], option['icon'])
+    character.dice_sets = [[2, 4, 6]]
+    character.dice_damage = character.dice_damage[:1]
+    return character
+
+
+def test_fingerprint_ignores_yellow_placement_order():
+    first = Board(24, [5, 9], [2, 14], [7, 3, 20], 'lifesteal')
+    second = Board(24, [5, 9], [2, 14], [20, 7, 3], 'lifesteal')
+    assert first.yellow_tiles != second.yellow_tiles
+    assert first.fingerprint() == second.fingerprint()
+
+
+def test_fingerprint_merges_unreachable_tiles():
+    character = even_dice_character()
+    # Tiles 2, 4 and 10 are even, so these boards only differ where the dice never land
+    boards = [([5, 4], [2, 13, 17], [7, 21]), ([5, 10], [13, 17], [7, 21])]
+    fingerprints = [Board(24, green, red, yellow, 'poison_5').fingerprint(character.dice_sets)
+                    for green, red, yellow in boards]
+    assert fingerprints[0] == fingerprints[1]
+    assert Board(24, *boards[0]).fingerprint() != Board(24, *boards[1]).fingerprint()
+
+    results = [simulate_board(character, green, red, yellow, 2000, seed=4) for green, red, yellow in boards]
+    assert results[0] == results[1]
+
+
+def test_stored_result_survives_reload(tmp_path):
+    AnalysisCache(tmp_path).store('solve', '..G.R', {'battles': 10}, {'win_probability': 0.5})
+
+    cache = AnalysisCache(tmp_path)
+    assert cache.get('solve', '..G.R', {'battles': 10}) == {'win_probability': 0.5}
+    assert cache.get('solve', '..G.R', {'battles': 20}) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_file_with_another_key_is_a_miss(tmp_path):
+    cache = AnalysisCache(tmp_path)
+    cache.store('solve', '..G.R', {}, {'win_probability': 0.5})
+    # Pretend another key hashed to the same file name
+    [name] = os.listdir(tmp_path)
+    path = os.path.join(tmp_path, name)
+    with open(path) as f:
+        entry = json.load(f)
+    entry['key'] = entry['key'].replace('..G.R', '..R.G')
+    with open(path, 'w') as f:
+        json.dump(entry, f)
+
+    assert cache.get('solve', '..G.R', {}) is None
+    assert cache.misses == 1
+
+
+def test_solve_board_gives_up_past_max_states():
+    board_size, green_tiles, red_tiles, yellow_tiles = SMALL_BOARD
+    character = create_character('Huntsman')
+    assert solve_board(character, green_tiles, red_tiles, yellow_tiles, max_states=100, board_size=board_size) is None
+
+    result = solve_board(character, green_tiles, red_tiles, yellow_tiles, board_size=board_size)
+    assert 0.0 < result['win_probability'] <= 1.0
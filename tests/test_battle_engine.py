@@ -0,0 +1,64 @@
+from battle_engine import BattleEngine
+from characters import create_character
+from game_random import GameRandom
+
+
+def empty_battle(character_name):
+    """Battle on a board without green, red or yellow tiles, ready to roll"""
+    engine = BattleEngine(create_character(character_name), [], [], [], rng=GameRandom(0))
+    engine.turn.battle_phase = "rolling"
+    return engine
+
+
+def test_same_seed_plays_the_same_battle():
+    results = []
+    for _ in range(2):
+        engine = BattleEngine(create_character('Lapper'), rng=GameRandom(42))
+        winner = engine.play_battle()
+        results.append((winner, engine.turn.turns_taken, engine.player.current_hp, engine.boss.current_hp,
+                        engine.board.pack()))
+    assert results[0] == results[1]
+    assert results[0][0] in ('player', 'boss')
+
+
+def test_seeded_policy_battles_repeat():
+    def last_dice(engine):
+        return len(engine.dice_options) - 1
+
+    winners = []
+    for seed in range(5):
+        engine = BattleEngine(create_character('Huntsman'), rng=GameRandom(seed))
+        winners.append((engine.play_battle(last_dice), engine.turn.turns_taken))
+        engine = BattleEngine(create_character('Huntsman'), rng=GameRandom(seed))
+        assert (engine.play_battle(last_dice), engine.turn.turns_taken) == winners[-1]
+
+
+def test_hit_that_empties_boss_hp_wins():
+    engine = empty_battle('Lapper')
+    engine.boss.current_hp = engine.character.dice_damage[0]
+    engine.play_turn(0, 3)
+    assert engine.player.position == 4
+    assert engine.winner == 'player'
+
+
+def test_boss_attack_that_empties_player_hp_loses():
+    engine = empty_battle('Lapper')
+    engine.player.current_hp = 10
+    engine.play_turn(0, 3)
+    assert engine.boss.current_hp > 0
+    assert engine.winner == 'boss'
+
+
+def test_boss_dying_counts_before_player_dying():
+    engine = empty_battle('Lapper')
+    engine.boss.current_hp = 1
+    engine.player.current_hp = 1
+    engine.play_turn(0, 3)
+    assert engine.winner == 'player'
+
+
+def test_turn_limit_stops_undecided_battle():
+    engine = empty_battle('Huntsman')
+    assert engine.play_battle(max_turns=3) is None
+    assert engine.turn.turns_taken == 3
+    assert not engine.is_over()
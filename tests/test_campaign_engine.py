@@ -0,0 +1,81 @@
+from campaign_engine import CampaignEngine, simulate_campaign_battles
+from characters import create_character
+from game_random import GameRandom
+
+
+def empty_campaign():
+    """Lapper and Huntsman on a board without green, red or yellow tiles, ready to roll"""
+    engine = CampaignEngine(create_character('Lapper'), create_character('Huntsman'), [], [], [], rng=GameRandom(0))
+    engine.turn.battle_phase = "rolling"
+    return engine
+
+
+def test_other_character_moves_second_and_takes_the_boss_attack():
+    engine = empty_campaign()
+    first, second = engine.character_states[1], engine.character_states[0]
+    assert engine.can_roll(0) and engine.can_roll(1)
+
+    assert engine.roll(1, 0, 3) == 3
+    assert engine.turn.turn_phase == "character_1_second"
+    assert engine.roll(1, 0, 3) is None  # Can't move twice in a turn
+
+    engine.roll(0, 0, 3)
+    assert engine.turn.turn_phase == "boss_attack"
+    assert engine.last_character_to_move is second
+
+    engine.resolve_turn()
+    assert engine.turn.turn_phase == "choose_first"
+    assert engine.turn.turns_taken == 1
+    # Both landed on normal tiles (boss damage 10, then 11), then the boss attacked the second mover (12)
+    assert first.current_hp == first.max_hp - 10
+    assert second.current_hp == second.max_hp - 11 - 12
+
+
+def test_first_mover_is_chosen_every_turn():
+    engine = empty_campaign()
+    engine.play_turn(0, 0, 0)
+    assert engine.last_character_to_move is engine.character_states[1]
+    engine.play_turn(1, 0, 0)
+    assert engine.last_character_to_move is engine.character_states[0]
+
+
+def test_dead_partner_is_skipped():
+    engine = empty_campaign()
+    dead = engine.character_states[1]
+    dead.current_hp = 0
+    assert not engine.can_roll(1)
+
+    # The survivor moves alone and takes the boss attack
+    engine.roll(0, 0, 3)
+    assert engine.turn.turn_phase == "boss_attack"
+    assert engine.last_character_to_move is engine.character_states[0]
+    engine.resolve_turn()
+    assert engine.turn.turn_phase == "choose_first"
+
+    # play_turn ignores the dead character's dice
+    engine.play_turn(0, 0, 0)
+    assert dead.position == 1
+    assert engine.turn.turns_taken == 2
+    assert engine.winner is None
+
+
+def test_random_battles_never_move_a_dead_partner():
+    engine = empty_campaign()
+    dead = engine.character_states[0]
+    dead.current_hp = 0
+    engine.play_battle(max_turns=50)
+    assert engine.turn.turns_taken > 0
+    assert dead.position == 1
+
+
+def test_battle_is_lost_once_both_characters_die():
+    engine = empty_campaign()
+    engine.character_states[1].current_hp = 0
+    engine.character_states[0].current_hp = 15
+    engine.play_turn(0, 0, 0)
+    assert engine.winner == "boss"
+
+
+def test_seeded_campaigns_repeat():
+    team = [('Lapper', ['mid', 'high', 'risk']), ('Huntsman', ['even', 'odd', 'low'])]
+    assert simulate_campaign_battles(team, 20, seed=4) == simulate_campaign_battles(team, 20, seed=4)
@@ -0,0 +1,70 @@
+import pytest
+
+from battle_engine import BattleEngine
+from characters import create_character
+from game_random import GameRandom
+from landing_table import LandingTable, get_landing_table, landing_tile, laps_crossed
+
+
+@pytest.mark.parametrize('position, moves, tile, laps', [
+    (1, 3, 4, 0),
+    (1, -2, 23, 0),     # Backwards past tile 1 wraps without a lap
+    (2, -2, 24, 0),
+    (24, -4, 20, 0),
+    (23, 5, 4, 1),      # Forwards past the last tile completes a lap
+    (24, 1, 1, 1),
+    (20, 4, 24, 0),     # Landing on the last tile isn't a lap yet
+    (24, 48, 24, 2),
+    (5, 0, 5, 0),
+])
+def test_landing_tile_and_laps(position, moves, tile, laps):
+    assert landing_tile(position, moves, 24) == tile
+    assert laps_crossed(position, moves, 24) == laps
+
+
+def test_negative_face_outcomes():
+    table = LandingTable([[-2, -2, 8, 8]], 24)
+    assert table.faces == [(-2, 8)]
+    assert table.outcomes(0, 1) == ((23, 0, 0.5), (9, 0, 0.5))
+    # Double movement doubles backwards moves too
+    assert table.outcomes(0, 2, doubled=True) == ((22, 0, 0.5), (18, 0, 0.5))
+    assert table.outcomes(0, 20, doubled=True) == ((16, 0, 0.5), (12, 1, 0.5))
+
+
+def test_faces_landing_on_the_same_tile_merge():
+    table = LandingTable([[1, 5, 5, 9]], 4)
+    assert table.tile_probabilities(0, 1) == {2: 1.0}
+    assert [laps for _, laps, _ in table.outcomes(0, 1)] == [0, 1, 2]
+    assert sum(probability for _, _, probability in table.outcomes(0, 1)) == pytest.approx(1.0)
+
+
+def test_most_likely_tiles_come_first():
+    table = LandingTable([[3, 3, 3, 4]], 24, ["Heavy"])
+    assert list(table.tiles(0, 1)) == [4, 5]
+    assert table.describe(0, 1) == "Heavy: 75% tile 4, 25% tile 5"
+
+
+@pytest.mark.parametrize('character_name', ['Lapper', 'Huntsman'])
+def test_table_matches_engine_stepping_tile_by_tile(character_name):
+    character = create_character(character_name)
+    table = get_landing_table(character.dice_sets, 24)
+    engine = BattleEngine(character, [], [], [], rng=GameRandom(0))
+    engine.turn.battle_phase = "rolling"
+
+    for dice_index, faces in enumerate(table.faces):
+        for doubled in (False, True):
+            for position in range(1, 25):
+                for face, (tile, laps, _) in zip(faces, table.outcomes(dice_index, position, doubled)):
+                    engine.player.position = position
+                    engine.player.yellow_buff_active = doubled
+                    engine.player.laps_completed = 0
+                    engine.roll(dice_index, face)
+                    while engine.step():
+                        pass
+                    assert (engine.player.position, engine.player.laps_completed) == (tile, laps)
+
+
+def test_tables_are_shared_per_loadout():
+    dice_sets = [[1, 2, 3], [4, 5, 6]]
+    assert get_landing_table(dice_sets, 24) is get_landing_table([list(values) for values in dice_sets], 24)
+    assert get_landing_table(dice_sets, 24) is not get_landing_table(dice_sets, 12)
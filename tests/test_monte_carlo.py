@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+import pytest
+
+from battle_engine import BattleEngine
+from board import generate_board
+from characters import YELLOW_TILE_OPTIONS, create_character
+from game_random import GameRandom
+from monte_carlo import simulate_battles
+
+NUM_ENGINE_BATTLES = 4000
+NUM_SIMULATED_BATTLES = 200_000
+# Allowed difference in standard errors - a correct simulator fails about once in 15,000 runs
+TOLERANCE = 4
+
+
+def fixed_board_character(character_name, effect):
+    """Character with a yellow effect, and the fixed green, red and yellow tiles it plays on"""
+    option = next(option for option in YELLOW_TILE_OPTIONS if option['effect'] == effect)
+    character = create_character(character_name)
+    character.set_yellow_effect(effect, option['icon'])
+    board = generate_board(5, 8, 24, rng=GameRandom(1))
+    return character, board.green_tiles, board.red_tiles, board.empty_tiles()[:character.num_yellow_tiles]
+
+
+@pytest.mark.parametrize('character_name', ['Lapper', 'Huntsman'])
+@pytest.mark.parametrize('effect', [option['effect'] for option in YELLOW_TILE_OPTIONS])
+def test_simulator_agrees_with_engine(character_name, effect):
+    character, green_tiles, red_tiles, yellow_tiles = fixed_board_character(character_name, effect)
+
+    rng = GameRandom(7)
+    wins = []
+    turns = []
+    for _ in range(NUM_ENGINE_BATTLES):
+        engine = BattleEngine(character, green_tiles, red_tiles, yellow_tiles, rng=rng.spawn())
+        wins.append(engine.play_battle() == 'player')
+        turns.append(engine.turn.turns_taken)
+    wins = np.array(wins)
+    turns = np.array(turns)
+
+    results = simulate_battles(character, NUM_SIMULATED_BATTLES, green_tiles=green_tiles, red_tiles=red_tiles,
+                               yellow_tiles=yellow_tiles, seed=3)
+
+    win_rate = wins.mean()
+    win_error = math.sqrt(win_rate * (1 - win_rate) * (1 / NUM_ENGINE_BATTLES + 1 / NUM_SIMULATED_BATTLES))
+    assert abs(results.win_rate() - win_rate) <= TOLERANCE * max(win_error, 1 / NUM_ENGINE_BATTLES)
+
+    turns_error = turns.std() * math.sqrt(1 / NUM_ENGINE_BATTLES + 1 / NUM_SIMULATED_BATTLES)
+    assert abs(results.mean_turns() - turns.mean()) <= TOLERANCE * turns_error
+
+
+def test_same_seed_simulates_the_same_battles():
+    character, green_tiles, red_tiles, yellow_tiles = fixed_board_character('Huntsman', 'poison_5')
+    first = simulate_battles(character, 1000, green_tiles=green_tiles, red_tiles=red_tiles,
+                             yellow_tiles=yellow_tiles, seed=11)
+    second = simulate_battles(character, 1000, green_tiles=green_tiles, red_tiles=red_tiles,
+                              yellow_tiles=yellow_tiles, seed=11)
+    assert np.array_equal(first.wins, second.wins)
+    assert np.array_equal(first.losses, second.losses)
+    assert np.array_equal(first.turns, second.turns)
+
+
+def test_results_count_every_battle_once():
+    character, green_tiles, red_tiles, yellow_tiles = fixed_board_character('Lapper', 'double_movement')
+    results = simulate_battles(character, 500, green_tiles=green_tiles, red_tiles=red_tiles,
+                               yellow_tiles=yellow_tiles, seed=5, max_turns=10)
+    assert not np.any(results.wins & results.losses)
+    assert results.turns.max() <= 10
+    assert results.turn_distribution().sum() == 500
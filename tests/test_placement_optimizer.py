@@ -0,0 +1,68 @@
+import math
+import time
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from board import generate_board
+from characters import YELLOW_TILE_OPTIONS, create_character
+from game_random import GameRandom
+from placement_optimizer import TurnLandingTable, _search_additive, optimize_placement
+
+# Long enough that a small search always finishes
+GENEROUS_DEADLINE = 60
+
+
+def character_with_effect(character_name, effect):
+    option = next(option for option in YELLOW_TILE_OPTIONS if option['effect'] == effect)
+    character = create_character(character_name)
+    character.set_yellow_effect(effect, option['icon'])
+    return character
+
+
+def test_additive_search_matches_brute_force():
+    rng = GameRandom(7)
+    gains = {tile: rng.uniform(-5.0, 20.0) for tile in range(1, 13)}
+    ranked, scored, complete = _search_additive(gains, 3, 5, time.perf_counter() + GENEROUS_DEADLINE)
+
+    brute_force = sorted(((sum(gains[tile] for tile in tiles), tiles) for tiles in combinations(sorted(gains), 3)),
+                         reverse=True)[:5]
+    assert complete
+    assert 5 <= scored <= math.comb(12, 3)
+    assert [tiles for _, tiles in ranked] == [tiles for _, tiles in brute_force]
+    assert [gain for gain, _ in ranked] == pytest.approx([gain for gain, _ in brute_force])
+
+
+@pytest.mark.parametrize('dice_weights', [None, [0.6, 0.3, 0.1]])
+def test_landing_chances_sum_to_one_every_turn(dice_weights):
+    character = create_character('Lapper')
+    table = TurnLandingTable(character, [4, 15], 12, dice_weights)
+    assert np.allclose(table.landing.sum(axis=1), 1.0)
+    assert not table.landing[:, 0].any()
+
+
+@pytest.mark.parametrize('character_name, effect', [('Huntsman', 'poison_5'), ('Lapper', 'double_movement')])
+def test_placements_only_use_empty_tiles(character_name, effect):
+    character = character_with_effect(character_name, effect)
+    board = generate_board(5, 8, 24, rng=GameRandom(3))
+    board.place_yellow(board.empty_tiles()[0], effect)
+    empty_tiles = set(board.empty_tiles())
+
+    result = optimize_placement(character, board, 2, time_budget=GENEROUS_DEADLINE)
+    assert result['complete']
+    assert len(result['placements']) == 5
+    for placement in result['placements']:
+        assert len(set(placement['tiles'])) == 2
+        assert empty_tiles.issuperset(placement['tiles'])
+
+
+@pytest.mark.parametrize('character_name, effect', [('Huntsman', 'poison_5'), ('Lapper', 'double_movement')])
+def test_zero_time_budget_still_returns_a_placement(character_name, effect):
+    character = character_with_effect(character_name, effect)
+    board = generate_board(5, 8, 24, rng=GameRandom(3))
+
+    result = optimize_placement(character, board, 2, time_budget=0)
+    assert not result['complete']
+    assert len(result['placements']) == 1
+    assert set(board.empty_tiles()).issuperset(result['placements'][0]['tiles'])
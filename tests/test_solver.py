@@ -0,0 +1,110 @@
+import math
+import time
+
+import numpy as np
+import pytest
+
+from battle_engine import NUM_GREEN_TILES, NUM_RED_TILES, BattleEngine
+from board import BOARD_SIZE, generate_board
+from characters import YELLOW_TILE_OPTIONS, create_character
+from game_random import GameRandom
+from solver import BattleSolver, solve_battle, state_from_engine
+
+NUM_BATTLES = 4000
+# Allowed difference in standard errors
+TOLERANCE = 4
+
+# Small boards that solve in well under a second: (character, board size, green, red, yellow tiles)
+SMALL_BOARDS = [
+    ('Huntsman', 8, [3], [1, 5, 6, 8], [2, 4, 7]),
+    ('Lapper', 12, [3, 10], [1, 6, 8, 12], [2]),
+]
+
+# Seconds a standard board may take to solve (they take 1-3 seconds)
+STANDARD_BOARD_TIME_LIMIT = 10
+
+
+def small_board_character(character_name, yellow_tiles):
+    """Character placing exactly the given yellow tiles (so play_battle doesn't add random ones)"""
+    character = create_character(character_name)
+    character.num_yellow_tiles = len(yellow_tiles)
+    return character
+
+
+@pytest.mark.parametrize('character_name, board_size, green_tiles, red_tiles, yellow_tiles', SMALL_BOARDS)
+def test_solution_matches_engine_playing_its_policy(character_name, board_size, green_tiles, red_tiles,
+                                                    yellow_tiles):
+    character = small_board_character(character_name, yellow_tiles)
+    solved = solve_battle(character, green_tiles, red_tiles, yellow_tiles, board_size=board_size)
+
+    def best_dice(engine):
+        return solved.best_dice(state_from_engine(engine))
+
+    rng = GameRandom(3)
+    wins = []
+    win_turns = []
+    for _ in range(NUM_BATTLES):
+        engine = BattleEngine(character, green_tiles, red_tiles, yellow_tiles, board_size, rng.spawn())
+        won = engine.play_battle(best_dice) == 'player'
+        wins.append(won)
+        if won:
+            win_turns.append(engine.turn.turns_taken)
+    win_turns = np.array(win_turns)
+
+    p = solved.win_probability
+    win_error = math.sqrt(p * (1 - p) / NUM_BATTLES)
+    assert abs(np.mean(wins) - p) <= TOLERANCE * max(win_error, 1 / NUM_BATTLES)
+    turns_error = win_turns.std() / math.sqrt(len(win_turns))
+    assert abs(win_turns.mean() - solved.expected_turns) <= TOLERANCE * turns_error
+
+
+def test_optimal_play_beats_random_dice():
+    character_name, board_size, green_tiles, red_tiles, yellow_tiles = SMALL_BOARDS[0]
+    character = small_board_character(character_name, yellow_tiles)
+    solved = solve_battle(character, green_tiles, red_tiles, yellow_tiles, board_size=board_size)
+
+    rng = GameRandom(5)
+    wins = 0
+    for _ in range(NUM_BATTLES):
+        engine = BattleEngine(character, green_tiles, red_tiles, yellow_tiles, board_size, rng.spawn())
+        wins += engine.play_battle() == 'player'
+    assert wins / NUM_BATTLES < solved.win_probability - 0.1
+
+
+def test_reached_states_have_values_and_dice():
+    character_name, board_size, green_tiles, red_tiles, yellow_tiles = SMALL_BOARDS[0]
+    character = small_board_character(character_name, yellow_tiles)
+    solver = BattleSolver(character, green_tiles, red_tiles, yellow_tiles, board_size=board_size)
+    solved = solver.solve()
+
+    engine = BattleEngine(character, green_tiles, red_tiles, yellow_tiles, board_size, GameRandom(1))
+    while not engine.is_over():
+        state = state_from_engine(engine)
+        dice_index = solved.best_dice(state)
+        assert dice_index in range(len(character.dice_sets))
+        assert 0.0 <= solved.win_probability_of(state) <= 1.0
+        engine.play_turn(dice_index)
+
+    # Solving again from the start reuses the solution
+    assert solver.solve().win_probability == solved.win_probability
+
+
+@pytest.mark.parametrize('character_name, effect', [('Lapper', 'double_movement'), ('Huntsman', 'chain_lightning')])
+def test_standard_board_solves_in_seconds(character_name, effect):
+    option = next(option for option in YELLOW_TILE_OPTIONS if option['effect'] == effect)
+    character = create_character(character_name)
+    character.set_yellow_effect(effect, option['icon'])
+    board = generate_board(NUM_GREEN_TILES, NUM_RED_TILES, BOARD_SIZE, rng=GameRandom(2))
+    yellow_tiles = board.empty_tiles()[:option['num_tiles']]
+
+    start = time.perf_counter()
+    solved = solve_battle(character, board.green_tiles, board.red_tiles, yellow_tiles)
+    assert time.perf_counter() - start < STANDARD_BOARD_TIME_LIMIT
+    assert 0.0 < solved.win_probability <= 1.0
+
+
+def test_too_many_states_raises():
+    character_name, board_size, green_tiles, red_tiles, yellow_tiles = SMALL_BOARDS[0]
+    character = small_board_character(character_name, yellow_tiles)
+    with pytest.raises(RuntimeError):
+        solve_battle(character, green_tiles, red_tiles, yellow_tiles, max_states=100, board_size=board_size)
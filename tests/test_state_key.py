@@ -0,0 +1,53 @@
+import random
+
+import numpy as np
+import pytest
+
+from state_key import STATE_KEY_BITS, pack_state, unpack_state, unpack_states
+
+# Largest value of every field, in pack_state order
+FIELD_MAXIMUMS = (63, 255, 511, 63, 127, 127, 3, 1, 1, 255, 255)
+
+
+def random_states(count, seed=0):
+    rng = random.Random(seed)
+    return [tuple(rng.randint(0, maximum) for maximum in FIELD_MAXIMUMS) for _ in range(count)]
+
+
+def test_round_trip():
+    for state in random_states(1000) + [(0,) * 11, FIELD_MAXIMUMS]:
+        key = pack_state(state)
+        assert 0 <= key < 2 ** STATE_KEY_BITS
+        assert unpack_state(key) == state
+
+
+def test_distinct_states_get_distinct_keys():
+    states = set(random_states(5000, seed=1))
+    assert len({pack_state(state) for state in states}) == len(states)
+
+
+def test_solver_start_state_round_trips():
+    state = (1, 100, 350, 0, 0, 0, 0, 0, 0, 0, 0)
+    assert unpack_state(pack_state(state)) == state
+
+
+@pytest.mark.parametrize('field', range(len(FIELD_MAXIMUMS)))
+def test_field_too_large_raises(field):
+    state = [0] * len(FIELD_MAXIMUMS)
+    state[field] = FIELD_MAXIMUMS[field] + 1
+    with pytest.raises(ValueError):
+        pack_state(tuple(state))
+
+
+@pytest.mark.parametrize('field', range(len(FIELD_MAXIMUMS)))
+def test_negative_field_raises(field):
+    state = [0] * len(FIELD_MAXIMUMS)
+    state[field] = -1
+    with pytest.raises(ValueError):
+        pack_state(tuple(state))
+
+
+def test_unpack_states_matches_unpack_state():
+    states = random_states(200, seed=2)
+    columns = unpack_states(np.array([pack_state(state) for state in states], dtype=np.int64))
+    assert [tuple(int(column[row]) for column in columns) for row in range(len(states))] == states
@@ -0,0 +1,76 @@
+import pytest
+
+from transposition_table import TranspositionTable
+
+
+def test_lru_evicts_least_recently_used():
+    table = TranspositionTable(2, 'lru')
+    table.store(1, 'a')
+    table.store(2, 'b')
+    assert table.get(1) == 'a'  # 2 is now the least recently used
+    table.store(3, 'c')
+    assert 2 not in table
+    assert 1 in table and 3 in table
+    assert table.evictions == 1
+
+
+def test_fifo_ignores_reads():
+    table = TranspositionTable(2, 'fifo')
+    table.store(1, 'a')
+    table.store(2, 'b')
+    assert table.get(1) == 'a'
+    table.store(3, 'c')
+    assert 1 not in table
+    assert 2 in table and 3 in table
+    assert table.evictions == 1
+
+
+def test_clear_policy_empties_the_table():
+    table = TranspositionTable(3, 'clear')
+    for key in range(3):
+        table.store(key, key)
+    table.store(3, 3)
+    assert len(table) == 1
+    assert 3 in table
+    assert table.evictions == 3
+
+
+def test_storing_a_stored_key_replaces_it_without_evicting():
+    table = TranspositionTable(2, 'fifo')
+    table.store(1, 'a')
+    table.store(2, 'b')
+    table.store(1, 'c')
+    assert len(table) == 2
+    assert table.get(1) == 'c'
+    assert table.evictions == 0
+
+
+def test_hit_rate_counts_lookups():
+    table = TranspositionTable(10)
+    assert table.hit_rate == 0.0
+    table.store(1, None)  # A stored None is a hit, not a miss
+    assert table.get(1, 'missing') is None
+    assert table.get(2) is None
+    assert table.get(1) is None
+    assert (table.hits, table.misses) == (2, 1)
+    assert table.hit_rate == pytest.approx(2 / 3)
+    assert table.stats() == {'entries': 1, 'max_entries': 10, 'eviction': 'lru', 'hits': 2, 'misses': 1,
+                             'evictions': 0, 'hit_rate': pytest.approx(2 / 3)}
+
+
+def test_clear_resets_entries_and_counters():
+    table = TranspositionTable(1)
+    table.store(1, 'a')
+    table.store(2, 'b')
+    table.get(2)
+    table.get(3)
+    table.clear()
+    assert len(table) == 0
+    assert (table.hits, table.misses, table.evictions) == (0, 0, 0)
+
+
+def test_bad_settings_raise():
+    with pytest.raises(ValueError):
+        TranspositionTable(10, 'random')
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+# Rendered strings kept by the shared cache (a battle frame uses about 60)
+DEFAULT_MAX_SIZE = 512
+
+
+class TextCache:
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Bounded least-recently-used cache of rendered text surfaces
+
+        Almost every string on screen is the same from one frame to the next,
+        so each (font, text, color, antialias) is rendered once and its surface
+        reused. Callers must only blit the returned surfaces, never draw on them.
+
+        Args:
+            max_size: Number of surfaces to keep before evicting the least recently used
+        """
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """
+        Get the surface for a string, rendering it only the first time
+
+        Args:
+            font: pygame Font to render with
+            text: String to render
+            antialias: Passed to Font.render
+            color: Text color
+
+        Returns:
+            Rendered text surface (shared - don't modify it)
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        """Get the hit/miss counters for profiling"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._surfaces),
+            'max_size': self.max_size,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def reset_stats(self):
+        """Zero the hit/miss counters without dropping cached surfaces"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        """Drop every cached surface (e.g., after changing fonts)"""
+        self._surfaces.clear()
+
+
+# Shared by the battle renderer and every selection screen
+text_cache = TextCache()
+
+
+def render_text(font, text, antialias, color):
+    """Render text through the shared cache, same arguments as Font.render"""
+    return text_cache.render(font, text, antialias, color)
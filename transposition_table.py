@@ -0,0 +1,114 @@
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# What store() does when the table is full:
+#   'lru'   - drop the entry that was stored or read least recently
+#   'fifo'  - drop the entry that was stored first, reads don't count
+#   'clear' - empty the whole table (cheapest per store, loses everything at once)
+EVICTION_POLICIES = ('lru', 'fifo', 'clear')
+
+
+class TranspositionTable:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, eviction='lru'):
+        """
+        Bounded cache of search results keyed on integer state keys
+
+        Counts hits, misses and evictions so the table size and eviction
+        policy can be tuned for a search.
+
+        Args:
+            max_entries: Most entries kept at once
+            eviction: One of EVICTION_POLICIES
+        """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction} (expected one of {', '.join(EVICTION_POLICIES)})")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.max_entries = max_entries
+        self.eviction = eviction
+        self.entries = OrderedDict()  # Oldest first, so the next entry to evict is at the front
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key, default=None):
+        """
+        Look up a key, counting a hit or a miss
+
+        Args:
+            key: Integer state key
+            default: Returned if the key isn't stored
+
+        Returns:
+            Stored value, or default
+        """
+        value = self.entries.get(key, default)
+        if value is default and key not in self.entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.eviction == 'lru':
+            self.entries.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        """
+        Store a value, evicting by the table's policy if it is full
+
+        Args:
+            key: Integer state key
+            value: Value to store (replaces an earlier value for the key)
+        """
+        entries = self.entries
+        if key in entries:
+            entries[key] = value
+            if self.eviction == 'lru':
+                entries.move_to_end(key)
+            return
+
+        if len(entries) >= self.max_entries:
+            if self.eviction == 'clear':
+                self.evictions += len(entries)
+                entries.clear()
+            else:
+                entries.popitem(last=False)
+                self.evictions += 1
+        entries[key] = value
+
+    def clear(self):
+        """Remove every entry and reset the statistics"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups that found their key (0 before the first lookup)"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Get the table's statistics
+
+        Returns:
+            Dictionary with entries, max_entries, eviction, hits, misses, evictions and hit_rate
+        """
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'eviction': self.eviction,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate
+        }
@@ -1,8 +1,3 @@
-import pygame
-
-# Initialize pygame to create fonts
-pygame.init()
-
 # ===== COLORS =====
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -22,18 +17,47 @@ YELLOW = (255, 255, 0)
 DARK_YELLOW = (200, 200, 0)
 
 # ===== FONTS =====
-FONT_LARGE = pygame.font.Font(None, 60)
-FONT_SMALL = pygame.font.Font(None, 24)
-FONT_MEDIUM = pygame.font.Font(None, 36)
-FONT_TINY = pygame.font.Font(None, 18)
+FONT_SIZES = {
+    'large': 60,
+    'medium': 36,
+    'small': 24,
+    'tiny': 18
+}
+
+
+class FontDictionary(dict):
+    def __init__(self, sizes):
+        """
+        Font dictionary that creates each font the first time it is used
+
+        Importing this module doesn't import or start pygame, so it can be
+        shared with code that never draws. pygame's font module is started on
+        the first lookup if the game hasn't done it yet.
+
+        Args:
+            sizes: Dictionary of font name -> point size of the default font
+        """
+        super().__init__()
+        self.sizes = sizes
+
+    def __missing__(self, name):
+        import pygame
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(None, self.sizes[name])
+        self[name] = font
+        return font
+
 
 # ===== FONT DICTIONARY =====
-fonts = {
-    'large': FONT_LARGE,
-    'medium': FONT_MEDIUM,
-    'small': FONT_SMALL,
-    'tiny': FONT_TINY
-}
+fonts = FontDictionary(FONT_SIZES)
+
+
+def __getattr__(name):
+    """Keep FONT_LARGE, FONT_MEDIUM, FONT_SMALL and FONT_TINY working, created on first use"""
+    if name.startswith('FONT_') and name[5:].lower() in FONT_SIZES:
+        return fonts[name[5:].lower()]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ===== COLOR DICTIONARY =====
 colors = {